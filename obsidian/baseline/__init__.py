@@ -12,6 +12,8 @@ COMPONENTS:
     - TickerBaseline: Complete baseline profile for a ticker
     - BaselineCalculator: Computes baselines from historical data
     - BaselineStorage: Persists baselines to disk
+    - FeatureHistoryStorage: Daily feature snapshots (JSON per day, or
+      ParquetFeatureHistoryStorage with one file per ticker)
 
 USAGE:
     from obsidian.baseline import BaselineCalculator, BaselineStorage
@@ -30,18 +32,41 @@ USAGE:
         raise ValueError("Cannot process SPY without baseline!")
 """
 
+import importlib
+
 from obsidian.baseline.types import (
     BaselineUpdatePolicy,
     DarkPoolBaseline,
     DistributionStats,
     DynamicState,
+    DynamicStateTable,
     GreeksBaseline,
     PriceEfficiencyBaseline,
     TickerBaseline,
 )
-from obsidian.baseline.calculator import BaselineCalculator, compute_distribution_stats
-from obsidian.baseline.storage import BaselineStorage, format_baseline_report
-from obsidian.baseline.history import FeatureHistoryStorage
+from obsidian.baseline.storage import (
+    BaselineStorage,
+    TickerBaselineTable,
+    format_baseline_report,
+)
+from obsidian.baseline.history import FeatureHistoryStorage, ParquetFeatureHistoryStorage
+
+# The calculator needs pandas; import it on first use so storage-only
+# tools don't pay for it
+_LAZY_ATTRS = {
+    "BaselineCalculator": "obsidian.baseline.calculator",
+    "compute_distribution_stats": "obsidian.baseline.calculator",
+}
+
+
+def __getattr__(name: str):
+    """Resolve lazily imported attributes (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -53,12 +78,15 @@ __all__ = [
     "PriceEfficiencyBaseline",
     "TickerBaseline",
     "DynamicState",
+    "DynamicStateTable",
     # Calculator
     "BaselineCalculator",
     "compute_distribution_stats",
     # Storage
     "BaselineStorage",
+    "TickerBaselineTable",
     "format_baseline_report",
     # History
     "FeatureHistoryStorage",
+    "ParquetFeatureHistoryStorage",
 ]
@@ -10,9 +10,16 @@ USAGE:
     storage.save(baseline)
 """
 
+import hashlib
 import logging
+import multiprocessing
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from datetime import date, timedelta
-from typing import Sequence
+from functools import lru_cache
+from itertools import repeat
 
 import numpy as np
 import pandas as pd
@@ -28,55 +35,338 @@ from obsidian.baseline.types import (
 )
 from obsidian.core.constants import DEFAULT_ROLLING_WINDOW, MIN_OBSERVATIONS
 
+# Numba is optional; without it the NumPy implementation is used
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
 
 logger = logging.getLogger(__name__)
 
+# Quantiles reported by DistributionStats (p25, median, p75, p90, p95)
+_QUANTILES = np.array([0.25, 0.50, 0.75, 0.90, 0.95])
+
+# Scale factor making the MAD a consistent estimator of σ for normal data
+_MAD_TO_STD = 1.4826
+
+# Batches smaller than this run serially: spawning workers (each re-importing
+# numpy/pandas) costs far more than a few baselines
+_PARALLEL_BATCH_MIN = 32
+
+# Directly-observed metrics whose distributions are computed in one batch
+_BATCH_STATS_COLUMNS = (
+    "dark_pool_ratio",
+    "block_trade_count",
+    "venue_shift",
+    "gex",
+    "dex",
+    "vanna",
+    "charm",
+    "iv_atm",
+    "iv_skew",
+    "iv_rank",
+    "impact_per_vol",
+    "price_efficiency",
+    "daily_range_pct",
+)
+
+# Raw columns used for derived metrics (ratios, diffs, positions)
+_DERIVED_COLUMNS = (
+    "dark_pool_volume",
+    "total_volume",
+    "block_trade_size_avg",
+    "block_premium",
+    "gex",
+    "iv_atm",
+    "daily_range_pct",
+    "volume",
+    "close_price",
+    "low_price",
+    "high_price",
+)
+
+# Every column read from the history, batch-stats columns first. Absent
+# columns are reindexed in as all-NaN and fall through to the defaults.
+_INPUT_COLUMNS = tuple(dict.fromkeys(_BATCH_STATS_COLUMNS + _DERIVED_COLUMNS))
+
+# Columns counted for the missing-data percentage
+_QUALITY_COLUMNS = (
+    "dark_pool_ratio", "gex", "dex", "price_efficiency",
+    "daily_range_pct", "block_trade_count"
+)
+_QUALITY_INDEX = [_INPUT_COLUMNS.index(c) for c in _QUALITY_COLUMNS]
+
+# DynamicState field for each z-scored feature in TickerBaseline.summary_vector()
+_ZSCORE_FIELDS = {
+    "dark_pool_ratio": "dark_share_zscore",
+    "gex": "gex_zscore",
+    "dex": "dex_zscore",
+    "iv_atm": "iv_zscore",
+    "iv_skew": "iv_skew_zscore",
+    "price_efficiency": "price_efficiency_zscore",
+}
+
+# Fallback distributions for metrics a ticker has no usable history for.
+# n_observations is filled in per baseline via dataclasses.replace.
+_ZERO_STATS = DistributionStats(
+    mean=0, std=0, median=0, mad=0,
+    p25=0, p75=0, p90=0, p95=0,
+    min_val=0, max_val=0, n_observations=0
+)
+_DEFAULT_VENUE_SHIFT_STATS = DistributionStats(
+    mean=0, std=1, median=0, mad=0,
+    p25=-0.5, p75=0.5, p90=1, p95=1.5,
+    min_val=-5, max_val=5, n_observations=0
+)
+_DEFAULT_DEX_STATS = DistributionStats(
+    mean=0, std=1e6, median=0, mad=1e6,
+    p25=-1e6, p75=1e6, p90=2e6, p95=3e6,
+    min_val=-1e7, max_val=1e7, n_observations=0
+)
+_DEFAULT_RPV_STATS = DistributionStats(
+    mean=0, std=1, median=0, mad=0.5,
+    p25=-0.5, p75=0.5, p90=1, p95=1.5,
+    min_val=-5, max_val=5, n_observations=0
+)
+_DEFAULT_PE_STATS = DistributionStats(
+    mean=50, std=20, median=50, mad=15,
+    p25=35, p75=65, p90=80, p95=90,
+    min_val=0, max_val=100, n_observations=0
+)
+_DEFAULT_RANGE_STATS = DistributionStats(
+    mean=1.0, std=0.5, median=0.9, mad=0.3,
+    p25=0.6, p75=1.3, p90=1.8, p95=2.2,
+    min_val=0.1, max_val=5.0, n_observations=0
+)
+_DEFAULT_CLOSE_POS_STATS = DistributionStats(
+    mean=0.5, std=0.2, median=0.5, mad=0.15,
+    p25=0.35, p75=0.65, p90=0.8, p95=0.9,
+    min_val=0, max_val=1, n_observations=0
+)
+
+
+def _stats_1d(a: np.ndarray) -> tuple:
+    """
+    Compute all distribution statistics of a finite 1-D array in one pass.
+
+    Compiled with Numba when available. Semantics match the NumPy path in
+    compute_distribution_stats (linear-interpolated quantiles, population std).
+
+    Args:
+        a: Finite float64 values (at least one)
+
+    Returns:
+        Tuple of (mean, std, median, mad, p25, p75, p90, p95, min, max, n)
+    """
+    n = a.size
+
+    # Only the ranks bracketing each quantile (plus min/max) need to be in
+    # place, so a partial selection replaces the full sort.
+    kth = np.empty(12, dtype=np.int64)
+    kth[0] = 0
+    kth[1] = n - 1
+    for k in range(5):
+        lo = int(np.floor(_QUANTILES[k] * (n - 1)))
+        kth[2 + 2 * k] = lo
+        kth[3 + 2 * k] = min(lo + 1, n - 1)
+    s = np.partition(a, np.unique(kth))
+
+    q = np.empty(5)
+    for k in range(5):
+        pos = _QUANTILES[k] * (n - 1)
+        lo = int(np.floor(pos))
+        hi = min(lo + 1, n - 1)
+        q[k] = s[lo] + (pos - lo) * (s[hi] - s[lo])
+    median = q[1]
+
+    total = 0.0
+    for i in range(n):
+        total += s[i]
+    mean = total / n
+
+    sq = 0.0
+    for i in range(n):
+        d = s[i] - mean
+        sq += d * d
+    std = np.sqrt(sq / n)
+
+    mid_lo = (n - 1) // 2
+    mid_hi = n // 2
+    dev = np.partition(np.abs(s - median), np.array([mid_lo, mid_hi]))
+    mad = 0.5 * (dev[mid_lo] + dev[mid_hi])
+
+    return mean, std, median, mad, q[0], q[2], q[3], q[4], s[0], s[n - 1], n
+
+
+if NUMBA_AVAILABLE:
+    _stats_1d = njit(cache=True)(_stats_1d)
+
+
+@lru_cache(maxsize=64)
+def _rank_plan(n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, tuple[int, int]]:
+    """
+    Precompute the partition ranks needed for an array of length n.
+
+    Almost every call sees the same few sizes (the lookback window, or a
+    few less after NaNs/outliers), so the index arithmetic is done once
+    per size and reused.
+
+    Args:
+        n: Number of finite observations
+
+    Returns:
+        Tuple of (lower ranks, upper ranks, interpolation fractions,
+        sorted unique partition ranks, (low, high) median ranks)
+    """
+    positions = _QUANTILES * (n - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    frac = positions - lower
+    kth = np.unique(np.concatenate(([0, n - 1], lower, upper)))
+    for a in (lower, upper, frac, kth):
+        a.setflags(write=False)
+    return lower, upper, frac, kth, ((n - 1) // 2, n // 2)
+
 
 def compute_distribution_stats(
-    values: Sequence[float],
+    values: np.ndarray | Sequence[float | None],
     remove_outliers: bool = False,
     outlier_std: float = 3.0,
 ) -> DistributionStats | None:
     """
     Compute distribution statistics for a series of values.
 
+    Outliers are detected with the MAD-median rule: values further than
+    outlier_std robust standard deviations (1.4826 * MAD) from the median
+    are dropped and the statistics recomputed once.
+
     Args:
-        values: Sequence of numeric values
+        values: Float array (NaN for missing) or sequence of numeric values
         remove_outliers: Whether to remove outliers before computing stats
-        outlier_std: Number of standard deviations for outlier detection
+        outlier_std: Number of robust standard deviations for outlier detection
 
     Returns:
         DistributionStats or None if insufficient data
     """
-    arr = np.array([v for v in values if v is not None and not np.isnan(v)])
+    arr = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(arr)
+    if not finite.all():
+        arr = arr[finite]
+    # Complete inputs are used as-is: every step below allocates its own
+    # output (partition, abs, mask), so the caller's buffer is never modified.
 
     if len(arr) < MIN_OBSERVATIONS:
         return None
 
-    if remove_outliers and len(arr) > MIN_OBSERVATIONS:
-        mean = np.mean(arr)
-        std = np.std(arr)
-        if std > 0:
-            mask = np.abs(arr - mean) <= outlier_std * std
+    stats = _finite_distribution_stats(arr)
+
+    # Reuse the median/MAD just computed for the outlier mask
+    if remove_outliers and len(arr) > MIN_OBSERVATIONS and stats.mad > 0:
+        mask = np.abs(arr - stats.median) <= outlier_std * _MAD_TO_STD * stats.mad
+        if not mask.all():
             arr = arr[mask]
             if len(arr) < MIN_OBSERVATIONS:
                 return None
+            stats = _finite_distribution_stats(arr)
+
+    return stats
+
 
-    return DistributionStats(
-        mean=float(np.mean(arr)),
-        std=float(np.std(arr)),
-        median=float(np.median(arr)),
-        mad=float(np.median(np.abs(arr - np.median(arr)))),
-        p25=float(np.percentile(arr, 25)),
-        p75=float(np.percentile(arr, 75)),
-        p90=float(np.percentile(arr, 90)),
-        p95=float(np.percentile(arr, 95)),
-        min_val=float(np.min(arr)),
-        max_val=float(np.max(arr)),
-        n_observations=len(arr),
+def _finite_distribution_stats(arr: np.ndarray) -> DistributionStats:
+    """Compute DistributionStats for a non-empty array of finite values."""
+    if NUMBA_AVAILABLE:
+        *values, n = _stats_1d(arr)
+        return DistributionStats._unsafe(*map(float, values), int(n))
+
+    n = len(arr)
+    lower, upper, frac, kth, mid = _rank_plan(n)
+
+    # All order statistics come from a single partition. Quantiles use
+    # linear interpolation between neighbouring ranks (numpy's default).
+    part = np.partition(arr, kth)
+    lo_vals = part[lower]
+    p25, median, p75, p90, p95 = lo_vals + frac * (part[upper] - lo_vals)
+
+    # MAD: median of absolute deviations, from one more partition
+    mid_lo, mid_hi = mid
+    dev = np.partition(np.abs(arr - median), mid)
+    mad = 0.5 * (dev[mid_lo] + dev[mid_hi])
+
+    # Mean/std from sums (centered second pass keeps large-magnitude metrics exact)
+    mean = arr.sum() / n
+    centered = arr - mean
+    std = np.sqrt(centered @ centered / n)
+
+    return DistributionStats._unsafe(
+        float(mean), float(std), float(median), float(mad),
+        float(p25), float(p75), float(p90), float(p95),
+        float(part[0]), float(part[n - 1]), n,
     )
 
 
+def _batch_distribution_stats(
+    mat: np.ndarray,
+    columns: Sequence[str],
+    present: np.ndarray,
+) -> dict[str, DistributionStats | None]:
+    """
+    Compute distribution statistics for several columns at once.
+
+    The columns form a single (n_rows, n_columns) float64 matrix that is
+    reduced along axis 0, instead of converting and reducing each column
+    separately.
+
+    Args:
+        mat: Float matrix with NaN for missing values, one column per name
+        columns: Column names, aligned with the matrix columns
+        present: Boolean mask of non-NaN cells of mat, shared with the caller
+
+    Returns:
+        Mapping of column name to DistributionStats, or None for columns
+        that are missing or have insufficient data
+    """
+    result: dict[str, DistributionStats | None] = dict.fromkeys(columns)
+
+    counts = present.sum(axis=0)
+    valid = np.flatnonzero(counts >= MIN_OBSERVATIONS)
+    if len(valid) == 0:
+        return result
+
+    sub = mat[:, valid]
+    mask = present[:, valid]
+    n = counts[valid]
+
+    # Order statistics: skip NaN handling entirely when no cell is missing
+    if mask.all():
+        p25, median, p75, p90, p95 = np.percentile(sub, _QUANTILES * 100, axis=0)
+        mad = np.median(np.abs(sub - median), axis=0)
+    else:
+        p25, median, p75, p90, p95 = np.nanpercentile(sub, _QUANTILES * 100, axis=0)
+        mad = np.nanmedian(np.abs(sub - median), axis=0)
+
+    # Moments and extremes reuse the shared mask instead of re-detecting NaNs
+    mean = np.sum(sub, axis=0, where=mask) / n
+    centered = sub - mean
+    std = np.sqrt(np.sum(centered * centered, axis=0, where=mask) / n)
+    min_val = np.min(sub, axis=0, where=mask, initial=np.inf)
+    max_val = np.max(sub, axis=0, where=mask, initial=-np.inf)
+
+    # One tolist() per statistic yields Python floats for every column at once
+    rows = zip(
+        mean.tolist(), std.tolist(), median.tolist(), mad.tolist(),
+        p25.tolist(), p75.tolist(), p90.tolist(), p95.tolist(),
+        min_val.tolist(), max_val.tolist(), n.tolist(),
+        strict=True,
+    )
+    for i, row in zip(valid.tolist(), rows, strict=True):
+        result[columns[i]] = DistributionStats._unsafe(*row)
+
+    return result
+
+
 class BaselineCalculator:
     """
     Calculates ticker-specific baseline profiles.
@@ -96,6 +386,7 @@ class BaselineCalculator:
         self,
         lookback_days: int = DEFAULT_ROLLING_WINDOW,
         min_observations: int = MIN_OBSERVATIONS,
+        cache_size: int = 128,
     ):
         """
         Initialize baseline calculator.
@@ -103,9 +394,18 @@ class BaselineCalculator:
         Args:
             lookback_days: Number of trading days for baseline (default 63)
             min_observations: Minimum observations required (default 21)
+            cache_size: Baselines memoized by input content (0 disables)
         """
         self.lookback_days = lookback_days
         self.min_observations = min_observations
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, TickerBaseline] = OrderedDict()
+
+    def __getstate__(self) -> dict:
+        """Drop the memo cache when pickling (e.g. for worker processes)."""
+        state = self.__dict__.copy()
+        state["_cache"] = OrderedDict()
+        return state
 
     def compute_baseline(
         self,
@@ -141,16 +441,20 @@ class BaselineCalculator:
             logger.error(f"Historical data missing 'date' column for {ticker}")
             return None
 
-        df = historical_data.copy()
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        # Day-resolution dates; the input frame itself is never copied or mutated
+        dates = pd.to_datetime(historical_data["date"]).to_numpy().astype("datetime64[D]")
 
         # Filter to lookback window
         if as_of_date is None:
-            as_of_date = df["date"].max()
+            as_of_date = dates[~np.isnat(dates)].max().item()
 
         start_date = as_of_date - timedelta(days=int(self.lookback_days * 1.5))  # Buffer for weekends
-        df = df[(df["date"] >= start_date) & (df["date"] <= as_of_date)]
-        df = df.sort_values("date").tail(self.lookback_days)
+        idx = np.flatnonzero(
+            (dates >= np.datetime64(start_date, "D")) & (dates <= np.datetime64(as_of_date, "D"))
+        )
+        idx = idx[np.argsort(dates[idx], kind="stable")][-self.lookback_days:]
+        df = historical_data.iloc[idx]
+        window_dates = dates[idx]
 
         if len(df) < self.min_observations:
             logger.warning(
@@ -158,33 +462,55 @@ class BaselineCalculator:
             )
             return None
 
+        # All input columns as one float matrix (absent columns are all-NaN)
+        mat = df.reindex(columns=list(_INPUT_COLUMNS)).to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        cols = dict(zip(_INPUT_COLUMNS, mat.T, strict=True))
+        present = ~np.isnan(mat)
+        n_rows = len(df)
+
+        # Same window contents and settings give the same baseline
+        cache_key = None
+        if self.cache_size > 0:
+            digest = hashlib.blake2b(window_dates.tobytes(), digest_size=16)
+            digest.update(np.ascontiguousarray(mat).tobytes())
+            cache_key = (
+                ticker, as_of_date, self.lookback_days, self.min_observations,
+                digest.hexdigest(),
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                # TickerBaseline is mutable; its components are frozen
+                return replace(cached)
+
+        # Distributions of all directly-observed metrics in one pass
+        n_batch = len(_BATCH_STATS_COLUMNS)
+        stats = _batch_distribution_stats(
+            mat[:, :n_batch], _BATCH_STATS_COLUMNS, present[:, :n_batch]
+        )
+
         # Compute baseline components
-        dark_pool = self._compute_dark_pool_baseline(df)
-        greeks = self._compute_greeks_baseline(df)
-        price_eff = self._compute_price_efficiency_baseline(df)
+        dark_pool = self._compute_dark_pool_baseline(cols, stats, n_rows)
+        greeks = self._compute_greeks_baseline(cols, stats, n_rows)
+        price_eff = self._compute_price_efficiency_baseline(cols, stats, n_rows)
 
         if dark_pool is None or greeks is None or price_eff is None:
             logger.warning(f"Failed to compute all baseline components for {ticker}")
             return None
 
         # Calculate data quality
-        expected_fields = [
-            "dark_pool_ratio", "gex", "dex", "price_efficiency",
-            "daily_range_pct", "block_trade_count"
-        ]
-        missing_count = sum(
-            df[col].isna().sum() if col in df.columns else len(df)
-            for col in expected_fields
-        )
-        total_expected = len(expected_fields) * len(df)
+        total_expected = len(_QUALITY_COLUMNS) * n_rows
+        missing_count = total_expected - int(present[:, _QUALITY_INDEX].sum())
         missing_pct = (missing_count / total_expected) * 100 if total_expected > 0 else 100.0
 
-        return TickerBaseline(
+        baseline = TickerBaseline(
             ticker=ticker,
             baseline_date=as_of_date,
             lookback_days=self.lookback_days,
-            data_start_date=df["date"].min(),
-            data_end_date=df["date"].max(),
+            data_start_date=window_dates[0].item(),
+            data_end_date=window_dates[-1].item(),
             dark_pool=dark_pool,
             greeks=greeks,
             price_efficiency=price_eff,
@@ -192,18 +518,64 @@ class BaselineCalculator:
             missing_data_pct=missing_pct,
         )
 
-    def _compute_dark_pool_baseline(self, df: pd.DataFrame) -> DarkPoolBaseline | None:
+        if cache_key is not None:
+            self._cache[cache_key] = replace(baseline)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return baseline
+
+    def compute_baselines_batch(
+        self,
+        ticker_data: Mapping[str, pd.DataFrame],
+        as_of_date: date | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, TickerBaseline | None]:
+        """
+        Compute baselines for many tickers in parallel.
+
+        Each ticker is independent, so batches of _PARALLEL_BATCH_MIN or
+        more tickers are fanned out across processes. Smaller batches, or
+        max_workers=1, use a serial loop.
+
+        Args:
+            ticker_data: Mapping of ticker to its historical DataFrame
+            as_of_date: Reference date for all baselines (default: latest per ticker)
+            max_workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            Mapping of ticker to TickerBaseline (None where insufficient data)
+        """
+        tickers = list(ticker_data)
+        frames = [ticker_data[t] for t in tickers]
+
+        if max_workers == 1 or len(tickers) < _PARALLEL_BATCH_MIN:
+            results = map(self.compute_baseline, tickers, frames, repeat(as_of_date))
+            return dict(zip(tickers, results, strict=True))
+
+        # spawn: forking a process that may hold pandas/numpy threads can deadlock
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            results = executor.map(
+                self.compute_baseline, tickers, frames, repeat(as_of_date)
+            )
+            return dict(zip(tickers, results, strict=True))
+
+    def _compute_dark_pool_baseline(
+        self,
+        cols: dict[str, np.ndarray],
+        stats: dict[str, DistributionStats | None],
+        n_rows: int,
+    ) -> DarkPoolBaseline | None:
         """Compute dark pool baseline from historical data."""
         # Dark share
-        dark_share = None
-        if "dark_pool_ratio" in df.columns:
-            dark_share = compute_distribution_stats(df["dark_pool_ratio"].tolist())
+        dark_share = stats["dark_pool_ratio"]
 
         if dark_share is None:
             # Try computing from volumes
-            if "dark_pool_volume" in df.columns and "total_volume" in df.columns:
-                ratios = df["dark_pool_volume"] / df["total_volume"].replace(0, np.nan) * 100
-                dark_share = compute_distribution_stats(ratios.tolist())
+            total = cols["total_volume"]
+            ratios = cols["dark_pool_volume"] / np.where(total == 0, np.nan, total) * 100
+            dark_share = compute_distribution_stats(ratios)
 
         if dark_share is None:
             logger.warning("Cannot compute dark pool baseline: missing dark_pool_ratio")
@@ -214,65 +586,39 @@ class BaselineCalculator:
         typical_high = min(100, dark_share.mean + 1.5 * dark_share.std)
 
         # Block activity
-        block_count = None
-        if "block_trade_count" in df.columns:
-            block_count = compute_distribution_stats(df["block_trade_count"].tolist())
+        block_count = stats["block_trade_count"]
 
         if block_count is None:
             # Create default for instruments without block data
-            block_count = DistributionStats(
-                mean=0, std=0, median=0, mad=0,
-                p25=0, p75=0, p90=0, p95=0,
-                min_val=0, max_val=0, n_observations=len(df)
-            )
+            block_count = replace(_ZERO_STATS, n_observations=n_rows)
 
-        block_size = None
-        if "block_trade_size_avg" in df.columns:
-            block_size = compute_distribution_stats(
-                df["block_trade_size_avg"].dropna().tolist(),
-                remove_outliers=True
-            )
+        block_size = compute_distribution_stats(
+            cols["block_trade_size_avg"],
+            remove_outliers=True
+        )
 
         if block_size is None:
-            block_size = DistributionStats(
-                mean=0, std=0, median=0, mad=0,
-                p25=0, p75=0, p90=0, p95=0,
-                min_val=0, max_val=0, n_observations=len(df)
-            )
+            block_size = replace(_ZERO_STATS, n_observations=n_rows)
 
-        block_premium = None
-        if "block_premium" in df.columns:
-            block_premium = compute_distribution_stats(
-                df["block_premium"].dropna().tolist(),
-                remove_outliers=True
-            )
+        block_premium = compute_distribution_stats(
+            cols["block_premium"],
+            remove_outliers=True
+        )
 
         if block_premium is None:
-            block_premium = DistributionStats(
-                mean=0, std=0, median=0, mad=0,
-                p25=0, p75=0, p90=0, p95=0,
-                min_val=0, max_val=0, n_observations=len(df)
-            )
+            block_premium = replace(_ZERO_STATS, n_observations=n_rows)
 
         # Venue shift
-        venue_shift = None
-        if "venue_shift" in df.columns:
-            venue_shift = compute_distribution_stats(df["venue_shift"].dropna().tolist())
+        venue_shift = stats["venue_shift"]
 
         if venue_shift is None:
-            venue_shift = DistributionStats(
-                mean=0, std=1, median=0, mad=0,
-                p25=-0.5, p75=0.5, p90=1, p95=1.5,
-                min_val=-5, max_val=5, n_observations=len(df)
-            )
+            venue_shift = replace(_DEFAULT_VENUE_SHIFT_STATS, n_observations=n_rows)
 
         # Dark pool volume (absolute)
-        dark_volume = None
-        if "dark_pool_volume" in df.columns:
-            dark_volume = compute_distribution_stats(
-                df["dark_pool_volume"].dropna().tolist(),
-                remove_outliers=True
-            )
+        dark_volume = compute_distribution_stats(
+            cols["dark_pool_volume"],
+            remove_outliers=True
+        )
 
         return DarkPoolBaseline(
             dark_share=dark_share,
@@ -285,65 +631,49 @@ class BaselineCalculator:
             policy=BaselineUpdatePolicy.LOCKED,
         )
 
-    def _compute_greeks_baseline(self, df: pd.DataFrame) -> GreeksBaseline | None:
+    def _compute_greeks_baseline(
+        self,
+        cols: dict[str, np.ndarray],
+        stats: dict[str, DistributionStats | None],
+        n_rows: int,
+    ) -> GreeksBaseline | None:
         """Compute Greeks baseline from historical data."""
         # GEX
-        gex = None
+        gex = stats["gex"]
         gex_positive_pct = 50.0
         gex_negative_pct = 50.0
 
-        if "gex" in df.columns:
-            gex_values = df["gex"].dropna()
-            gex = compute_distribution_stats(gex_values.tolist())
-
-            if len(gex_values) > 0:
-                gex_positive_pct = (gex_values > 0).mean() * 100
-                gex_negative_pct = (gex_values < 0).mean() * 100
+        gex_values = cols["gex"][~np.isnan(cols["gex"])]
+        if len(gex_values) > 0:
+            gex_positive_pct = float(np.mean(gex_values > 0)) * 100
+            gex_negative_pct = float(np.mean(gex_values < 0)) * 100
 
         if gex is None:
             logger.warning("Cannot compute Greeks baseline: missing gex")
             return None
 
         # DEX
-        dex = None
-        if "dex" in df.columns:
-            dex = compute_distribution_stats(df["dex"].dropna().tolist())
+        dex = stats["dex"]
 
         if dex is None:
             # Default neutral DEX
-            dex = DistributionStats(
-                mean=0, std=1e6, median=0, mad=1e6,
-                p25=-1e6, p75=1e6, p90=2e6, p95=3e6,
-                min_val=-1e7, max_val=1e7, n_observations=len(df)
-            )
+            dex = replace(_DEFAULT_DEX_STATS, n_observations=n_rows)
 
         # Higher-order Greeks (optional)
-        vanna = None
-        if "vanna" in df.columns:
-            vanna = compute_distribution_stats(df["vanna"].dropna().tolist())
-
-        charm = None
-        if "charm" in df.columns:
-            charm = compute_distribution_stats(df["charm"].dropna().tolist())
+        vanna = stats["vanna"]
+        charm = stats["charm"]
 
         # IV metrics
-        iv_atm = None
-        if "iv_atm" in df.columns:
-            iv_atm = compute_distribution_stats(df["iv_atm"].dropna().tolist())
+        iv_atm = stats["iv_atm"]
 
         iv_atm_daily_change = None
-        if "iv_atm" in df.columns:
-            iv_changes = df["iv_atm"].diff().dropna()
-            if len(iv_changes) >= self.min_observations:
-                iv_atm_daily_change = compute_distribution_stats(iv_changes.tolist())
+        # Day-over-day change; a gap in either day leaves NaN
+        iv_changes = np.diff(cols["iv_atm"])
+        if np.count_nonzero(~np.isnan(iv_changes)) >= self.min_observations:
+            iv_atm_daily_change = compute_distribution_stats(iv_changes)
 
-        iv_skew = None
-        if "iv_skew" in df.columns:
-            iv_skew = compute_distribution_stats(df["iv_skew"].dropna().tolist())
-
-        iv_rank = None
-        if "iv_rank" in df.columns:
-            iv_rank = compute_distribution_stats(df["iv_rank"].dropna().tolist())
+        iv_skew = stats["iv_skew"]
+        iv_rank = stats["iv_rank"]
 
         return GreeksBaseline(
             gex=gex,
@@ -359,84 +689,55 @@ class BaselineCalculator:
             policy=BaselineUpdatePolicy.LOCKED,
         )
 
-    def _compute_price_efficiency_baseline(self, df: pd.DataFrame) -> PriceEfficiencyBaseline | None:
+    def _compute_price_efficiency_baseline(
+        self,
+        cols: dict[str, np.ndarray],
+        stats: dict[str, DistributionStats | None],
+        n_rows: int,
+    ) -> PriceEfficiencyBaseline | None:
         """Compute price efficiency baseline from historical data."""
         # Range per volume
         range_per_volume = None
-        if "daily_range_pct" in df.columns and "volume" in df.columns:
-            # Normalize by volume (log scale for large volumes)
-            with np.errstate(divide="ignore", invalid="ignore"):
-                rpv = df["daily_range_pct"] / np.log1p(df["volume"])
-                rpv = rpv.replace([np.inf, -np.inf], np.nan).dropna()
-            if len(rpv) >= self.min_observations:
-                range_per_volume = compute_distribution_stats(rpv.tolist())
+        # Normalize by volume (log scale for large volumes)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rpv = cols["daily_range_pct"] / np.log1p(cols["volume"])
+        if np.count_nonzero(np.isfinite(rpv)) >= self.min_observations:
+            range_per_volume = compute_distribution_stats(rpv)
 
         if range_per_volume is None:
             # Default
-            range_per_volume = DistributionStats(
-                mean=0, std=1, median=0, mad=0.5,
-                p25=-0.5, p75=0.5, p90=1, p95=1.5,
-                min_val=-5, max_val=5, n_observations=len(df)
-            )
+            range_per_volume = replace(_DEFAULT_RPV_STATS, n_observations=n_rows)
 
         # Impact per volume
-        impact_per_volume = None
-        if "impact_per_vol" in df.columns:
-            impact_per_volume = compute_distribution_stats(
-                df["impact_per_vol"].dropna().tolist()
-            )
+        impact_per_volume = stats["impact_per_vol"]
 
         if impact_per_volume is None:
-            impact_per_volume = DistributionStats(
-                mean=0, std=1, median=0, mad=0.5,
-                p25=-0.5, p75=0.5, p90=1, p95=1.5,
-                min_val=-5, max_val=5, n_observations=len(df)
-            )
+            impact_per_volume = replace(_DEFAULT_RPV_STATS, n_observations=n_rows)
 
         # Price efficiency
-        price_efficiency = None
-        if "price_efficiency" in df.columns:
-            price_efficiency = compute_distribution_stats(
-                df["price_efficiency"].dropna().tolist()
-            )
+        price_efficiency = stats["price_efficiency"]
 
         if price_efficiency is None:
-            price_efficiency = DistributionStats(
-                mean=50, std=20, median=50, mad=15,
-                p25=35, p75=65, p90=80, p95=90,
-                min_val=0, max_val=100, n_observations=len(df)
-            )
+            price_efficiency = replace(_DEFAULT_PE_STATS, n_observations=n_rows)
 
         # Daily range
-        daily_range_pct = None
-        if "daily_range_pct" in df.columns:
-            daily_range_pct = compute_distribution_stats(
-                df["daily_range_pct"].dropna().tolist()
-            )
+        daily_range_pct = stats["daily_range_pct"]
 
         if daily_range_pct is None:
-            daily_range_pct = DistributionStats(
-                mean=1.0, std=0.5, median=0.9, mad=0.3,
-                p25=0.6, p75=1.3, p90=1.8, p95=2.2,
-                min_val=0.1, max_val=5.0, n_observations=len(df)
-            )
+            daily_range_pct = replace(_DEFAULT_RANGE_STATS, n_observations=n_rows)
 
         # Close position (where close falls in daily range)
         close_position = None
-        if all(c in df.columns for c in ["close_price", "low_price", "high_price"]):
-            pos = (df["close_price"] - df["low_price"]) / (
-                df["high_price"] - df["low_price"]
-            ).replace(0, np.nan)
-            pos = pos.dropna()
-            if len(pos) >= self.min_observations:
-                close_position = compute_distribution_stats(pos.tolist())
+        low = cols["low_price"]
+        daily_range = cols["high_price"] - low
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pos = np.where(daily_range == 0, np.nan, (cols["close_price"] - low) / daily_range)
+        pos = pos[np.isfinite(pos)]
+        if len(pos) >= self.min_observations:
+            close_position = compute_distribution_stats(pos)
 
         if close_position is None:
-            close_position = DistributionStats(
-                mean=0.5, std=0.2, median=0.5, mad=0.15,
-                p25=0.35, p75=0.65, p90=0.8, p95=0.9,
-                min_val=0, max_val=1, n_observations=len(df)
-            )
+            close_position = replace(_DEFAULT_CLOSE_POS_STATS, n_observations=n_rows)
 
         return PriceEfficiencyBaseline(
             range_per_volume=range_per_volume,
@@ -469,18 +770,21 @@ class BaselineCalculator:
         Returns:
             DynamicState with z-scores and percentiles
         """
-        state = DynamicState(
-            ticker=ticker,
-            trade_date=trade_date,
-            rolling_window=self.lookback_days,
-        )
-
-        # Dark share z-score
-        dark_ratio = current_features.get("dark_pool_ratio")
-        if dark_ratio is not None and baseline.dark_pool.dark_share:
-            state = DynamicState(
-                **{**state.__dict__, "dark_share_zscore": baseline.dark_pool.dark_share.zscore(dark_ratio)}
-            )
+        kwargs: dict = {
+            "ticker": ticker,
+            "trade_date": trade_date,
+            "rolling_window": self.lookback_days,
+        }
+
+        # Z-scores of all baselined features in one vectorized pass
+        means, stds, names = baseline.summary_vector()
+        obs = np.array([current_features.get(c) for c in names], dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            zscores = np.where(stds == 0, 0.0, (obs - means) / stds)
+        available = ~(np.isnan(obs) | np.isnan(means))
+        for name, zscore, ok in zip(names, zscores.tolist(), available.tolist(), strict=True):
+            if ok:
+                kwargs[_ZSCORE_FIELDS[name]] = zscore
 
         # Block intensity z-score
         block_count = current_features.get("block_trade_count", 0)
@@ -493,54 +797,18 @@ class BaselineCalculator:
             )
             if baseline_intensity > 0:
                 intensity_std = baseline_intensity * 0.5  # Rough estimate
-                state = DynamicState(
-                    **{**state.__dict__, "block_intensity_zscore": (block_intensity - baseline_intensity) / intensity_std}
+                kwargs["block_intensity_zscore"] = (
+                    (block_intensity - baseline_intensity) / intensity_std
                 )
 
-        # GEX z-score
+        # GEX percentile and signs
         gex = current_features.get("gex")
         if gex is not None and baseline.greeks.gex:
-            gex_z = baseline.greeks.gex.zscore(gex)
-            gex_pct = baseline.greeks.gex.percentile_rank(gex)
-            gex_sign = 1 if gex > 0 else (-1 if gex < 0 else 0)
-            state = DynamicState(
-                **{**state.__dict__,
-                   "gex_zscore": gex_z,
-                   "gex_pct": gex_pct,
-                   "gex_sign": gex_sign}
-            )
+            kwargs["gex_pct"] = baseline.greeks.gex.percentile_rank(gex)
+            kwargs["gex_sign"] = 1 if gex > 0 else (-1 if gex < 0 else 0)
 
-        # DEX z-score
         dex = current_features.get("dex")
         if dex is not None and baseline.greeks.dex:
-            dex_z = baseline.greeks.dex.zscore(dex)
-            dex_sign = 1 if dex > 0 else (-1 if dex < 0 else 0)
-            state = DynamicState(
-                **{**state.__dict__,
-                   "dex_zscore": dex_z,
-                   "dex_sign": dex_sign}
-            )
+            kwargs["dex_sign"] = 1 if dex > 0 else (-1 if dex < 0 else 0)
 
-        # IV z-score
-        iv_atm = current_features.get("iv_atm")
-        if iv_atm is not None and baseline.greeks.iv_atm:
-            state = DynamicState(
-                **{**state.__dict__, "iv_zscore": baseline.greeks.iv_atm.zscore(iv_atm)}
-            )
-
-        # IV skew z-score
-        iv_skew = current_features.get("iv_skew")
-        if iv_skew is not None and baseline.greeks.iv_skew:
-            state = DynamicState(
-                **{**state.__dict__, "iv_skew_zscore": baseline.greeks.iv_skew.zscore(iv_skew)}
-            )
-
-        # Price efficiency z-score
-        price_eff = current_features.get("price_efficiency")
-        if price_eff is not None and baseline.price_efficiency.price_efficiency:
-            state = DynamicState(
-                **{**state.__dict__,
-                   "price_efficiency_zscore": baseline.price_efficiency.price_efficiency.zscore(price_eff)}
-            )
-
-        return state
+        return DynamicState(**kwargs)
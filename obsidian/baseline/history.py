@@ -5,30 +5,67 @@ Stores daily feature values for incremental baseline computation.
 This allows baselines to be computed from locally collected data
 even when the API doesn't provide long historical access.
 
-Storage structure:
+Storage structure (FeatureHistoryStorage):
     data/feature_history/
     ├── SPY/
-    │   ├── 2026-01-15.json
-    │   ├── 2026-01-16.json
-    │   └── ...
+    │   ├── _manifest.json
+    │   ├── 2025/
+    │   │   └── ...
+    │   └── 2026/
+    │       ├── 2026-01-15.json
+    │       ├── 2026-01-16.json
+    │       └── ...
     └── QQQ/
         └── ...
 
+Storage structure (ParquetFeatureHistoryStorage):
+    data/feature_history/
+    ├── SPY.parquet
+    └── QQQ.parquet
+
 DESIGN PRINCIPLE:
     Collect data daily → Build history over time → Compute baseline from history
     This overcomes API limitations on historical data access.
 """
 
-import json
 import logging
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
-import pandas as pd
+from obsidian.core import json_io
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
+# A listing is only cached once its mtime is older than this, since
+# filesystem timestamps are coarse and a same-tick change would go unseen
+_MTIME_SETTLE_NS = 2_000_000_000
+
+# Per-day JSON loads above this count are spread over a thread pool
+_PARALLEL_LOAD_MIN = 32
+_MAX_LOAD_WORKERS = 16
+
+# Per-ticker summary of the newest snapshot, kept beside the JSON files
+_MANIFEST_NAME = "_manifest.json"
+
+# Parquet history files are zstd-compressed (read back transparently)
+_PARQUET_COMPRESSION = "zstd"
+_PARQUET_COMPRESSION_LEVEL = 3
+
+# Bookkeeping columns stored alongside features in the Parquet backend
+_META_COLUMNS = ("date", "ticker", "saved_at")
+
 
 class FeatureHistoryStorage:
     """
@@ -48,16 +85,63 @@ class FeatureHistoryStorage:
         """
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._dates_cache: dict[str, tuple[int | None, list[date], frozenset[date]]] = {}
+        self._ticker_dirs: dict[str, Path] = {}
+        self._upper_cache: dict[str, str] = {}
+
+    def _norm(self, ticker: str) -> str:
+        """Normalize a ticker symbol (upper case), memoized per spelling."""
+        norm = self._upper_cache.get(ticker)
+        if norm is None:
+            norm = self._upper_cache[ticker] = ticker.upper()
+        return norm
 
     def _ticker_dir(self, ticker: str) -> Path:
-        """Get directory for a ticker's history."""
-        path = self.base_dir / ticker.upper()
-        path.mkdir(parents=True, exist_ok=True)
+        """Get directory for a ticker's history, creating it on first use."""
+        key = self._norm(ticker)
+        path = self._ticker_dirs.get(key)
+        if path is None:
+            path = self.base_dir / key
+            path.mkdir(parents=True, exist_ok=True)
+            self._migrate_flat_files(path)
+            self._ticker_dirs[key] = path
         return path
 
+    def _ticker_dir_ro(self, ticker: str) -> Path:
+        """Get directory for a ticker's history without creating it."""
+        return self.base_dir / self._norm(ticker)
+
     def _date_path(self, ticker: str, trade_date: date) -> Path:
-        """Get path for a specific date's features."""
-        return self._ticker_dir(ticker) / f"{trade_date.isoformat()}.json"
+        """Get path for a specific date's features (sharded by year)."""
+        name = f"{trade_date.isoformat()}.json"
+        return self._ticker_dir_ro(ticker) / name[:4] / name
+
+    def _find_date_path(self, ticker: str, trade_date: date) -> Path | None:
+        """Locate a stored date's file, including the legacy unsharded layout."""
+        path = self._date_path(ticker, trade_date)
+        if path.exists():
+            return path
+        legacy = path.parent.parent / path.name
+        if legacy.exists():
+            return legacy
+        return None
+
+    def _migrate_flat_files(self, ticker_dir: Path) -> None:
+        """Move snapshots from the old flat layout into year directories."""
+        moved = 0
+        for trade_date in _snapshot_dates(ticker_dir):
+            name = f"{trade_date.isoformat()}.json"
+            year_dir = ticker_dir / name[:4]
+            year_dir.mkdir(exist_ok=True)
+            if (year_dir / name).exists():
+                # Already written in the sharded layout, which is newer
+                (ticker_dir / name).unlink()
+            else:
+                os.replace(ticker_dir / name, year_dir / name)
+            moved += 1
+
+        if moved:
+            logger.info(f"Moved {moved} feature files in {ticker_dir} into year directories")
 
     def save(
         self,
@@ -76,25 +160,92 @@ class FeatureHistoryStorage:
         Returns:
             True if successful
         """
-        path = self._date_path(ticker, trade_date)
+        return self.save_many([(ticker, trade_date, features)]) == 1
 
-        try:
-            data = {
-                "ticker": ticker.upper(),
-                "date": trade_date.isoformat(),
-                "features": features,
-                "saved_at": date.today().isoformat(),
-            }
+    def save_many(self, records: list[tuple[str, date, dict[str, Any]]]) -> int:
+        """
+        Save features for many (ticker, date) pairs in one batch.
 
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
+        Records are grouped by ticker so per-ticker bookkeeping happens
+        once per batch; for backfills prefer this over repeated save().
 
-            logger.debug(f"Saved feature history for {ticker} on {trade_date}")
-            return True
+        Args:
+            records: (ticker, trade_date, features) tuples; a later record
+                for the same ticker and date replaces an earlier one
 
-        except Exception as e:
-            logger.error(f"Failed to save feature history: {e}")
-            return False
+        Returns:
+            Number of records saved
+        """
+        # {TICKER: {date: features}}; a later record for a date wins
+        grouped: dict[str, dict[date, dict[str, Any]]] = {}
+        for ticker, trade_date, features in records:
+            grouped.setdefault(self._norm(ticker), {})[trade_date] = features
+
+        saved = 0
+        for ticker, rows in grouped.items():
+            saved += self._save_ticker(ticker, rows)
+            self._dates_cache.pop(ticker, None)
+        return saved
+
+    def _save_ticker(self, ticker: str, rows: dict[date, dict[str, Any]]) -> int:
+        """Write one ticker's share of a batch; returns rows saved."""
+        ticker_dir = self._ticker_dir(ticker)
+        saved_at = date.today().isoformat()
+        saved = 0
+        latest = None
+        year_dirs: set[str] = set()
+
+        for trade_date, features in rows.items():
+            try:
+                name = f"{trade_date.isoformat()}.json"
+                if name[:4] not in year_dirs:
+                    (ticker_dir / name[:4]).mkdir(exist_ok=True)
+                    year_dirs.add(name[:4])
+                data = {
+                    "ticker": ticker,
+                    "date": trade_date.isoformat(),
+                    "features": features,
+                    "saved_at": saved_at,
+                }
+                json_io.dump(ticker_dir / name[:4] / name, data)
+                saved += 1
+                if latest is None or trade_date > latest:
+                    latest = trade_date
+                logger.debug(f"Saved feature history for {ticker} on {trade_date}")
+
+            except Exception as e:
+                logger.error(f"Failed to save feature history: {e}")
+
+        if latest is not None:
+            self._update_manifest(ticker, latest, rows[latest])
+
+        return saved
+
+    def _manifest_path(self, ticker: str) -> Path:
+        """Get path of a ticker's manifest (latest date and its feature names)."""
+        return self._ticker_dir_ro(ticker) / _MANIFEST_NAME
+
+    def _read_manifest(self, ticker: str) -> dict[str, Any] | None:
+        """Read a ticker's manifest, or None if absent or unreadable."""
+        try:
+            return json_io.loads(self._manifest_path(ticker).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _update_manifest(self, ticker: str, trade_date: date, features: dict[str, Any]) -> None:
+        """Record trade_date's feature names if it is the newest date saved."""
+        manifest = self._read_manifest(ticker)
+        if manifest is not None and manifest.get("latest_date", "") > trade_date.isoformat():
+            return
+
+        try:
+            json_io.dump(self._manifest_path(ticker), {
+                "latest_date": trade_date.isoformat(),
+                "features": list(features),
+                "null_features": [k for k, v in features.items() if v is None],
+            })
+        except OSError as e:
+            logger.warning(f"Failed to update feature manifest for {ticker}: {e}")
 
     def load(self, ticker: str, trade_date: date) -> dict[str, Any] | None:
         """
@@ -107,14 +258,14 @@ class FeatureHistoryStorage:
         Returns:
             Feature dictionary or None if not found
         """
-        path = self._date_path(ticker, trade_date)
+        path = self._find_date_path(ticker, trade_date)
 
-        if not path.exists():
+        if path is None:
             return None
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # One read into bytes; both JSON backends parse UTF-8 bytes directly
+            data = json_io.loads(path.read_bytes())
             return data.get("features")
         except Exception as e:
             logger.error(f"Failed to load feature history: {e}")
@@ -122,26 +273,55 @@ class FeatureHistoryStorage:
 
     def exists(self, ticker: str, trade_date: date) -> bool:
         """Check if features exist for a date."""
-        return self._date_path(ticker, trade_date).exists()
+        return self._find_date_path(ticker, trade_date) is not None
 
     def list_dates(self, ticker: str) -> list[date]:
         """
         List all available dates for a ticker.
 
+        The listing is cached per ticker and reused while the storage's
+        modification time is unchanged.
+
         Returns:
             Sorted list of dates with stored features
         """
-        ticker_dir = self._ticker_dir(ticker)
-        dates = []
-
-        for f in ticker_dir.glob("*.json"):
-            try:
-                d = date.fromisoformat(f.stem)
-                dates.append(d)
-            except ValueError:
-                continue
+        return list(self._cached_dates(ticker)[0])
+
+    def _cached_dates(self, ticker: str) -> tuple[list[date], frozenset[date]]:
+        """Sorted stored dates and the same dates as a set (shared; do not mutate)."""
+        key = self._norm(ticker)
+        stamp = self._dates_stamp(ticker)
+        cached = self._dates_cache.get(key)
+
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+
+        dates = sorted(self._scan_dates(ticker))
+        date_set = frozenset(dates)
+        if stamp is None or time.time_ns() - stamp > _MTIME_SETTLE_NS:
+            self._dates_cache[key] = (stamp, dates, date_set)
+        return dates, date_set
+
+    def _dates_stamp(self, ticker: str) -> int | None:
+        """Modification time (ns) that changes when dates are added or removed."""
+        # Newest mtime of the ticker directory and its year directories: any
+        # add/remove sets its directory's mtime to "now", raising the maximum
+        ticker_dir = self._ticker_dir_ro(ticker)
+        try:
+            stamp = ticker_dir.stat().st_mtime_ns
+            for year_dir in _year_dirs(ticker_dir):
+                stamp = max(stamp, year_dir.stat().st_mtime_ns)
+        except FileNotFoundError:
+            return None
+        return stamp
 
-        return sorted(dates)
+    def _scan_dates(self, ticker: str) -> list[date]:
+        """Read the stored dates for a ticker from disk (unsorted)."""
+        ticker_dir = self._ticker_dir_ro(ticker)
+        dates = _snapshot_dates(ticker_dir)
+        for year_dir in _year_dirs(ticker_dir):
+            dates.extend(_snapshot_dates(year_dir))
+        return dates
 
     def get_date_range(self, ticker: str) -> tuple[date | None, date | None]:
         """
@@ -165,7 +345,7 @@ class FeatureHistoryStorage:
         start_date: date | None = None,
         end_date: date | None = None,
         min_days: int = 0,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """
         Load feature history as a DataFrame.
 
@@ -181,6 +361,9 @@ class FeatureHistoryStorage:
         Raises:
             ValueError: If insufficient data
         """
+        # Deferred: pandas is slow to import and only needed here
+        import pandas as pd
+
         dates = self.list_dates(ticker)
 
         if not dates:
@@ -200,20 +383,43 @@ class FeatureHistoryStorage:
                 f"have {len(dates)} days, need {min_days}"
             )
 
-        # Load all features
-        records = []
-        for d in dates:
-            features = self.load(ticker, d)
+        # Load all features (dates are already sorted). Reads are small and
+        # I/O bound, so longer ranges overlap them on a thread pool; map()
+        # keeps the results in date order.
+        if len(dates) > _PARALLEL_LOAD_MIN:
+            with ThreadPoolExecutor(max_workers=_MAX_LOAD_WORKERS) as pool:
+                results = list(pool.map(self.load, repeat(ticker), dates))
+        else:
+            results = [self.load(ticker, d) for d in dates]
+
+        loaded = []
+        loaded_dates = []
+        for d, features in zip(dates, results, strict=True):
             if features:
-                features["date"] = d
-                features["ticker"] = ticker.upper()
-                records.append(features)
+                loaded.append(features)
+                loaded_dates.append(d)
 
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df = df.sort_values("date").reset_index(drop=True)
+        if not loaded:
+            return pd.DataFrame()
+
+        # Build column-wise: one float64 array per feature, NaN where absent
+        names = dict.fromkeys(k for features in loaded for k in features)
+        names.pop("date", None)
+        names.pop("ticker", None)
+        columns: dict[str, Any] = {}
+        for name in names:
+            values = [features.get(name) for features in loaded]
+            try:
+                columns[name] = np.array(values, dtype=np.float64)
+            except (TypeError, ValueError):
+                columns[name] = np.array(values, dtype=object)
+        columns["date"] = loaded_dates
+        # One category instead of a Python string per row
+        columns["ticker"] = pd.Categorical.from_codes(
+            np.zeros(len(loaded), dtype=np.int8), categories=[self._norm(ticker)]
+        )
 
-        return df
+        return pd.DataFrame(columns)
 
     def get_missing_dates(
         self,
@@ -232,17 +438,11 @@ class FeatureHistoryStorage:
         Returns:
             List of dates that are missing (excluding weekends)
         """
-        existing = set(self.list_dates(ticker))
-        missing = []
-
-        current = start_date
-        while current <= end_date:
-            # Skip weekends
-            if current.weekday() < 5 and current not in existing:
-                missing.append(current)
-            current += timedelta(days=1)
+        import pandas as pd
 
-        return missing
+        existing = self._cached_dates(ticker)[1]
+        weekdays = pd.bdate_range(start_date, end_date).date
+        return [d for d in weekdays if d not in existing]
 
     def cleanup_old(self, ticker: str, keep_days: int = 365) -> int:
         """
@@ -258,13 +458,21 @@ class FeatureHistoryStorage:
         cutoff = date.today() - timedelta(days=keep_days)
         removed = 0
 
+        # Years entirely before the cutoff go as whole directories
+        for year_dir in _year_dirs(self._ticker_dir_ro(ticker)):
+            if int(year_dir.name) < cutoff.year:
+                removed += len(_snapshot_dates(year_dir))
+                shutil.rmtree(year_dir)
+
         for d in self.list_dates(ticker):
             if d < cutoff:
-                path = self._date_path(ticker, d)
-                path.unlink()
-                removed += 1
+                path = self._find_date_path(ticker, d)
+                if path is not None:
+                    path.unlink()
+                    removed += 1
 
         if removed > 0:
+            self._dates_cache.pop(self._norm(ticker), None)
             logger.info(f"Removed {removed} old feature files for {ticker}")
 
         return removed
@@ -283,22 +491,287 @@ class FeatureHistoryStorage:
 
         if not dates:
             return {
-                "ticker": ticker.upper(),
+                "ticker": self._norm(ticker),
                 "observation_count": 0,
                 "has_data": False,
             }
 
-        # Check what features are available
-        sample = self.load(ticker, dates[-1]) or {}
-        available_features = list(sample.keys())
+        # Check what features are available, from the manifest when it is
+        # current and otherwise from the latest snapshot itself
+        manifest = self._read_manifest(ticker)
+        if manifest is not None and manifest.get("latest_date") == dates[-1].isoformat():
+            available_features = manifest["features"]
+            present = set(available_features).difference(manifest["null_features"])
+        else:
+            sample = self.load(ticker, dates[-1]) or {}
+            available_features = list(sample.keys())
+            present = {k for k, v in sample.items() if v is not None}
 
         return {
-            "ticker": ticker.upper(),
+            "ticker": self._norm(ticker),
             "observation_count": len(dates),
             "has_data": True,
             "earliest_date": dates[0].isoformat(),
             "latest_date": dates[-1].isoformat(),
             "available_features": available_features,
-            "has_vanna": "vanna" in available_features and sample.get("vanna") is not None,
-            "has_charm": "charm" in available_features and sample.get("charm") is not None,
+            "has_vanna": "vanna" in present,
+            "has_charm": "charm" in present,
         }
+
+
+def _year_dirs(ticker_dir: Path) -> list[Path]:
+    """List the YYYY year directories of a ticker's history."""
+    try:
+        with os.scandir(ticker_dir) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if len(entry.name) == 4 and entry.name.isdigit() and entry.is_dir()
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _snapshot_dates(directory: Path) -> list[date]:
+    """Dates of the YYYY-MM-DD.json snapshot files directly in a directory."""
+    dates = []
+
+    # Parse the fixed-width name fields directly
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return dates
+
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if len(name) != 15 or not name.endswith(".json") or name[4] != "-" or name[7] != "-":
+                continue
+            try:
+                dates.append(date(int(name[:4]), int(name[5:7]), int(name[8:10])))
+            except ValueError:
+                continue
+
+    return dates
+
+
+def _as_float(value: Any) -> float | None:
+    """Coerce a feature value to float (None if missing or non-numeric)."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ParquetFeatureHistoryStorage(FeatureHistoryStorage):
+    """
+    Feature history backed by a single Parquet file per ticker.
+
+    Same interface as FeatureHistoryStorage, but a ticker's whole history
+    is one columnar file: load_dataframe is a single read with the date
+    range pushed down as a filter, instead of one JSON file per day.
+    Feature values are stored as float64 columns, zstd-compressed;
+    non-numeric values are stored as missing, with a warning.
+    """
+
+    def _ticker_path(self, ticker: str) -> Path:
+        """Get the Parquet file for a ticker's history."""
+        return self.base_dir / f"{self._norm(ticker)}.parquet"
+
+    def _read_table(
+        self,
+        ticker: str,
+        filters: list[tuple] | None = None,
+        columns: list[str] | None = None,
+    ) -> "pa.Table | None":
+        """Read (part of) a ticker's history table, or None if absent."""
+        import pyarrow.parquet as pq
+
+        path = self._ticker_path(ticker)
+        if not path.exists():
+            return None
+        # Memory-mapped: pages are served from the page cache without a copy
+        return pq.read_table(path, filters=filters, columns=columns, memory_map=True)
+
+    def _write_table(self, ticker: str, table: "pa.Table") -> None:
+        """Replace a ticker's history file atomically."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        sink = pa.BufferOutputStream()
+        pq.write_table(
+            table,
+            sink,
+            compression=_PARQUET_COMPRESSION,
+            compression_level=_PARQUET_COMPRESSION_LEVEL,
+        )
+        json_io.write_atomic(self._ticker_path(ticker), sink.getvalue())
+
+    def _save_ticker(self, ticker: str, rows: dict[date, dict[str, Any]]) -> int:
+        """Merge one ticker's share of a batch with a single file rewrite."""
+        import pandas as pd
+        import pyarrow as pa
+
+        try:
+            saved_at = date.today()
+            records = []
+            non_numeric = set()
+            for trade_date, features in rows.items():
+                row = {}
+                for k, v in features.items():
+                    if k in _META_COLUMNS:
+                        continue
+                    row[k] = _as_float(v)
+                    if row[k] is None and v is not None:
+                        non_numeric.add(k)
+                row.update(date=trade_date, ticker=ticker, saved_at=saved_at)
+                records.append(row)
+            if non_numeric:
+                logger.warning(
+                    f"Storing non-numeric features for {ticker} as missing "
+                    f"(Parquet history holds floats only): {', '.join(sorted(non_numeric))}"
+                )
+            df = pd.DataFrame(records)
+
+            existing = self._read_table(ticker)
+            if existing is not None:
+                old = existing.to_pandas()
+                df = pd.concat([old[~old["date"].isin(list(rows))], df], ignore_index=True)
+
+            feature_cols = [c for c in df.columns if c not in _META_COLUMNS]
+            df[feature_cols] = df[feature_cols].astype("float64")
+            df = df.sort_values("date").reset_index(drop=True)
+
+            self._write_table(ticker, pa.Table.from_pandas(df, preserve_index=False))
+
+            logger.debug(f"Saved {len(rows)} feature history rows for {ticker}")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Failed to save feature history: {e}")
+            return 0
+
+    def load(self, ticker: str, trade_date: date) -> dict[str, Any] | None:
+        """
+        Load features for a specific date.
+
+        Args:
+            ticker: Stock ticker symbol
+            trade_date: Date to load
+
+        Returns:
+            Feature dictionary or None if not found
+        """
+        try:
+            table = self._read_table(ticker, filters=[("date", "==", trade_date)])
+            if table is None or table.num_rows == 0:
+                return None
+            row = table.slice(table.num_rows - 1).to_pylist()[0]
+            # NaN marks a missing value, as None does in the JSON backend
+            return {
+                k: None if isinstance(v, float) and v != v else v
+                for k, v in row.items()
+                if k not in _META_COLUMNS
+            }
+        except Exception as e:
+            logger.error(f"Failed to load feature history: {e}")
+            return None
+
+    def exists(self, ticker: str, trade_date: date) -> bool:
+        """Check if features exist for a date."""
+        return trade_date in self._cached_dates(ticker)[1]
+
+    def _dates_stamp(self, ticker: str) -> int | None:
+        """Modification time (ns) of the ticker's file, None if absent."""
+        try:
+            return self._ticker_path(ticker).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _scan_dates(self, ticker: str) -> list[date]:
+        """Read the stored dates for a ticker from the date column."""
+        table = self._read_table(ticker, columns=["date"])
+        if table is None:
+            return []
+        return table.column("date").to_pylist()
+
+    def load_dataframe(
+        self,
+        ticker: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        min_days: int = 0,
+    ) -> "pd.DataFrame":
+        """
+        Load feature history as a DataFrame.
+
+        Args:
+            ticker: Stock ticker symbol
+            start_date: Earliest date to include (optional)
+            end_date: Latest date to include (optional)
+            min_days: Minimum days required (raises if not met)
+
+        Returns:
+            DataFrame with one row per date
+
+        Raises:
+            ValueError: If insufficient data
+        """
+        import pandas as pd
+
+        filters = []
+        if start_date:
+            filters.append(("date", ">=", start_date))
+        if end_date:
+            filters.append(("date", "<=", end_date))
+
+        table = self._read_table(ticker, filters=filters or None)
+
+        if table is None or (table.num_rows == 0 and not filters):
+            if min_days > 0:
+                raise ValueError(f"No feature history for {ticker}")
+            return pd.DataFrame()
+
+        if table.num_rows < min_days:
+            raise ValueError(
+                f"Insufficient feature history for {ticker}: "
+                f"have {table.num_rows} days, need {min_days}"
+            )
+
+        if table.num_rows == 0:
+            return pd.DataFrame()
+
+        df = table.drop_columns(["saved_at"]).to_pandas()
+        df["ticker"] = df["ticker"].astype("category")
+        return df.sort_values("date").reset_index(drop=True)
+
+    def cleanup_old(self, ticker: str, keep_days: int = 365) -> int:
+        """
+        Remove feature history older than keep_days.
+
+        Args:
+            ticker: Stock ticker symbol
+            keep_days: Number of days to keep
+
+        Returns:
+            Number of rows removed
+        """
+        table = self._read_table(ticker)
+        if table is None:
+            return 0
+
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        cutoff = date.today() - timedelta(days=keep_days)
+        kept = table.filter(pc.greater_equal(table["date"], pa.scalar(cutoff)))
+        removed = table.num_rows - kept.num_rows
+
+        if removed > 0:
+            self._write_table(ticker, kept)
+            self._dates_cache.pop(self._norm(ticker), None)
+            logger.info(f"Removed {removed} old feature rows for {ticker}")
+
+        return removed
@@ -9,14 +9,21 @@ Storage structure:
     ├── SPY.json
     ├── QQQ.json
     └── ...
+
+For bulk use (many tickers, shared across processes) baselines can also be
+held in a TickerBaselineTable: one Arrow row per ticker, persisted as an
+uncompressed Feather file that is memory-mapped on read.
 """
 
-import json
 import logging
-from dataclasses import asdict
+import os
+import re
+from collections.abc import Iterable
+from dataclasses import MISSING, fields
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar, get_origin
 
 from obsidian.baseline.types import (
     BaselineUpdatePolicy,
@@ -26,10 +33,92 @@ from obsidian.baseline.types import (
     PriceEfficiencyBaseline,
     TickerBaseline,
 )
+from obsidian.core import json_io
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 
 logger = logging.getLogger(__name__)
 
+# baseline_date is serialized right after the ticker, so it sits in the file header;
+# the tail is checked for the closing brace before that date is trusted
+_BASELINE_DATE_RE = re.compile(rb'"baseline_date"\s*:\s*"(\d{4}-\d{2}-\d{2})"')
+_HEADER_BYTES = 256
+_TAIL_BYTES = 16
+
+_DIST_FIELDS = tuple(f.name for f in fields(DistributionStats) if f.init)
+
+BaselineComponent = TypeVar(
+    "BaselineComponent", DarkPoolBaseline, GreeksBaseline, PriceEfficiencyBaseline
+)
+
+
+def _field_kind(tp: Any) -> str:
+    """Classify a component field type for (de)serialization."""
+    if tp is DistributionStats or tp == DistributionStats | None:
+        return "dist"
+    if tp is BaselineUpdatePolicy:
+        return "policy"
+    if get_origin(tp) is tuple:
+        return "tuple"
+    return "value"
+
+
+# (name, kind, has_default) per field, derived once from the dataclass definitions
+_COMPONENT_FIELDS = {
+    cls: tuple(
+        (f.name, _field_kind(f.type), f.default is not MISSING) for f in fields(cls)
+    )
+    for cls in (DarkPoolBaseline, GreeksBaseline, PriceEfficiencyBaseline)
+}
+
+
+@lru_cache(maxsize=1)
+def _baseline_arrow_schema() -> "pa.Schema":
+    """
+    Arrow layout of a TickerBaseline row (BASELINE_ARROW_SCHEMA).
+
+    Components become structs and policies uint8 codes. Built on first use
+    so importing this module does not import pyarrow.
+    """
+    import pyarrow as pa
+
+    dist_type = pa.struct(
+        [(name, pa.int64() if name == "n_observations" else pa.float64()) for name in _DIST_FIELDS]
+    )
+    kind_types = {
+        "dist": dist_type,
+        "policy": pa.uint8(),
+        "tuple": pa.list_(pa.float64()),
+        "value": pa.float64(),
+    }
+    return pa.schema([
+        ("ticker", pa.string()),
+        ("baseline_date", pa.date32()),
+        ("lookback_days", pa.int32()),
+        ("data_start_date", pa.date32()),
+        ("data_end_date", pa.date32()),
+        ("observation_count", pa.int32()),
+        ("missing_data_pct", pa.float64()),
+        ("schema_version", pa.string()),
+        *(
+            (name, pa.struct([(f, kind_types[kind]) for f, kind, _ in _COMPONENT_FIELDS[cls]]))
+            for name, cls in (
+                ("dark_pool", DarkPoolBaseline),
+                ("greeks", GreeksBaseline),
+                ("price_efficiency", PriceEfficiencyBaseline),
+            )
+        ),
+    ])
+
+
+def __getattr__(name: str):
+    """Build BASELINE_ARROW_SCHEMA on first access (PEP 562)."""
+    if name == "BASELINE_ARROW_SCHEMA":
+        return _baseline_arrow_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class BaselineStorage:
     """
@@ -73,8 +162,7 @@ class BaselineStorage:
 
         try:
             data = self._serialize_baseline(baseline)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
+            json_io.dump(path, data)
             logger.info(f"Saved baseline for {baseline.ticker} to {path}")
             return True
         except Exception as e:
@@ -98,8 +186,7 @@ class BaselineStorage:
             return None
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_io.loads(path.read_bytes())
             return self._deserialize_baseline(data)
         except Exception as e:
             logger.error(f"Failed to load baseline for {ticker}: {e}")
@@ -119,11 +206,47 @@ class BaselineStorage:
         return [p.stem for p in self.base_dir.glob("*.json")]
 
     def get_baseline_age(self, ticker: str) -> int | None:
-        """Get age of baseline in days."""
-        baseline = self.load(ticker)
-        if baseline is None:
+        """
+        Get age of baseline in days.
+
+        The date is read from the file header when the file looks complete;
+        otherwise the whole baseline is loaded, so a file load() rejects has
+        no age. A complete-looking file that is corrupt past the header still
+        reports an age; load() remains the authority on validity.
+        """
+        path = self._baseline_path(ticker)
+
+        if not path.exists():
+            return None
+
+        try:
+            baseline_date = self._peek_baseline_date(path)
+        except Exception as e:
+            logger.error(f"Failed to read baseline date for {ticker}: {e}")
             return None
-        return (date.today() - baseline.baseline_date).days
+        if baseline_date is None:
+            baseline = self.load(ticker)
+            if baseline is None:
+                return None
+            baseline_date = baseline.baseline_date
+        return (date.today() - baseline_date).days
+
+    def _peek_baseline_date(self, path: Path) -> date | None:
+        """
+        Read baseline_date from the file header without a full load.
+
+        Returns None when the header has no date or the file does not end
+        with the document's closing brace (e.g. truncated by a failed copy).
+        """
+        with path.open("rb") as f:
+            match = _BASELINE_DATE_RE.search(f.read(_HEADER_BYTES))
+            if match is None:
+                return None
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - _TAIL_BYTES))
+            if not f.read().rstrip().endswith(b"}"):
+                return None
+        return date.fromisoformat(match.group(1).decode())
 
     def _serialize_baseline(self, baseline: TickerBaseline) -> dict[str, Any]:
         """Convert baseline to JSON-serializable dict."""
@@ -136,69 +259,30 @@ class BaselineStorage:
             "observation_count": baseline.observation_count,
             "missing_data_pct": baseline.missing_data_pct,
             "schema_version": baseline.schema_version,
-            "dark_pool": self._serialize_dark_pool(baseline.dark_pool),
-            "greeks": self._serialize_greeks(baseline.greeks),
-            "price_efficiency": self._serialize_price_efficiency(baseline.price_efficiency),
+            "dark_pool": self._serialize_component(baseline.dark_pool),
+            "greeks": self._serialize_component(baseline.greeks),
+            "price_efficiency": self._serialize_component(baseline.price_efficiency),
         }
 
     def _serialize_distribution(self, dist: DistributionStats | None) -> dict | None:
         """Serialize DistributionStats."""
         if dist is None:
             return None
-        return {
-            "mean": dist.mean,
-            "std": dist.std,
-            "median": dist.median,
-            "mad": dist.mad,
-            "p25": dist.p25,
-            "p75": dist.p75,
-            "p90": dist.p90,
-            "p95": dist.p95,
-            "min_val": dist.min_val,
-            "max_val": dist.max_val,
-            "n_observations": dist.n_observations,
-        }
-
-    def _serialize_dark_pool(self, dp: DarkPoolBaseline) -> dict:
-        """Serialize DarkPoolBaseline."""
-        return {
-            "dark_share": self._serialize_distribution(dp.dark_share),
-            "dark_share_typical_range": list(dp.dark_share_typical_range),
-            "dark_volume": self._serialize_distribution(dp.dark_volume),
-            "daily_block_count": self._serialize_distribution(dp.daily_block_count),
-            "block_size": self._serialize_distribution(dp.block_size),
-            "block_premium": self._serialize_distribution(dp.block_premium),
-            "venue_shift": self._serialize_distribution(dp.venue_shift),
-            "policy": dp.policy.value,
-        }
-
-    def _serialize_greeks(self, greeks: GreeksBaseline) -> dict:
-        """Serialize GreeksBaseline."""
-        return {
-            "gex": self._serialize_distribution(greeks.gex),
-            "gex_positive_pct": greeks.gex_positive_pct,
-            "gex_negative_pct": greeks.gex_negative_pct,
-            "dex": self._serialize_distribution(greeks.dex),
-            "vanna": self._serialize_distribution(greeks.vanna),
-            "charm": self._serialize_distribution(greeks.charm),
-            "iv_atm": self._serialize_distribution(greeks.iv_atm),
-            "iv_atm_daily_change": self._serialize_distribution(greeks.iv_atm_daily_change),
-            "iv_skew": self._serialize_distribution(greeks.iv_skew),
-            "iv_rank": self._serialize_distribution(greeks.iv_rank),
-            "policy": greeks.policy.value,
-        }
-
-    def _serialize_price_efficiency(self, pe: PriceEfficiencyBaseline) -> dict:
-        """Serialize PriceEfficiencyBaseline."""
-        return {
-            "range_per_volume": self._serialize_distribution(pe.range_per_volume),
-            "range_per_volume_pct": self._serialize_distribution(pe.range_per_volume_pct),
-            "impact_per_volume": self._serialize_distribution(pe.impact_per_volume),
-            "price_efficiency": self._serialize_distribution(pe.price_efficiency),
-            "daily_range_pct": self._serialize_distribution(pe.daily_range_pct),
-            "close_position": self._serialize_distribution(pe.close_position),
-            "policy": pe.policy.value,
-        }
+        return {name: getattr(dist, name) for name in _DIST_FIELDS}
+
+    def _serialize_component(self, component: BaselineComponent) -> dict:
+        """Serialize a DarkPool/Greeks/PriceEfficiency baseline."""
+        data = {}
+        for name, kind, _ in _COMPONENT_FIELDS[type(component)]:
+            value = getattr(component, name)
+            if kind == "dist":
+                value = self._serialize_distribution(value)
+            elif kind == "policy":
+                value = value.value
+            elif kind == "tuple":
+                value = list(value)
+            data[name] = value
+        return data
 
     def _deserialize_baseline(self, data: dict) -> TickerBaseline:
         """Convert JSON dict back to TickerBaseline."""
@@ -211,69 +295,167 @@ class BaselineStorage:
             observation_count=data["observation_count"],
             missing_data_pct=data["missing_data_pct"],
             schema_version=data.get("schema_version", "1.0"),
-            dark_pool=self._deserialize_dark_pool(data["dark_pool"]),
-            greeks=self._deserialize_greeks(data["greeks"]),
-            price_efficiency=self._deserialize_price_efficiency(data["price_efficiency"]),
+            dark_pool=self._deserialize_component(DarkPoolBaseline, data["dark_pool"]),
+            greeks=self._deserialize_component(GreeksBaseline, data["greeks"]),
+            price_efficiency=self._deserialize_component(
+                PriceEfficiencyBaseline, data["price_efficiency"]
+            ),
         )
 
     def _deserialize_distribution(self, data: dict | None) -> DistributionStats | None:
         """Deserialize DistributionStats."""
         if data is None:
             return None
-        return DistributionStats(
-            mean=data["mean"],
-            std=data["std"],
-            median=data["median"],
-            mad=data["mad"],
-            p25=data["p25"],
-            p75=data["p75"],
-            p90=data["p90"],
-            p95=data["p95"],
-            min_val=data["min_val"],
-            max_val=data["max_val"],
-            n_observations=data["n_observations"],
-        )
+        return DistributionStats(*[data[name] for name in _DIST_FIELDS])
+
+    def _deserialize_component(
+        self, cls: type[BaselineComponent], data: dict
+    ) -> BaselineComponent:
+        """Deserialize a DarkPool/Greeks/PriceEfficiency baseline."""
+        kwargs = {}
+        for name, kind, has_default in _COMPONENT_FIELDS[cls]:
+            if name not in data and has_default:
+                continue
+            value = data[name]
+            if kind == "dist":
+                value = self._deserialize_distribution(value)
+            elif kind == "policy":
+                value = BaselineUpdatePolicy(value)
+            elif kind == "tuple":
+                value = tuple(value)
+            kwargs[name] = value
+        return cls(**kwargs)
+
+
+class TickerBaselineTable:
+    """
+    Columnar store of many ticker baselines (one Arrow row per ticker).
 
-    def _deserialize_dark_pool(self, data: dict) -> DarkPoolBaseline:
-        """Deserialize DarkPoolBaseline."""
-        return DarkPoolBaseline(
-            dark_share=self._deserialize_distribution(data["dark_share"]),
-            dark_share_typical_range=tuple(data["dark_share_typical_range"]),
-            dark_volume=self._deserialize_distribution(data.get("dark_volume")),
-            daily_block_count=self._deserialize_distribution(data["daily_block_count"]),
-            block_size=self._deserialize_distribution(data["block_size"]),
-            block_premium=self._deserialize_distribution(data["block_premium"]),
-            venue_shift=self._deserialize_distribution(data["venue_shift"]),
-            policy=BaselineUpdatePolicy(data["policy"]),
-        )
+    Holding N baselines as one pa.Table avoids N object graphs of
+    dataclasses; get() rebuilds a TickerBaseline for a single ticker on
+    demand. Distribution stats stay float64 so rebuilt baselines equal
+    the ones loaded from JSON.
+    """
 
-    def _deserialize_greeks(self, data: dict) -> GreeksBaseline:
-        """Deserialize GreeksBaseline."""
-        return GreeksBaseline(
-            gex=self._deserialize_distribution(data["gex"]),
-            gex_positive_pct=data["gex_positive_pct"],
-            gex_negative_pct=data["gex_negative_pct"],
-            dex=self._deserialize_distribution(data["dex"]),
-            vanna=self._deserialize_distribution(data.get("vanna")),
-            charm=self._deserialize_distribution(data.get("charm")),
-            iv_atm=self._deserialize_distribution(data.get("iv_atm")),
-            iv_atm_daily_change=self._deserialize_distribution(data.get("iv_atm_daily_change")),
-            iv_skew=self._deserialize_distribution(data.get("iv_skew")),
-            iv_rank=self._deserialize_distribution(data.get("iv_rank")),
-            policy=BaselineUpdatePolicy(data["policy"]),
-        )
+    def __init__(self, table: "pa.Table"):
+        """
+        Wrap an Arrow table with BASELINE_ARROW_SCHEMA.
 
-    def _deserialize_price_efficiency(self, data: dict) -> PriceEfficiencyBaseline:
-        """Deserialize PriceEfficiencyBaseline."""
-        return PriceEfficiencyBaseline(
-            range_per_volume=self._deserialize_distribution(data["range_per_volume"]),
-            range_per_volume_pct=self._deserialize_distribution(data["range_per_volume_pct"]),
-            impact_per_volume=self._deserialize_distribution(data["impact_per_volume"]),
-            price_efficiency=self._deserialize_distribution(data["price_efficiency"]),
-            daily_range_pct=self._deserialize_distribution(data["daily_range_pct"]),
-            close_position=self._deserialize_distribution(data["close_position"]),
-            policy=BaselineUpdatePolicy(data["policy"]),
-        )
+        Args:
+            table: Table with one row per ticker
+        """
+        self.table = table
+        self._rows = {t.upper(): i for i, t in enumerate(table.column("ticker").to_pylist())}
+
+    @classmethod
+    def from_baselines(cls, baselines: Iterable[TickerBaseline]) -> "TickerBaselineTable":
+        """Build a table from TickerBaseline objects."""
+        import pyarrow as pa
+
+        rows = [_baseline_to_row(b) for b in baselines]
+        return cls(pa.Table.from_pylist(rows, schema=_baseline_arrow_schema()))
+
+    @classmethod
+    def read_feather(cls, path: Path | str) -> "TickerBaselineTable":
+        """Memory-map a table written by write_feather()."""
+        import pyarrow.feather as feather
+
+        return cls(feather.read_table(path, memory_map=True))
+
+    def write_feather(self, path: Path | str) -> None:
+        """Write the table as uncompressed Feather, so readers can memory-map it."""
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        sink = pa.BufferOutputStream()
+        feather.write_feather(self.table, sink, compression="uncompressed")
+        json_io.write_atomic(Path(path), sink.getvalue())
+
+    @property
+    def tickers(self) -> list[str]:
+        """Tickers in row order."""
+        return self.table.column("ticker").to_pylist()
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker.upper() in self._rows
+
+    def get(self, ticker: str) -> TickerBaseline | None:
+        """Rebuild the baseline for one ticker, or None if it has no row."""
+        i = self._rows.get(ticker.upper())
+        if i is None:
+            return None
+        return _baseline_from_row(self.table.slice(i, 1).to_pylist()[0])
+
+    def to_baselines(self) -> list[TickerBaseline]:
+        """Rebuild every baseline, in row order."""
+        return [_baseline_from_row(row) for row in self.table.to_pylist()]
+
+
+def _baseline_to_row(baseline: TickerBaseline) -> dict[str, Any]:
+    """Flatten a TickerBaseline into a row matching BASELINE_ARROW_SCHEMA."""
+    row = {
+        "ticker": baseline.ticker,
+        "baseline_date": baseline.baseline_date,
+        "lookback_days": baseline.lookback_days,
+        "data_start_date": baseline.data_start_date,
+        "data_end_date": baseline.data_end_date,
+        "observation_count": baseline.observation_count,
+        "missing_data_pct": baseline.missing_data_pct,
+        "schema_version": baseline.schema_version,
+    }
+    for name in ("dark_pool", "greeks", "price_efficiency"):
+        component = getattr(baseline, name)
+        data = {}
+        for field_name, kind, _ in _COMPONENT_FIELDS[type(component)]:
+            value = getattr(component, field_name)
+            if kind == "dist":
+                value = None if value is None else {f: getattr(value, f) for f in _DIST_FIELDS}
+            elif kind == "policy":
+                value = value.to_code()
+            elif kind == "tuple":
+                value = list(value)
+            data[field_name] = value
+        row[name] = data
+    return row
+
+
+def _baseline_from_row(row: dict[str, Any]) -> TickerBaseline:
+    """Rebuild a TickerBaseline from a BASELINE_ARROW_SCHEMA row."""
+    components = {}
+    for name, cls in (
+        ("dark_pool", DarkPoolBaseline),
+        ("greeks", GreeksBaseline),
+        ("price_efficiency", PriceEfficiencyBaseline),
+    ):
+        data = row[name]
+        kwargs = {}
+        for field_name, kind, _ in _COMPONENT_FIELDS[cls]:
+            value = data[field_name]
+            if kind == "dist":
+                value = None if value is None else DistributionStats(
+                    *[value[f] for f in _DIST_FIELDS]
+                )
+            elif kind == "policy":
+                value = BaselineUpdatePolicy.from_code(value)
+            elif kind == "tuple":
+                value = tuple(value)
+            kwargs[field_name] = value
+        components[name] = cls(**kwargs)
+
+    return TickerBaseline(
+        ticker=row["ticker"],
+        baseline_date=row["baseline_date"],
+        lookback_days=row["lookback_days"],
+        data_start_date=row["data_start_date"],
+        data_end_date=row["data_end_date"],
+        observation_count=row["observation_count"],
+        missing_data_pct=row["missing_data_pct"],
+        schema_version=row["schema_version"],
+        **components,
+    )
 
 
 def format_baseline_report(baseline: TickerBaseline) -> str:
@@ -282,97 +464,81 @@ def format_baseline_report(baseline: TickerBaseline) -> str:
 
     Used for diagnostics and documentation.
     """
-    lines = [
-        f"{'='*60}",
-        f"BASELINE PROFILE: {baseline.ticker}",
-        f"{'='*60}",
-        f"",
-        f"Generated: {baseline.baseline_date}",
-        f"Lookback: {baseline.lookback_days} trading days",
-        f"Data range: {baseline.data_start_date} to {baseline.data_end_date}",
-        f"Observations: {baseline.observation_count}",
-        f"Missing data: {baseline.missing_data_pct:.1f}%",
-        f"",
-        f"{'─'*60}",
-        f"A) DARK POOL / VENUE BASELINES",
-        f"{'─'*60}",
-        f"",
-    ]
-
+    rule = "=" * 60
+    sep = "─" * 60
     dp = baseline.dark_pool
-    lines.extend([
-        f"Dark Pool Share:",
-        f"  Mean: {dp.dark_share.mean:.1f}%",
-        f"  Std: {dp.dark_share.std:.1f}%",
-        f"  Typical range: {dp.dark_share_typical_range[0]:.1f}% - {dp.dark_share_typical_range[1]:.1f}%",
-        f"",
-        f"Block Trades:",
-        f"  Daily count (median): {dp.daily_block_count.median:.0f}",
-        f"  Block size (75th %ile): {dp.block_size.p75:,.0f} shares",
-        f"  Block size (90th %ile): {dp.block_size.p90:,.0f} shares",
-        f"",
-    ])
-
-    lines.extend([
-        f"{'─'*60}",
-        f"B) OPTIONS / GREEKS BASELINES",
-        f"{'─'*60}",
-        f"",
-    ])
-
     g = baseline.greeks
-    lines.extend([
-        f"Gamma Exposure (GEX):",
-        f"  Mean: {g.gex.mean:,.0f}",
-        f"  Std: {g.gex.std:,.0f}",
-        f"  MAD: {g.gex.mad:,.0f}",
-        f"  Positive days: {g.gex_positive_pct:.0f}%",
-        f"  Negative days: {g.gex_negative_pct:.0f}%",
-        f"",
-        f"Delta Exposure (DEX):",
-        f"  Mean: {g.dex.mean:,.0f}",
-        f"  Std: {g.dex.std:,.0f}",
-        f"",
-    ])
-
-    if g.iv_atm:
-        lines.extend([
-            f"ATM Implied Volatility:",
-            f"  Mean: {g.iv_atm.mean:.1f}%",
-            f"  Std: {g.iv_atm.std:.1f}%",
-            f"",
-        ])
-
-    if g.iv_skew:
-        lines.extend([
-            f"IV Skew:",
-            f"  Mean: {g.iv_skew.mean:.2f}",
-            f"  Std: {g.iv_skew.std:.2f}",
-            f"",
-        ])
-
-    lines.extend([
-        f"{'─'*60}",
-        f"C) PRICE IMPACT / EFFICIENCY BASELINES",
-        f"{'─'*60}",
-        f"",
-    ])
-
     pe = baseline.price_efficiency
-    lines.extend([
-        f"Daily Range:",
-        f"  Mean: {pe.daily_range_pct.mean:.2f}%",
-        f"  Std: {pe.daily_range_pct.std:.2f}%",
-        f"",
-        f"Price Efficiency:",
-        f"  Mean: {pe.price_efficiency.mean:.1f}",
-        f"  Std: {pe.price_efficiency.std:.1f}",
-        f"",
-        f"Impact per Volume:",
-        f"  Mean: {pe.impact_per_volume.mean:.4f}",
-        f"  Std: {pe.impact_per_volume.std:.4f}",
-        f"",
-        f"{'='*60}",
-    ])
 
-    return "\n".join(lines)
+    iv_atm = (
+        f"ATM Implied Volatility:\n"
+        f"  Mean: {g.iv_atm.mean:.1f}%\n"
+        f"  Std: {g.iv_atm.std:.1f}%\n"
+        f"\n"
+        if g.iv_atm else ""
+    )
+    iv_skew = (
+        f"IV Skew:\n"
+        f"  Mean: {g.iv_skew.mean:.2f}\n"
+        f"  Std: {g.iv_skew.std:.2f}\n"
+        f"\n"
+        if g.iv_skew else ""
+    )
+
+    return f"""\
+{rule}
+BASELINE PROFILE: {baseline.ticker}
+{rule}
+
+Generated: {baseline.baseline_date}
+Lookback: {baseline.lookback_days} trading days
+Data range: {baseline.data_start_date} to {baseline.data_end_date}
+Observations: {baseline.observation_count}
+Missing data: {baseline.missing_data_pct:.1f}%
+
+{sep}
+A) DARK POOL / VENUE BASELINES
+{sep}
+
+Dark Pool Share:
+  Mean: {dp.dark_share.mean:.1f}%
+  Std: {dp.dark_share.std:.1f}%
+  Typical range: {dp.dark_share_typical_range[0]:.1f}% - {dp.dark_share_typical_range[1]:.1f}%
+
+Block Trades:
+  Daily count (median): {dp.daily_block_count.median:.0f}
+  Block size (75th %ile): {dp.block_size.p75:,.0f} shares
+  Block size (90th %ile): {dp.block_size.p90:,.0f} shares
+
+{sep}
+B) OPTIONS / GREEKS BASELINES
+{sep}
+
+Gamma Exposure (GEX):
+  Mean: {g.gex.mean:,.0f}
+  Std: {g.gex.std:,.0f}
+  MAD: {g.gex.mad:,.0f}
+  Positive days: {g.gex_positive_pct:.0f}%
+  Negative days: {g.gex_negative_pct:.0f}%
+
+Delta Exposure (DEX):
+  Mean: {g.dex.mean:,.0f}
+  Std: {g.dex.std:,.0f}
+
+{iv_atm}{iv_skew}{sep}
+C) PRICE IMPACT / EFFICIENCY BASELINES
+{sep}
+
+Daily Range:
+  Mean: {pe.daily_range_pct.mean:.2f}%
+  Std: {pe.daily_range_pct.std:.2f}%
+
+Price Efficiency:
+  Mean: {pe.price_efficiency.mean:.1f}
+  Std: {pe.price_efficiency.std:.1f}
+
+Impact per Volume:
+  Mean: {pe.impact_per_volume.mean:.4f}
+  Std: {pe.impact_per_volume.std:.4f}
+
+{rule}"""
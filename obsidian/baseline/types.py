@@ -9,10 +9,53 @@ DESIGN PRINCIPLE:
     Every deviation metric must reference a stored baseline.
 """
 
-from dataclasses import dataclass, field
+import importlib.util
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
 from datetime import date
 from enum import Enum
-from typing import TypeAlias
+from functools import lru_cache
+from typing import ClassVar, TypeAlias
+
+import numpy as np
+
+# Numba is optional and slow to import, so the batch kernel is only
+# compiled the first time a large batch needs it
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+def _as_float_array(values: np.ndarray) -> np.ndarray:
+    """View values as a float array, keeping float32 and widening everything else."""
+    values = np.asarray(values)
+    if values.dtype == np.float32:
+        return values
+    return values.astype(np.float64, copy=False)
+
+
+# Below this many values the NumPy path wins over the kernel's thread overhead
+_KERNEL_MIN_VALUES = 10_000
+
+
+@lru_cache(maxsize=1)
+def _percentile_rank_kernel() -> Callable[..., np.ndarray]:
+    """Compile the parallel Numba percentile-rank kernel."""
+    from numba import njit, prange
+
+    @njit(cache=True, parallel=True)
+    def kernel(values, min_val, median, max_val, lower_denom, upper_denom):
+        out = np.empty_like(values)
+        for i in prange(len(values)):
+            v = values[i]
+            if v <= min_val:
+                out[i] = 0.0
+            elif v >= max_val:
+                out[i] = 100.0
+            elif v <= median:
+                out[i] = 50.0 * (v - min_val) / lower_denom
+            else:
+                out[i] = 50.0 + 50.0 * (v - median) / upper_denom
+        return out
+
+    return kernel
 
 
 class BaselineUpdatePolicy(str, Enum):
@@ -29,8 +72,21 @@ class BaselineUpdatePolicy(str, Enum):
     LOCKED = "locked"
     DYNAMIC = "dynamic"
 
+    def to_code(self) -> int:
+        """Compact code for uint8 columns (LOCKED=0, DYNAMIC=1)."""
+        return _POLICY_CODES[self]
+
+    @classmethod
+    def from_code(cls, code: int) -> "BaselineUpdatePolicy":
+        """Policy for a code produced by to_code()."""
+        return _POLICIES_BY_CODE[code]
 
-@dataclass(frozen=True)
+
+_POLICIES_BY_CODE = (BaselineUpdatePolicy.LOCKED, BaselineUpdatePolicy.DYNAMIC)
+_POLICY_CODES = {policy: code for code, policy in enumerate(_POLICIES_BY_CODE)}
+
+
+@dataclass(frozen=True, slots=True)
 class DistributionStats:
     """
     Statistical summary of a metric's distribution.
@@ -50,26 +106,114 @@ class DistributionStats:
     max_val: float
     n_observations: int
 
-    @property
-    def iqr(self) -> float:
-        """Interquartile range."""
-        return self.p75 - self.p25
-
-    @property
-    def normal_range_low(self) -> float:
-        """Lower bound of normal range (mean - 1.5σ)."""
-        return self.mean - 1.5 * self.std
-
-    @property
-    def normal_range_high(self) -> float:
-        """Upper bound of normal range (mean + 1.5σ)."""
-        return self.mean + 1.5 * self.std
+    # Derived values, computed once in __post_init__ (not part of init/eq/repr)
+    iqr: float = field(init=False, repr=False, compare=False)  # Interquartile range
+    normal_range_low: float = field(init=False, repr=False, compare=False)  # mean - 1.5σ
+    normal_range_high: float = field(init=False, repr=False, compare=False)  # mean + 1.5σ
+    _inv_std: float = field(init=False, repr=False, compare=False)  # 0.0 when std == 0
+    _lower_denom: float = field(init=False, repr=False, compare=False)
+    _upper_denom: float = field(init=False, repr=False, compare=False)
+
+    # Structured record layout for bulk (array-of-baselines) handling
+    DTYPE: ClassVar[np.dtype] = np.dtype([
+        ("mean", "f8"),
+        ("std", "f8"),
+        ("median", "f8"),
+        ("mad", "f8"),
+        ("p25", "f8"),
+        ("p75", "f8"),
+        ("p90", "f8"),
+        ("p95", "f8"),
+        ("min_val", "f8"),
+        ("max_val", "f8"),
+        ("n_observations", "i8"),
+    ])
+
+    @classmethod
+    def _unsafe(
+        cls,
+        mean: float,
+        std: float,
+        median: float,
+        mad: float,
+        p25: float,
+        p75: float,
+        p90: float,
+        p95: float,
+        min_val: float,
+        max_val: float,
+        n_observations: int,
+    ) -> "DistributionStats":
+        """
+        Build an instance without running the generated __init__.
+
+        For trusted numeric output of the stats routines only: fields are
+        written through the slot descriptors directly (the frozen __init__
+        goes through object.__setattr__ once per field). Arguments must
+        already be Python floats/int.
+        """
+        obj = object.__new__(cls)
+        s = _DIST_SLOT_SETTERS
+        s[0](obj, mean)
+        s[1](obj, std)
+        s[2](obj, median)
+        s[3](obj, mad)
+        s[4](obj, p25)
+        s[5](obj, p75)
+        s[6](obj, p90)
+        s[7](obj, p95)
+        s[8](obj, min_val)
+        s[9](obj, max_val)
+        s[10](obj, n_observations)
+        obj._derive()
+        return obj
+
+    def __post_init__(self) -> None:
+        self._derive()
+
+    def _derive(self) -> None:
+        """Compute the cached derived values (the instance is frozen)."""
+        setattr_ = object.__setattr__
+        mean, std = self.mean, self.std
+        setattr_(self, "iqr", self.p75 - self.p25)
+        setattr_(self, "normal_range_low", mean - 1.5 * std)
+        setattr_(self, "normal_range_high", mean + 1.5 * std)
+        setattr_(self, "_inv_std", 0.0 if std == 0 else 1.0 / std)
+        setattr_(self, "_lower_denom", self.median - self.min_val + 1e-10)
+        setattr_(self, "_upper_denom", self.max_val - self.median + 1e-10)
+
+    def to_array(self) -> np.void:
+        """Convert to a structured NumPy record with layout DTYPE."""
+        return np.array(
+            (
+                self.mean, self.std, self.median, self.mad,
+                self.p25, self.p75, self.p90, self.p95,
+                self.min_val, self.max_val, self.n_observations,
+            ),
+            dtype=self.DTYPE,
+        )[()]
+
+    @classmethod
+    def from_array(cls, rec: np.void | np.ndarray) -> "DistributionStats":
+        """Create from a structured record (or 0-d array) with layout DTYPE."""
+        return cls(*np.asarray(rec, dtype=cls.DTYPE).tolist())
 
     def zscore(self, value: float) -> float:
         """Calculate z-score for a value against this distribution."""
         if self.std == 0:
             return 0.0
-        return (value - self.mean) / self.std
+        return (value - self.mean) * self._inv_std
+
+    def zscore_batch(self, values: np.ndarray) -> np.ndarray:
+        """
+        Calculate z-scores for an array of values (as zscore, elementwise).
+
+        float32 input is computed and returned as float32; anything else as float64.
+        """
+        values = _as_float_array(values)
+        if self.std == 0:
+            return np.zeros_like(values)
+        return (values - self.mean) * self._inv_std
 
     def percentile_rank(self, value: float) -> float:
         """Estimate percentile rank for a value (linear interpolation)."""
@@ -79,13 +223,41 @@ class DistributionStats:
             return 100.0
         if value <= self.median:
             # Linear interpolation in lower half
-            return 50.0 * (value - self.min_val) / (self.median - self.min_val + 1e-10)
+            return 50.0 * (value - self.min_val) / self._lower_denom
         else:
             # Linear interpolation in upper half
-            return 50.0 + 50.0 * (value - self.median) / (self.max_val - self.median + 1e-10)
+            return 50.0 + 50.0 * (value - self.median) / self._upper_denom
+
+    def percentile_rank_batch(self, values: np.ndarray) -> np.ndarray:
+        """
+        Estimate percentile ranks for an array of values (as percentile_rank).
+
+        float32 input is computed and returned as float32; anything else as float64.
+        """
+        values = _as_float_array(values)
+        if NUMBA_AVAILABLE and values.ndim == 1 and len(values) >= _KERNEL_MIN_VALUES:
+            return _percentile_rank_kernel()(
+                values, self.min_val, self.median, self.max_val,
+                self._lower_denom, self._upper_denom,
+            )
+
+        lower = 50.0 * (values - self.min_val) / self._lower_denom
+        upper = 50.0 + 50.0 * (values - self.median) / self._upper_denom
+        scalar = values.dtype.type
+        return np.select(
+            [values <= self.min_val, values >= self.max_val, values <= self.median],
+            [scalar(0.0), scalar(100.0), lower],
+            upper,
+        )
 
 
-@dataclass(frozen=True)
+# Slot __set__ methods of the init fields in order, used by DistributionStats._unsafe
+_DIST_SLOT_SETTERS = tuple(
+    getattr(DistributionStats, f.name).__set__ for f in fields(DistributionStats) if f.init
+)
+
+
+@dataclass(frozen=True, slots=True)
 class DarkPoolBaseline:
     """
     Baseline metrics for dark pool / off-exchange activity.
@@ -112,7 +284,7 @@ class DarkPoolBaseline:
     policy: BaselineUpdatePolicy = BaselineUpdatePolicy.LOCKED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GreeksBaseline:
     """
     Baseline metrics for options Greeks and dealer exposure.
@@ -142,7 +314,7 @@ class GreeksBaseline:
     policy: BaselineUpdatePolicy = BaselineUpdatePolicy.LOCKED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriceEfficiencyBaseline:
     """
     Baseline metrics for price impact and market efficiency.
@@ -166,7 +338,18 @@ class PriceEfficiencyBaseline:
     policy: BaselineUpdatePolicy = BaselineUpdatePolicy.LOCKED
 
 
-@dataclass
+# Feature names of the metrics in TickerBaseline.summary_vector(), in order
+SUMMARY_FEATURES = (
+    "dark_pool_ratio",
+    "gex",
+    "dex",
+    "iv_atm",
+    "iv_skew",
+    "price_efficiency",
+)
+
+
+@dataclass(slots=True)
 class TickerBaseline:
     """
     Complete baseline profile for a single ticker.
@@ -197,6 +380,26 @@ class TickerBaseline:
     # Version tracking
     schema_version: str = "1.0"
 
+    def summary_vector(self) -> tuple[np.ndarray, np.ndarray, tuple[str, ...]]:
+        """
+        Mean and std of the z-scored metrics as aligned arrays.
+
+        Returns:
+            Tuple of (means, stds, feature names); NaN where a metric
+            has no baseline distribution
+        """
+        stats = (
+            self.dark_pool.dark_share,
+            self.greeks.gex,
+            self.greeks.dex,
+            self.greeks.iv_atm,
+            self.greeks.iv_skew,
+            self.price_efficiency.price_efficiency,
+        )
+        means = np.array([np.nan if s is None else s.mean for s in stats])
+        stds = np.array([np.nan if s is None else s.std for s in stats])
+        return means, stds, SUMMARY_FEATURES
+
     def is_valid(self) -> bool:
         """Check if baseline has sufficient data quality."""
         return (
@@ -213,7 +416,7 @@ class TickerBaseline:
         return self.days_since_update(as_of) > max_age_days
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicState:
     """
     Dynamic (rolling) state metrics computed daily.
@@ -244,5 +447,71 @@ class DynamicState:
     dex_sign: int = 0
 
 
+# Column dtypes for DynamicStateTable, in DynamicState field order
+_STATE_COLUMN_DTYPES: dict[str, np.dtype] = {
+    "rolling_window": np.dtype(np.int16),
+    **{
+        f.name: np.dtype(np.int8) if f.name.endswith("_sign") else np.dtype(np.float32)
+        for f in fields(DynamicState)
+        if f.name not in ("ticker", "trade_date", "rolling_window")
+    },
+}
+
+
+@dataclass
+class DynamicStateTable:
+    """
+    Columnar DynamicState for many tickers on one trade date.
+
+    One NumPy array per DynamicState field, one row per ticker, for
+    cross-sectional scans. Z-scores and percentiles are float32 with
+    NaN for missing values; signs are int8.
+    """
+
+    tickers: np.ndarray
+    trade_date: date
+    columns: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    @classmethod
+    def from_records(cls, states: list[DynamicState]) -> "DynamicStateTable":
+        """
+        Build a table from DynamicState objects.
+
+        Raises:
+            ValueError: If states is empty or spans more than one trade date
+        """
+        if not states:
+            raise ValueError("Cannot build DynamicStateTable from no states")
+        trade_date = states[0].trade_date
+        if any(s.trade_date != trade_date for s in states):
+            raise ValueError("All states must share one trade_date")
+
+        columns = {}
+        for name, dtype in _STATE_COLUMN_DTYPES.items():
+            values = [getattr(s, name) for s in states]
+            if dtype.kind == "f":
+                values = [np.nan if v is None else v for v in values]
+            columns[name] = np.array(values, dtype=dtype)
+
+        tickers = np.array([s.ticker for s in states], dtype=object)
+        return cls(tickers=tickers, trade_date=trade_date, columns=columns)
+
+    def to_records(self) -> list[DynamicState]:
+        """Convert back to DynamicState objects (NaN becomes None)."""
+        rows = zip(*(self.columns[name].tolist() for name in _STATE_COLUMN_DTYPES), strict=True)
+        names = tuple(_STATE_COLUMN_DTYPES)
+        return [
+            DynamicState(
+                ticker=ticker,
+                trade_date=self.trade_date,
+                **{k: None if v != v else v for k, v in zip(names, row, strict=True)},
+            )
+            for ticker, row in zip(self.tickers.tolist(), rows, strict=True)
+        ]
+
+
 # Type aliases
 BaselineProfile: TypeAlias = TickerBaseline
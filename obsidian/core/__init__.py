@@ -2,9 +2,11 @@
 
 from obsidian.core.types import (
     RegimeLabel,
+    RegimeLabelInt,
     RegimeResult,
     UnusualnessResult,
     FeatureSet,
+    FeatureSetBatch,
     NormalizationMethod,
 )
 from obsidian.core.config import Settings, load_config
@@ -19,9 +21,11 @@ from obsidian.core.exceptions import (
 __all__ = [
     # Types
     "RegimeLabel",
+    "RegimeLabelInt",
     "RegimeResult",
     "UnusualnessResult",
     "FeatureSet",
+    "FeatureSetBatch",
     "NormalizationMethod",
     # Config
     "Settings",
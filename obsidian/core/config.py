@@ -2,7 +2,6 @@
 Configuration management for OBSIDIAN MM.
 
 Loads settings from environment variables, Streamlit secrets, and YAML config files.
-Uses pydantic for validation.
 
 Priority order:
 1. Streamlit secrets (for cloud deployment)
@@ -11,123 +10,168 @@ Priority order:
 """
 
 import os
+import threading
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
 
 from obsidian.core.exceptions import ConfigurationError
 
+# Use the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed YAML files: path -> ((mtime_ns, size), data)
+_YAML_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+
+
+def _load_yaml(path: Path) -> dict[str, Any]:
+    """
+    Load and parse a YAML file.
+
+    The parsed document is cached and reused while the file's modification
+    time and size are unchanged; callers must treat it as read-only.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise ConfigurationError(f"Config file not found: {path}") from None
+
+    key = str(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+    _YAML_CACHE[key] = (stamp, data)
+    return data
+
+
+# API keys that may come from Streamlit secrets
+_SECRET_KEYS = ("UNUSUAL_WHALES_API_KEY", "POLYGON_API_KEY", "FMP_API_KEY")
+_SECRETS_LOADED = False
+
 
 def _load_streamlit_secrets() -> None:
     """
     Load Streamlit secrets into environment variables.
 
     This allows the app to work both locally (with .env) and
-    on Streamlit Cloud (with secrets).
+    on Streamlit Cloud (with secrets). Runs once per process.
     """
+    global _SECRETS_LOADED
+    if _SECRETS_LOADED:
+        return
+    _SECRETS_LOADED = True
+
     try:
         import streamlit as st
 
         # Check if running in Streamlit and secrets are available
-        if hasattr(st, "secrets") and len(st.secrets) > 0:
-            for key in ["UNUSUAL_WHALES_API_KEY", "POLYGON_API_KEY", "FMP_API_KEY"]:
-                if key in st.secrets and key not in os.environ:
-                    os.environ[key] = st.secrets[key]
+        secrets = getattr(st, "secrets", None)
+        if secrets is not None and len(secrets) > 0:
+            for key in _SECRET_KEYS:
+                if key not in os.environ and key in secrets:
+                    os.environ[key] = secrets[key]
     except Exception:
         # Not running in Streamlit or secrets not available
         pass
 
 
-class Settings(BaseSettings):
+# Environment variable for each Settings field (.env files use the same names)
+_ENV_VARS = {
+    "unusual_whales_api_key": "UNUSUAL_WHALES_API_KEY",
+    "polygon_api_key": "POLYGON_API_KEY",
+    "fmp_api_key": "FMP_API_KEY",
+    "data_dir": "DATA_DIR",
+    "config_dir": "CONFIG_DIR",
+    "log_level": "LOG_LEVEL",
+}
+_REQUIRED_SETTINGS = ("unusual_whales_api_key", "polygon_api_key", "fmp_api_key")
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """
     Application settings loaded from environment variables.
 
-    API keys and paths are loaded from .env file or environment.
+    API keys and paths are loaded from .env file or environment
+    (see from_env).
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # API Keys
-    unusual_whales_api_key: str = Field(
-        ...,
-        description="Unusual Whales API key",
-    )
-    polygon_api_key: str = Field(
-        ...,
-        description="Polygon.io API key",
-    )
-    fmp_api_key: str = Field(
-        ...,
-        description="Financial Modeling Prep API key",
-    )
+    unusual_whales_api_key: str
+    polygon_api_key: str
+    fmp_api_key: str
 
     # Paths
-    data_dir: Path = Field(
-        default=Path("data"),
-        description="Root directory for data storage",
-    )
-    config_dir: Path = Field(
-        default=Path("config"),
-        description="Directory containing YAML config files",
-    )
+    data_dir: Path = Path("data")  # Root directory for data storage
+    config_dir: Path = Path("config")  # Directory containing YAML config files
 
     # Logging
-    log_level: str = Field(
-        default="INFO",
-        description="Logging level",
-    )
-
-    @field_validator("data_dir", "config_dir", mode="before")
-    @classmethod
-    def resolve_path(cls, v: str | Path) -> Path:
-        """Convert string to Path and resolve."""
-        return Path(v).resolve()
+    log_level: str = "INFO"
+
+    # Derived data directories, set in __post_init__
+    raw_data_dir: Path = field(init=False, repr=False)  # Raw API responses
+    processed_data_dir: Path = field(init=False, repr=False)  # Processed data
+    baselines_dir: Path = field(init=False, repr=False)  # Ticker baselines
+
+    def __post_init__(self) -> None:
+        setattr_ = object.__setattr__
+        # Absolute without symlink resolution (no filesystem access)
+        data_dir = Path(self.data_dir).expanduser().absolute()
+        setattr_(self, "data_dir", data_dir)
+        setattr_(self, "config_dir", Path(self.config_dir).expanduser().absolute())
+        setattr_(self, "log_level", self.log_level.upper())
+        setattr_(self, "raw_data_dir", data_dir / "raw")
+        setattr_(self, "processed_data_dir", data_dir / "processed")
+        setattr_(self, "baselines_dir", data_dir / "baselines")
 
-    @field_validator("log_level", mode="before")
     @classmethod
-    def uppercase_log_level(cls, v: str) -> str:
-        """Ensure log level is uppercase."""
-        return v.upper()
-
-    @property
-    def raw_data_dir(self) -> Path:
-        """Directory for raw API responses."""
-        return self.data_dir / "raw"
-
-    @property
-    def processed_data_dir(self) -> Path:
-        """Directory for processed data."""
-        return self.data_dir / "processed"
-
-    @property
-    def baselines_dir(self) -> Path:
-        """Directory for ticker baselines."""
-        return self.data_dir / "baselines"
+    def from_env(cls, env_file: Path | str | None = ".env") -> "Settings":
+        """
+        Build settings from the environment.
+
+        Values in env_file are used for variables not set in the
+        environment itself; the file is read, not exported.
+
+        Raises:
+            ConfigurationError: If a required API key is missing
+        """
+        file_values = {}
+        if env_file is not None and Path(env_file).is_file():
+            file_values = {
+                k.upper(): v for k, v in dotenv_values(env_file).items() if v is not None
+            }
+
+        values = {}
+        for name, var in _ENV_VARS.items():
+            value = os.environ.get(var, file_values.get(var))
+            if value is not None:
+                values[name] = value
+
+        missing = [_ENV_VARS[name] for name in _REQUIRED_SETTINGS if name not in values]
+        if missing:
+            raise ConfigurationError(
+                f"Missing required settings: {', '.join(missing)}. "
+                f"Set them in the environment or in {env_file}."
+            )
+        return cls(**values)
 
 
 class SourcesConfig:
     """Configuration for API sources loaded from sources.yaml."""
 
     def __init__(self, config_path: Path):
-        self._config = self._load_yaml(config_path)
-
-    @staticmethod
-    def _load_yaml(path: Path) -> dict[str, Any]:
-        """Load and parse YAML file."""
-        if not path.exists():
-            raise ConfigurationError(f"Config file not found: {path}")
-
-        with open(path) as f:
-            return yaml.safe_load(f)
+        self._config = _load_yaml(config_path)
 
     @property
     def unusual_whales(self) -> dict[str, Any]:
@@ -164,16 +208,7 @@ class NormalizationConfig:
     """Configuration for normalization loaded from normalization.yaml."""
 
     def __init__(self, config_path: Path):
-        self._config = self._load_yaml(config_path)
-
-    @staticmethod
-    def _load_yaml(path: Path) -> dict[str, Any]:
-        """Load and parse YAML file."""
-        if not path.exists():
-            raise ConfigurationError(f"Config file not found: {path}")
-
-        with open(path) as f:
-            return yaml.safe_load(f)
+        self._config = _load_yaml(config_path)
 
     @property
     def default_window(self) -> int:
@@ -199,43 +234,39 @@ class RegimesConfig:
     """Configuration for regime classification loaded from regimes.yaml."""
 
     def __init__(self, config_path: Path):
-        self._config = self._load_yaml(config_path)
-
-    @staticmethod
-    def _load_yaml(path: Path) -> dict[str, Any]:
-        """Load and parse YAML file."""
-        if not path.exists():
-            raise ConfigurationError(f"Config file not found: {path}")
-
-        with open(path) as f:
-            return yaml.safe_load(f)
+        self._config = _load_yaml(config_path)
+        self._thresholds: dict[str, float] = self._config.get("thresholds", {})
+        self._regimes: dict[str, dict[str, Any]] = self._config.get("regimes", {})
+        self._required = tuple(self._config.get("required_features", []))
 
     @property
     def thresholds(self) -> dict[str, float]:
         """Threshold values for regime classification."""
-        return self._config.get("thresholds", {})
+        return self._thresholds
 
     @property
     def regimes(self) -> dict[str, dict[str, Any]]:
         """Regime definitions."""
-        return self._config.get("regimes", {})
+        return self._regimes
 
     @property
-    def required_features(self) -> list[str]:
+    def required_features(self) -> tuple[str, ...]:
         """Features required for classification."""
-        return self._config.get("required_features", [])
+        return self._required
 
     def get_threshold(self, name: str) -> float:
         """Get a specific threshold value."""
-        if name not in self.thresholds:
-            raise ConfigurationError(f"Unknown threshold: {name}")
-        return self.thresholds[name]
+        try:
+            return self._thresholds[name]
+        except KeyError:
+            raise ConfigurationError(f"Unknown threshold: {name}") from None
 
     def get_regime(self, name: str) -> dict[str, Any]:
         """Get a specific regime definition."""
-        if name not in self.regimes:
-            raise ConfigurationError(f"Unknown regime: {name}")
-        return self.regimes[name]
+        try:
+            return self._regimes[name]
+        except KeyError:
+            raise ConfigurationError(f"Unknown regime: {name}") from None
 
 
 @lru_cache(maxsize=1)
@@ -246,31 +277,49 @@ def get_settings() -> Settings:
     Loads Streamlit secrets first (if available) to support cloud deployment.
     """
     _load_streamlit_secrets()
-    return Settings()
+    return Settings.from_env()
+
+
+# Config file and class per config type, relative to Settings.config_dir
+_CONFIG_FILES = {
+    "sources": ("sources.yaml", SourcesConfig),
+    "normalization": ("normalization.yaml", NormalizationConfig),
+    "regimes": ("regimes.yaml", RegimesConfig),
+}
+
+# Config objects by file path; reused while the parsed YAML is unchanged
+_CONFIG_CACHE: dict[str, SourcesConfig | NormalizationConfig | RegimesConfig] = {}
+_CONFIG_LOCK = threading.Lock()
 
 
 def load_config(config_type: str) -> SourcesConfig | NormalizationConfig | RegimesConfig:
     """
     Load a specific configuration file.
 
+    Repeated calls return the same (read-only) config object until the
+    file changes on disk, which triggers a reload.
+
     Args:
         config_type: One of "sources", "normalization", "regimes"
 
     Returns:
         Appropriate config object
     """
-    settings = get_settings()
-    config_map = {
-        "sources": (settings.config_dir / "sources.yaml", SourcesConfig),
-        "normalization": (settings.config_dir / "normalization.yaml", NormalizationConfig),
-        "regimes": (settings.config_dir / "regimes.yaml", RegimesConfig),
-    }
-
-    if config_type not in config_map:
+    if config_type not in _CONFIG_FILES:
         raise ConfigurationError(
             f"Unknown config type: {config_type}. "
-            f"Valid types: {list(config_map.keys())}"
+            f"Valid types: {list(_CONFIG_FILES.keys())}"
         )
 
-    path, config_class = config_map[config_type]
-    return config_class(path)
+    filename, config_class = _CONFIG_FILES[config_type]
+    path = get_settings().config_dir / filename
+    key = str(path)
+
+    with _CONFIG_LOCK:
+        data = _load_yaml(path)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached._config is data:
+            return cached
+        config = config_class(path)
+        _CONFIG_CACHE[key] = config
+        return config
@@ -5,6 +5,10 @@ Central location for magic numbers, default values, and configuration constants.
 These values are documented and intentionally chosen - not optimized.
 """
 
+from types import MappingProxyType
+
+import numpy as np
+
 # ============================================================
 # NORMALIZATION CONSTANTS
 # ============================================================
@@ -26,16 +30,18 @@ OUTLIER_STD_THRESHOLD = 3.0
 # These are DIAGNOSTIC weights based on market microstructure relevance.
 # They are NOT optimized, NOT backtested. They reflect conceptual importance.
 
-SCORE_WEIGHTS = {
+# Read-only: the score engine and SCORE_WEIGHTS_ARRAY both rely on these values
+SCORE_WEIGHTS = MappingProxyType({
     "dark_pool_activity": 0.25,   # Dark pool as % of total
     "gamma_exposure": 0.25,       # Net gamma of dealers
     "venue_shift": 0.20,          # Day-over-day venue mix change
     "block_activity": 0.15,       # Institutional block trades
     "iv_skew": 0.15,              # Put/call IV skew
-}
+})
 
 # Verify weights sum to 1.0
-assert abs(sum(SCORE_WEIGHTS.values()) - 1.0) < 0.001, "Weights must sum to 1.0"
+_SCORE_WEIGHTS_TOTAL = sum(SCORE_WEIGHTS.values())
+assert abs(_SCORE_WEIGHTS_TOTAL - 1.0) < 0.001, "Weights must sum to 1.0"
 
 # ============================================================
 # REGIME CLASSIFICATION THRESHOLDS
@@ -128,3 +134,14 @@ SCORE_FEATURES = [
     "block_trade_count_zscore",
     "iv_skew_zscore",
 ]
+
+# Score weights as a read-only vector aligned with SCORE_FEATURES, for
+# scoring a (n_observations, len(SCORE_FEATURES)) z-score matrix at once
+SCORE_WEIGHTS_ARRAY = np.array(
+    [
+        SCORE_WEIGHTS[name]
+        for name in ("dark_pool_activity", "gamma_exposure", "venue_shift", "block_activity", "iv_skew")
+    ],
+    dtype=np.float64,
+)
+SCORE_WEIGHTS_ARRAY.flags.writeable = False
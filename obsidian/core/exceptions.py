@@ -2,13 +2,33 @@
 Custom exceptions for OBSIDIAN MM.
 
 All exceptions inherit from ObsidianError for easy catching.
+Exceptions that carry context declare __slots__ for it: fetchers can raise
+many of them (e.g. during rate limiting), and slots halve their size.
 """
 
+import copyreg
+
 
 class ObsidianError(Exception):
     """Base exception for all OBSIDIAN MM errors."""
 
-    pass
+    __slots__ = ()
+
+    def __reduce__(self):
+        """
+        Pickle by state rather than by re-calling __init__ with args.
+
+        Exception's default only keeps args and __dict__, which loses the
+        slotted context and breaks subclasses whose __init__ signature
+        differs from args (e.g. RateLimitError, InsufficientDataError).
+        """
+        state = dict(self.__dict__)
+        state["args"] = self.args
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return copyreg.__newobj__, (type(self),), state
 
 
 class ConfigurationError(ObsidianError):
@@ -20,6 +40,8 @@ class ConfigurationError(ObsidianError):
 class DataFetchError(ObsidianError):
     """Raised when data cannot be fetched from an API."""
 
+    __slots__ = ("source", "ticker", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -33,19 +55,19 @@ class DataFetchError(ObsidianError):
         self.status_code = status_code
 
     def __str__(self) -> str:
-        parts = [self.args[0]]
-        if self.source:
-            parts.append(f"source={self.source}")
-        if self.ticker:
-            parts.append(f"ticker={self.ticker}")
-        if self.status_code:
-            parts.append(f"status={self.status_code}")
-        return " | ".join(parts)
+        return (
+            f"{self.args[0]}"
+            + (f" | source={self.source}" if self.source else "")
+            + (f" | ticker={self.ticker}" if self.ticker else "")
+            + (f" | status={self.status_code}" if self.status_code else "")
+        )
 
 
 class RateLimitError(DataFetchError):
     """Raised when API rate limit is exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         source: str,
@@ -62,6 +84,8 @@ class RateLimitError(DataFetchError):
 class InsufficientDataError(ObsidianError):
     """Raised when there's not enough data for computation."""
 
+    __slots__ = ("required", "available", "feature")
+
     def __init__(
         self,
         message: str,
@@ -85,6 +109,8 @@ class InsufficientDataError(ObsidianError):
 class ValidationError(ObsidianError):
     """Raised when data validation fails."""
 
+    __slots__ = ("field", "value")
+
     def __init__(
         self,
         message: str,
@@ -96,12 +122,11 @@ class ValidationError(ObsidianError):
         self.value = value
 
     def __str__(self) -> str:
-        parts = [self.args[0]]
-        if self.field:
-            parts.append(f"field={self.field}")
-        if self.value is not None:
-            parts.append(f"value={self.value!r}")
-        return " | ".join(parts)
+        return (
+            f"{self.args[0]}"
+            + (f" | field={self.field}" if self.field else "")
+            + (f" | value={self.value!r}" if self.value is not None else "")
+        )
 
 
 class CacheError(ObsidianError):
@@ -113,6 +138,8 @@ class CacheError(ObsidianError):
 class FeatureExtractionError(ObsidianError):
     """Raised when feature extraction fails."""
 
+    __slots__ = ("feature", "ticker")
+
     def __init__(
         self,
         message: str,
@@ -127,6 +154,8 @@ class FeatureExtractionError(ObsidianError):
 class NormalizationError(ObsidianError):
     """Raised when normalization fails."""
 
+    __slots__ = ("method", "feature")
+
     def __init__(
         self,
         message: str,
@@ -0,0 +1,121 @@
+"""
+JSON serialization helpers for OBSIDIAN MM.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Files written by either backend can be read by the other: both
+write NaN/Infinity as null and unknown types via str(). The bytes are not
+identical, though. Compact output differs in separator spacing, the
+stdlib escapes non-ASCII characters, and numpy arrays are JSON lists under
+orjson but str() text under the stdlib. Don't compare files byte for byte.
+Older files containing bare NaN/Infinity tokens (as json.dump used to
+write them) are still read.
+
+Files are written atomically (temp file + rename), so readers never see a
+partially written document.
+"""
+
+import json
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+# Try to import orjson (optional, faster C implementation)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def dumps(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    Args:
+        data: JSON-compatible object (dates and other types fall back to str)
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+
+    indent_width = 2 if indent else None
+    try:
+        text = json.dumps(data, indent=indent_width, default=str, allow_nan=False)
+    except ValueError:
+        # Non-finite floats: write them as null, as orjson does
+        text = json.dumps(_finite_or_none(data), indent=indent_width, default=str)
+    return text.encode("utf-8")
+
+
+def _finite_or_none(data: Any) -> Any:
+    """Copy of data with NaN/Infinity floats replaced by None."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {k: _finite_or_none(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite_or_none(v) for v in data]
+    return data
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Accepts the bare NaN/Infinity tokens older files may contain (orjson
+    rejects them, so those documents are parsed by the standard library).
+
+    Args:
+        data: Encoded (UTF-8 bytes) or decoded JSON text
+
+    Returns:
+        Parsed object
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def write_atomic(path: Path | str, blob: bytes | memoryview) -> None:
+    """
+    Replace the contents of path with blob atomically.
+
+    The data is written to a temporary sibling which is then renamed over
+    path, so a crash mid-write leaves the previous file intact.
+
+    Args:
+        path: Destination file
+        blob: Bytes (or any buffer) to write
+    """
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def dump(path: Path | str, data: Any, indent: bool = True) -> None:
+    """
+    Serialize data to a JSON file atomically.
+
+    Args:
+        path: Destination file
+        data: JSON-compatible object
+        indent: Pretty-print with 2-space indentation
+    """
+    write_atomic(path, dumps(data, indent=indent))
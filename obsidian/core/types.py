@@ -4,12 +4,17 @@ Core type definitions for OBSIDIAN MM.
 Defines enums, dataclasses, and type aliases used throughout the system.
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields
 from datetime import date
-from enum import Enum
-from typing import TypeAlias
+from enum import Enum, IntEnum
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, TypeAlias
 
-import pandas as pd
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 
 class RegimeLabel(str, Enum):
@@ -33,22 +38,51 @@ class RegimeLabel(str, Enum):
     @property
     def priority(self) -> int:
         """Return classification priority (lower = checked first)."""
-        priorities = {
-            RegimeLabel.GAMMA_POSITIVE_CONTROL: 1,
-            RegimeLabel.GAMMA_NEGATIVE_VACUUM: 2,
-            RegimeLabel.DARK_DOMINANT_ACCUMULATION: 3,
-            RegimeLabel.ABSORPTION_LIKE: 4,
-            RegimeLabel.DISTRIBUTION_LIKE: 5,
-            RegimeLabel.NEUTRAL: 99,
-            RegimeLabel.UNDETERMINED: 100,  # Never matched by rules
-        }
-        return priorities[self]
+        return _REGIME_PRIORITY[self]
 
     @property
     def is_determinable(self) -> bool:
         """Whether this regime represents a determined state."""
         return self != RegimeLabel.UNDETERMINED
 
+    @property
+    def code(self) -> "RegimeLabelInt":
+        """Integer code of this label."""
+        return RegimeLabelInt[self.name]
+
+
+_REGIME_PRIORITY = MappingProxyType({
+    RegimeLabel.GAMMA_POSITIVE_CONTROL: 1,
+    RegimeLabel.GAMMA_NEGATIVE_VACUUM: 2,
+    RegimeLabel.DARK_DOMINANT_ACCUMULATION: 3,
+    RegimeLabel.ABSORPTION_LIKE: 4,
+    RegimeLabel.DISTRIBUTION_LIKE: 5,
+    RegimeLabel.NEUTRAL: 99,
+    RegimeLabel.UNDETERMINED: 100,  # Never matched by rules
+})
+
+
+class RegimeLabelInt(IntEnum):
+    """
+    Integer codes for RegimeLabel, for compact (int8) regime columns.
+
+    Same members in the same order as RegimeLabel; convert back with
+    .label for presentation.
+    """
+
+    GAMMA_POSITIVE_CONTROL = 0
+    GAMMA_NEGATIVE_VACUUM = 1
+    DARK_DOMINANT_ACCUMULATION = 2
+    ABSORPTION_LIKE = 3
+    DISTRIBUTION_LIKE = 4
+    NEUTRAL = 5
+    UNDETERMINED = 6
+
+    @property
+    def label(self) -> RegimeLabel:
+        """The RegimeLabel this code stands for."""
+        return RegimeLabel[self.name]
+
 
 class NormalizationMethod(str, Enum):
     """Available normalization methods."""
@@ -71,19 +105,25 @@ class UnusualnessLevel(str, Enum):
     @classmethod
     def from_score(cls, score: float) -> "UnusualnessLevel":
         """Convert numeric score to level."""
-        if score < 20:
-            return cls.VERY_NORMAL
-        elif score < 40:
-            return cls.NORMAL
-        elif score < 60:
-            return cls.SLIGHTLY_UNUSUAL
-        elif score < 80:
-            return cls.UNUSUAL
-        else:
-            return cls.HIGHLY_UNUSUAL
+        return _LEVELS[bisect_right(_LEVEL_BOUNDS, score)]
+
+    @classmethod
+    def from_scores(cls, scores: "np.ndarray") -> "np.ndarray":
+        """Convert an array of scores to an object array of levels (as from_score)."""
+        import numpy as np
+
+        return np.array(_LEVELS, dtype=object)[
+            np.searchsorted(_LEVEL_BOUNDS, scores, side="right")
+        ]
+
+
+# Lower score bound of each level after the first; a score equal to a
+# bound belongs to the higher level
+_LEVEL_BOUNDS = (20, 40, 60, 80)
+_LEVELS = tuple(UnusualnessLevel)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TopDriver:
     """A top contributing feature to a score or regime."""
 
@@ -98,7 +138,7 @@ class TopDriver:
         return abs(self.zscore)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegimeResult:
     """Result of regime classification for a single observation."""
 
@@ -108,7 +148,7 @@ class RegimeResult:
     confidence: float  # 0.0 to 1.0
     explanation: str
     top_drivers: tuple[TopDriver, ...]
-    raw_features: dict[str, float] = field(default_factory=dict)
+    raw_features: dict[str, float] | None = None  # None when not recorded
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -130,7 +170,7 @@ class RegimeResult:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoreComponent:
     """A component of the unusualness score."""
 
@@ -145,7 +185,7 @@ class ScoreComponent:
         return self.contribution * 100
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnusualnessResult:
     """Result of unusualness score calculation."""
 
@@ -186,8 +226,41 @@ class UnusualnessResult:
             ],
         }
 
+    @classmethod
+    def batch_to_records(cls, results: list["UnusualnessResult"]) -> dict[str, "np.ndarray"]:
+        """
+        Column arrays for many results, e.g. for pd.DataFrame or a parquet write.
+
+        Scalar fields become one column each; every component adds a
+        "<name>_zscore" and "<name>_contribution" column (NaN where a
+        result lacks that component). Explanations and top drivers are
+        left out.
+        """
+        import numpy as np
+
+        n = len(results)
+        records = {
+            "ticker": np.array([r.ticker for r in results], dtype=object),
+            "date": np.array([r.trade_date for r in results], dtype="datetime64[D]"),
+            "score": np.fromiter((r.score for r in results), dtype=np.float64, count=n),
+            "raw_score": np.fromiter((r.raw_score for r in results), dtype=np.float64, count=n),
+            "level": np.array([r.level.value for r in results], dtype=object),
+        }
+
+        names = dict.fromkeys(c.name for r in results for c in r.components)
+        for name in names:
+            zscores = np.full(n, np.nan)
+            contributions = np.full(n, np.nan)
+            records[f"{name}_zscore"] = zscores
+            records[f"{name}_contribution"] = contributions
+        for i, r in enumerate(results):
+            for c in r.components:
+                records[f"{c.name}_zscore"][i] = c.zscore
+                records[f"{c.name}_contribution"][i] = c.contribution
+        return records
 
-@dataclass
+
+@dataclass(slots=True)
 class FeatureSet:
     """
     Complete feature set for a ticker on a given date.
@@ -243,16 +316,24 @@ class FeatureSet:
     # Normalized versions (suffixed with _zscore or _pct)
     normalized: dict[str, float] = field(default_factory=dict)
 
-    def to_series(self) -> pd.Series:
+    def to_series(self) -> "pd.Series":
         """Convert to pandas Series for classification."""
-        data = {
-            # Raw features needed for regime classification
-            "dark_pool_ratio_pct": self.dark_pool_ratio,
-            "price_change_pct": self.price_change_pct,
-            # Normalized features
-            **{k: v for k, v in self.normalized.items()},
-        }
-        return pd.Series(data)
+        import numpy as np
+        import pandas as pd
+
+        # Raw features needed for regime classification, then normalized features
+        raw = (self.dark_pool_ratio, self.price_change_pct)
+        normalized = self.normalized
+        if normalized.keys().isdisjoint(_SERIES_RAW_KEYS):
+            index = _SERIES_RAW_KEYS + tuple(normalized)
+            values = [*raw, *normalized.values()]
+        else:
+            # Normalized values override raw ones of the same name
+            data = dict(zip(_SERIES_RAW_KEYS, raw, strict=True))
+            data.update(normalized)
+            index, values = tuple(data), list(data.values())
+        # None becomes NaN under the float64 dtype
+        return pd.Series(np.array(values, dtype=np.float64), index=index, copy=False)
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -279,6 +360,92 @@ class FeatureSet:
         }
 
 
+# FeatureSet feature fields (everything but identity and normalized)
+_FEATURE_FIELDS = tuple(
+    f.name for f in fields(FeatureSet) if f.name not in ("ticker", "trade_date", "normalized")
+)
+_INT_FEATURE_FIELDS = frozenset({"block_trade_count"})
+
+
+@dataclass(slots=True)
+class FeatureSetBatch:
+    """
+    Columnar FeatureSets for many tickers, for vectorized math across them.
+
+    One float64 array per feature field (NaN for missing), aligned by row
+    with tickers and dates. Normalized values are float32 columns over the
+    union of keys, NaN where a row lacks the key; z-scores and percentiles
+    need far less than float64 precision.
+    """
+
+    tickers: "np.ndarray"  # object
+    dates: "np.ndarray"  # datetime64[D]
+    columns: dict[str, "np.ndarray"]
+    normalized: dict[str, "np.ndarray"] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    @classmethod
+    def from_list(cls, feature_sets: list[FeatureSet]) -> "FeatureSetBatch":
+        """Stack FeatureSets into columns (None becomes NaN)."""
+        import numpy as np
+
+        n = len(feature_sets)
+        # One pass over the list; transposed so each column is contiguous
+        getter = attrgetter(*_FEATURE_FIELDS)
+        matrix = np.array([getter(fs) for fs in feature_sets], dtype=np.float64)
+        matrix = np.ascontiguousarray(matrix.reshape(n, len(_FEATURE_FIELDS)).T)
+
+        keys = dict.fromkeys(k for fs in feature_sets for k in fs.normalized)
+        normalized = {
+            key: np.fromiter(
+                (fs.normalized.get(key, np.nan) for fs in feature_sets),
+                dtype=np.float32,
+                count=n,
+            )
+            for key in keys
+        }
+
+        return cls(
+            tickers=np.array([fs.ticker for fs in feature_sets], dtype=object),
+            dates=np.array([fs.trade_date for fs in feature_sets], dtype="datetime64[D]"),
+            columns=dict(zip(_FEATURE_FIELDS, matrix, strict=True)),
+            normalized=normalized,
+        )
+
+    def row(self, i: int) -> FeatureSet:
+        """
+        Rebuild the FeatureSet at row i.
+
+        NaN features become None; NaN normalized values are left out.
+        """
+        values = {}
+        for name, column in self.columns.items():
+            value = column[i].item()
+            if value != value:
+                value = None
+            elif name in _INT_FEATURE_FIELDS:
+                value = int(value)
+            values[name] = value
+
+        normalized = {}
+        for key, column in self.normalized.items():
+            value = column[i].item()
+            if value == value:
+                normalized[key] = value
+
+        return FeatureSet(
+            ticker=self.tickers[i],
+            trade_date=self.dates[i].item(),
+            normalized=normalized,
+            **values,
+        )
+
+
+# Raw FeatureSet attributes carried into to_series(), by Series key
+_SERIES_RAW_KEYS = ("dark_pool_ratio_pct", "price_change_pct")
+
 # Type aliases for clarity
 Ticker: TypeAlias = str
 TradeDate: TypeAlias = date
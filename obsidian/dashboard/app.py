@@ -6,13 +6,15 @@ NOT a trading frontend. NOT a signal generator.
 """
 
 import asyncio
-import json
+import heapq
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 import streamlit as st
-import pandas as pd
 import plotly.graph_objects as go
+import pyarrow.parquet as pq
 import yaml
 from datetime import date, timedelta
 
@@ -20,6 +22,15 @@ from datetime import date, timedelta
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# Import the pipeline once at startup; if it cannot be imported the dashboard
+# still serves saved results and reports the error on "Run Pipeline"
+try:
+    from obsidian.pipeline.daily import DailyPipeline
+    PIPELINE_IMPORT_ERROR = None
+except ImportError as e:
+    DailyPipeline = None
+    PIPELINE_IMPORT_ERROR = e
+
 # Page config - must be first Streamlit command
 st.set_page_config(
     page_title="OBSIDIAN MM",
@@ -44,8 +55,9 @@ def get_data_collection_status(ticker: str) -> dict:
     if not ticker_dir.exists():
         return {"days_collected": 0, "days_required": MIN_OBSERVATIONS, "ready": False}
 
-    json_files = list(ticker_dir.glob("*.json"))
-    days_collected = len(json_files)
+    from obsidian.baseline.history import FeatureHistoryStorage
+
+    days_collected = FeatureHistoryStorage(FEATURE_HISTORY_DIR).count_observations(ticker)
 
     return {
         "days_collected": days_collected,
@@ -55,21 +67,28 @@ def get_data_collection_status(ticker: str) -> dict:
     }
 
 
-def check_baseline_exists(ticker: str) -> dict | None:
-    """Check if baseline exists for ticker and return basic info."""
-    baseline_file = BASELINES_DIR / f"{ticker}.json"
-    if baseline_file.exists():
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_baseline_index() -> dict[str, dict]:
+    """Basic info for every saved baseline, keyed by ticker (one directory scan)."""
+    from obsidian.core import json_io
+
+    index = {}
+    for baseline_file in BASELINES_DIR.glob("*.json"):
         try:
-            with open(baseline_file) as f:
-                data = json.load(f)
-                return {
-                    "exists": True,
-                    "baseline_date": data.get("baseline_date"),
-                    "lookback_days": data.get("lookback_days"),
-                }
+            data = json_io.loads(baseline_file.read_bytes())
         except Exception:
-            return None
-    return None
+            continue
+        index[baseline_file.stem] = {
+            "exists": True,
+            "baseline_date": data.get("baseline_date"),
+            "lookback_days": data.get("lookback_days"),
+        }
+    return index
+
+
+def check_baseline_exists(ticker: str) -> dict | None:
+    """Check if baseline exists for ticker and return basic info."""
+    return _load_baseline_index().get(ticker)
 
 
 @st.cache_data
@@ -91,74 +110,99 @@ def load_real_data(ticker: str, selected_date: date) -> dict | None:
     """
     data_file = DATA_DIR / ticker / f"{selected_date.isoformat()}.parquet"
 
-    if not data_file.exists():
+    try:
+        mtime_ns = data_file.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
 
     try:
-        df = pd.read_parquet(data_file)
-        if df.empty:
-            return None
-
-        # Parse the stored data
-        row = df.iloc[0]
+        return _read_result_file(str(data_file), mtime_ns, ticker, selected_date)
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        return None
 
-        # Handle nested JSON fields
-        regime_data = row.get("regime", {})
-        if isinstance(regime_data, str):
-            regime_data = json.loads(regime_data)
 
-        unusualness_data = row.get("unusualness", {})
-        if isinstance(unusualness_data, str):
-            unusualness_data = json.loads(unusualness_data)
+# Nested result columns read from a saved result file
+_NESTED_RESULT_COLUMNS = ("regime", "unusualness", "features")
 
-        features_data = row.get("features", {})
-        if isinstance(features_data, str):
-            features_data = json.loads(features_data)
 
-        # Extract normalized features for display
-        normalized = features_data.get("normalized", {})
+@st.cache_data(ttl=60, show_spinner=False)
+def _read_result_file(
+    data_file: str, mtime_ns: int, ticker: str, selected_date: date
+) -> dict | None:
+    """
+    Parse a saved pipeline result into display format.
 
-        return {
-            "ticker": ticker,
-            "date": selected_date.isoformat(),
-            "unusualness": {
-                "score": unusualness_data.get("score", 0),
-                "level": unusualness_data.get("level", "Unknown"),
-                "raw_score": unusualness_data.get("raw_score", 0),
-                "top_drivers": unusualness_data.get("top_drivers", []),
-            },
-            "regime": {
-                "label": regime_data.get("regime", "Unknown"),
-                "confidence": regime_data.get("confidence", 0),
-                "explanation": regime_data.get("explanation", "No data"),
-            },
-            "features": {
-                # All normalized features (z-scores and percentiles)
-                **{k: v for k, v in normalized.items()},
-                # Raw values (with _raw suffix to avoid conflicts)
-                "dark_pool_ratio_raw": features_data.get("dark_pool_ratio", 0),
-                "price_change_pct": features_data.get("price_change_pct", 0),
-                "gex_raw": features_data.get("gex", 0),
-                "dex_raw": features_data.get("dex", 0),
-                "block_trade_count_raw": features_data.get("block_trade_count", 0),
-                "iv_skew_raw": features_data.get("iv_skew", 0),
-                "dark_pool_volume": features_data.get("dark_pool_volume", 0),
-                "volume": features_data.get("volume", 0),
-            },
-        }
+    mtime_ns is part of the cache key only, so a re-run pipeline result is
+    picked up immediately while widget reruns reuse the parsed file.
+    """
+    from obsidian.core import json_io
 
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
+    table = pq.read_table(data_file, columns=list(_NESTED_RESULT_COLUMNS))
+    if table.num_rows == 0:
         return None
 
+    # Nested fields are structs (normalized is a map); older files hold JSON strings
+    parsed = {}
+    for name in _NESTED_RESULT_COLUMNS:
+        value = table.column(name)[0].as_py(maps_as_pydicts="strict")
+        if isinstance(value, (str, bytes)):
+            value = json_io.loads(value)
+        parsed[name] = value or {}
+    regime_data, unusualness_data, features_data = parsed.values()
+
+    # Extract normalized features for display
+    normalized = features_data.get("normalized", {})
+
+    return {
+        "ticker": ticker,
+        "date": selected_date.isoformat(),
+        "unusualness": {
+            "score": unusualness_data.get("score", 0),
+            "level": unusualness_data.get("level", "Unknown"),
+            "raw_score": unusualness_data.get("raw_score", 0),
+            "top_drivers": unusualness_data.get("top_drivers", []),
+        },
+        "regime": {
+            "label": regime_data.get("regime", "Unknown"),
+            "confidence": regime_data.get("confidence", 0),
+            "explanation": regime_data.get("explanation", "No data"),
+        },
+        "features": {
+            # All normalized features (z-scores and percentiles)
+            **{k: v for k, v in normalized.items()},
+            # Raw values (with _raw suffix to avoid conflicts)
+            "dark_pool_ratio_raw": features_data.get("dark_pool_ratio", 0),
+            "price_change_pct": features_data.get("price_change_pct", 0),
+            "gex_raw": features_data.get("gex", 0),
+            "dex_raw": features_data.get("dex", 0),
+            "block_trade_count_raw": features_data.get("block_trade_count", 0),
+            "iv_skew_raw": features_data.get("iv_skew", 0),
+            "dark_pool_volume": features_data.get("dark_pool_volume", 0),
+            "volume": features_data.get("volume", 0),
+        },
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def _pipeline_loop() -> asyncio.AbstractEventLoop:
+    """Event loop shared by all pipeline runs, running in a daemon thread."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="pipeline-loop", daemon=True).start()
+    return loop
+
 
 def run_pipeline_sync(ticker: str, trade_date: date) -> dict | None:
     """Run the pipeline synchronously and return results."""
-    try:
-        from obsidian.pipeline.daily import DailyPipeline
+    if DailyPipeline is None:
+        st.error(f"Pipeline unavailable: {PIPELINE_IMPORT_ERROR}")
+        return None
 
+    try:
         pipeline = DailyPipeline()
-        result = asyncio.run(pipeline.run(ticker, trade_date))
+        result = asyncio.run_coroutine_threadsafe(
+            pipeline.run(ticker, trade_date), _pipeline_loop()
+        ).result()
 
         # Save result
         pipeline.save_result(result)
@@ -203,6 +247,12 @@ def run_pipeline_sync(ticker: str, trade_date: date) -> dict | None:
 
 def render_score_gauge(score: float) -> go.Figure:
     """Render unusualness score as a gauge."""
+    return _score_gauge(round(score, 1))
+
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _score_gauge(score: float) -> go.Figure:
+    """Build the score gauge figure (shared between reruns; do not mutate)."""
     if score < 40:
         color = "green"
     elif score < 70:
@@ -235,21 +285,22 @@ def render_score_gauge(score: float) -> go.Figure:
     return fig
 
 
-def render_regime_badge(label: str, confidence: float) -> None:
-    """Render regime label as a styled badge."""
-    colors = {
-        "Gamma+ Control": "#4CAF50",
-        "Gamma- Liquidity Vacuum": "#f44336",
-        "Dark-Dominant Accumulation": "#9C27B0",
-        "Absorption-like": "#2196F3",
-        "Distribution-like": "#FF9800",
-        "Neutral / Mixed": "#9E9E9E",
-    }
+# Badge background per regime label (unknown labels use the neutral grey)
+REGIME_BADGE_COLORS = {
+    "Gamma+ Control": "#4CAF50",
+    "Gamma- Liquidity Vacuum": "#f44336",
+    "Dark-Dominant Accumulation": "#9C27B0",
+    "Absorption-like": "#2196F3",
+    "Distribution-like": "#FF9800",
+    "Neutral / Mixed": "#9E9E9E",
+}
 
-    color = colors.get(label, "#9E9E9E")
 
-    st.markdown(
-        f"""
+@lru_cache(maxsize=64)
+def _badge_html(label: str, confidence_pct: int) -> str:
+    """Badge HTML for a regime label and whole-percent confidence."""
+    color = REGIME_BADGE_COLORS.get(label, "#9E9E9E")
+    return f"""
         <div style="
             background-color: {color};
             color: white;
@@ -259,33 +310,49 @@ def render_regime_badge(label: str, confidence: float) -> None:
             margin: 10px 0;
         ">
             <h2 style="margin: 0; font-size: 1.5em;">{label}</h2>
-            <p style="margin: 5px 0 0 0;">Confidence: {confidence:.0%}</p>
+            <p style="margin: 5px 0 0 0;">Confidence: {confidence_pct}%</p>
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
+
+
+def render_regime_badge(label: str, confidence: float) -> None:
+    """Render regime label as a styled badge."""
+    st.markdown(_badge_html(label, round(confidence * 100)), unsafe_allow_html=True)
 
 
 def render_feature_bars(features: dict, has_baseline: bool = False) -> go.Figure:
     """Render feature z-scores and percentiles as horizontal bars."""
-    # Collect z-score features
-    zscore_features = {
-        k.replace("_zscore", "").replace("_", " ").title(): (v if v is not None else 0)
-        for k, v in features.items()
-        if k.endswith("_zscore")
-    }
-
-    # Collect percentile features (convert 0-100 to z-score-like -3 to +3 scale)
-    # 50th percentile = 0, 2.5th = -2, 97.5th = +2
+    # Hashable, quantized key so reruns with the same data reuse the figure
+    key = tuple(
+        (k, round(v, 2) if isinstance(v, float) else v) for k, v in features.items()
+    )
+    return _feature_bars(key, has_baseline)
+
+
+@lru_cache(maxsize=256)
+def _bar_label(key: str) -> str:
+    """Bar label for a z-score or percentile feature key."""
+    if key.endswith("_zscore"):
+        return key[:-7].replace("_", " ").title()
+    return f"{key[:-4].replace('_', ' ').title()} (pct)"
+
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _feature_bars(
+    items: tuple[tuple[str, float | None], ...],
+    has_baseline: bool,
+) -> go.Figure:
+    """Build the feature bar figure (shared between reruns; do not mutate)."""
+    # One pass: z-scores (missing as 0) and percentiles (missing skipped),
+    # percentiles converted to a pseudo z-score: (pct - 50) / 25
+    # 0% -> -2, 50% -> 0, 100% -> +2
+    zscore_features = {}
     pct_features = {}
-    for k, v in features.items():
-        if k.endswith("_pct") and k != "price_change_pct":
-            if v is not None:
-                # Convert percentile to pseudo z-score: (pct - 50) / 25
-                # 0% -> -2, 50% -> 0, 100% -> +2
-                pseudo_z = (v - 50) / 25
-                name = k.replace("_pct", "").replace("_", " ").title()
-                pct_features[f"{name} (pct)"] = pseudo_z
+    for k, v in items:
+        if k.endswith("_zscore"):
+            zscore_features[_bar_label(k)] = v if v is not None else 0
+        elif k.endswith("_pct") and k != "price_change_pct" and v is not None:
+            pct_features[_bar_label(k)] = (v - 50) / 25
 
     all_features = {**zscore_features, **pct_features}
 
@@ -347,6 +414,16 @@ def render_feature_bars(features: dict, has_baseline: bool = False) -> go.Figure
     return fig
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _latest_result_dates(ticker: str, n: int = 5) -> list[str]:
+    """The n most recent dates with saved results for ticker, oldest first."""
+    ticker_dir = DATA_DIR / ticker
+    if not ticker_dir.exists():
+        return []
+    stems = (f.stem for f in ticker_dir.glob("*.parquet"))
+    return sorted(heapq.nlargest(n, stems))
+
+
 def render_no_data_state(ticker: str, selected_date: date) -> None:
     """Render the no-data state with run button."""
     st.warning(f"No data found for **{ticker}** on **{selected_date}**")
@@ -366,6 +443,8 @@ def render_no_data_state(ticker: str, selected_date: date) -> None:
                 data = run_pipeline_sync(ticker, selected_date)
                 if data:
                     st.success("Pipeline completed!")
+                    _load_baseline_index.clear()
+                    _latest_result_dates.clear()
                     st.session_state["data"] = data
                     st.rerun()
                 else:
@@ -377,44 +456,47 @@ def render_no_data_state(ticker: str, selected_date: date) -> None:
 
     with col2:
         # Show available dates for this ticker
-        ticker_dir = DATA_DIR / ticker
-        if ticker_dir.exists():
-            available = sorted([f.stem for f in ticker_dir.glob("*.parquet")])
-            if available:
-                st.info(f"Available dates for {ticker}: {', '.join(available[-5:])}")
+        available = _latest_result_dates(ticker)
+        if available:
+            st.info(f"Available dates for {ticker}: {', '.join(available)}")
 
 
 def render_data_display(data: dict, baseline_info: dict | None = None) -> None:
     """Render the main data display."""
+    features = data["features"]
+    unusualness = data["unusualness"]
+    regime = data["regime"]
+    get = features.get
+
     # Top row: Score + Regime + Context
     col1, col2, col3 = st.columns([1, 1, 1])
 
     with col1:
         st.plotly_chart(
-            render_score_gauge(data["unusualness"]["score"]),
+            render_score_gauge(unusualness["score"]),
             width="stretch",
         )
 
     with col2:
         render_regime_badge(
-            data["regime"]["label"],
-            data["regime"]["confidence"],
+            regime["label"],
+            regime["confidence"],
         )
 
     with col3:
-        dark_pool_pct = data['features'].get('dark_pool_ratio_raw')
+        dark_pool_pct = get('dark_pool_ratio_raw')
         st.metric(
             "Dark Pool %",
             f"{dark_pool_pct:.1f}%" if dark_pool_pct is not None else "N/A",
         )
         # Show raw GEX if z-score is 0
-        gex_zscore = data['features'].get('gex_zscore', 0) or 0
+        gex_zscore = get('gex_zscore', 0) or 0
         if abs(gex_zscore) > 0.01:
             st.metric("GEX Z-Score", f"{gex_zscore:+.2f}")
         else:
-            gex_raw = data['features'].get('gex_raw', 0) or 0
+            gex_raw = get('gex_raw', 0) or 0
             st.metric("GEX (raw)", f"{gex_raw:,.0f}")
-        price_change = data['features'].get('price_change_pct')
+        price_change = get('price_change_pct')
         st.metric(
             "Price Change",
             f"{price_change:+.2f}%" if price_change is not None else "N/A",
@@ -422,14 +504,22 @@ def render_data_display(data: dict, baseline_info: dict | None = None) -> None:
 
     # Explanation section
     st.subheader("📝 Explanation")
-    st.info(data["regime"]["explanation"])
+    st.info(regime["explanation"])
 
     # Check if we have meaningful z-scores or percentiles
     has_baseline = baseline_info is not None and baseline_info.get("exists", False)
-    zscore_values = [v for k, v in data["features"].items() if k.endswith("_zscore") and v is not None]
-    # Percentiles: meaningful if they deviate from 50 (median)
-    pct_values = [v for k, v in data["features"].items() if k.endswith("_pct") and k != "price_change_pct" and v is not None]
-    has_meaningful_zscores = any(abs(v) > 0.01 for v in zscore_values) or any(abs(v - 50) > 5 for v in pct_values)
+    # Z-scores are meaningful away from 0, percentiles away from 50 (median)
+    has_meaningful_zscores = False
+    for k, v in features.items():
+        if v is None:
+            continue
+        if k.endswith("_zscore"):
+            if abs(v) > 0.01:
+                has_meaningful_zscores = True
+                break
+        elif k.endswith("_pct") and k != "price_change_pct" and abs(v - 50) > 5:
+            has_meaningful_zscores = True
+            break
 
     if not has_meaningful_zscores:
         if baseline_info and baseline_info.get("exists"):
@@ -460,16 +550,16 @@ def render_data_display(data: dict, baseline_info: dict | None = None) -> None:
             st.subheader("📈 Today's Raw Metrics")
             raw_c1, raw_c2, raw_c3, raw_c4 = st.columns(4)
             with raw_c1:
-                gex = data['features'].get('gex_raw') or 0
+                gex = get('gex_raw') or 0
                 st.metric("GEX (Gamma)", f"{gex:,.0f}", help="Net gamma exposure")
             with raw_c2:
-                dex = data['features'].get('dex_raw') or 0
+                dex = get('dex_raw') or 0
                 st.metric("DEX (Delta)", f"{dex:,.0f}", help="Net delta exposure")
             with raw_c3:
-                dp = data['features'].get('dark_pool_ratio_raw') or 0
+                dp = get('dark_pool_ratio_raw') or 0
                 st.metric("Dark Pool %", f"{dp:.1f}%", help="Dark pool volume ratio")
             with raw_c4:
-                blocks = data['features'].get('block_trade_count_raw') or 0
+                blocks = get('block_trade_count_raw') or 0
                 st.metric("Block Trades", f"{int(blocks)}", help="Institutional block trades")
 
     # Two columns: Drivers + Features
@@ -478,7 +568,7 @@ def render_data_display(data: dict, baseline_info: dict | None = None) -> None:
     with col1:
         st.subheader("🎯 Top Score Drivers")
         if has_meaningful_zscores:
-            for driver in data["unusualness"]["top_drivers"]:
+            for driver in unusualness["top_drivers"]:
                 direction = "↑" if driver.get("direction") == "elevated" else "↓"
                 contribution = driver.get("contribution_pct", 0) or 0
                 if isinstance(contribution, float):
@@ -498,7 +588,7 @@ def render_data_display(data: dict, baseline_info: dict | None = None) -> None:
         # Always show z-score chart
         has_baseline = baseline_info is not None and baseline_info.get("exists", False)
         st.plotly_chart(
-            render_feature_bars(data["features"], has_baseline=has_baseline),
+            render_feature_bars(features, has_baseline=has_baseline),
             width="stretch",
         )
 
@@ -506,19 +596,19 @@ def render_data_display(data: dict, baseline_info: dict | None = None) -> None:
     with st.expander("📊 Raw Feature Values", expanded=not has_meaningful_zscores):
         raw_col1, raw_col2, raw_col3 = st.columns(3)
         with raw_col1:
-            dp_pct = data['features'].get('dark_pool_ratio_raw')
+            dp_pct = get('dark_pool_ratio_raw')
             st.metric("Dark Pool %", f"{dp_pct:.1f}%" if dp_pct is not None else "N/A")
-            dp_vol = data['features'].get('dark_pool_volume') or 0
+            dp_vol = get('dark_pool_volume') or 0
             st.metric("Dark Pool Vol", f"{dp_vol:,.0f}")
         with raw_col2:
-            gex = data['features'].get('gex_raw') or 0
+            gex = get('gex_raw') or 0
             st.metric("GEX", f"{gex:,.0f}")
-            dex = data['features'].get('dex_raw') or 0
+            dex = get('dex_raw') or 0
             st.metric("DEX", f"{dex:,.0f}")
         with raw_col3:
-            blocks = data['features'].get('block_trade_count_raw') or 0
+            blocks = get('block_trade_count_raw') or 0
             st.metric("Block Trades", f"{blocks:.0f}")
-            vol = data['features'].get('volume') or 0
+            vol = get('volume') or 0
             st.metric("Volume", f"{vol:,.0f}")
 
 
@@ -590,6 +680,7 @@ def main():
         # Refresh button
         if st.button("🔄 Refresh Data", use_container_width=True):
             st.session_state.pop("data", None)
+            _load_baseline_index.clear()
             st.rerun()
 
         st.divider()
@@ -4,10 +4,81 @@ Explanation generator.
 Produces human-readable explanations for diagnostic results.
 """
 
+from types import MappingProxyType
 from typing import Any
 
 from obsidian.core.types import RegimeLabel, RegimeResult, TopDriver, UnusualnessResult
 
+# Driver direction arrows (anything not elevated reads as depressed)
+_DIRECTION_ARROWS = MappingProxyType({"elevated": "↑"})
+
+# Interpretation text per regime
+_REGIME_INTERPRETATIONS = MappingProxyType({
+    RegimeLabel.GAMMA_POSITIVE_CONTROL: (
+        "Dealers are net long gamma from options positioning. "
+        "They profit from mean reversion and will sell rallies / buy dips, "
+        "creating a stabilizing effect on price."
+    ),
+    RegimeLabel.GAMMA_NEGATIVE_VACUUM: (
+        "Dealers are net short gamma from options positioning. "
+        "They must chase price moves (buy highs / sell lows) to hedge, "
+        "which can amplify volatility and cause rapid directional moves."
+    ),
+    RegimeLabel.DARK_DOMINANT_ACCUMULATION: (
+        "Majority of volume is executing through dark pools with elevated "
+        "block activity. This often indicates institutional positioning "
+        "occurring away from lit exchanges."
+    ),
+    RegimeLabel.ABSORPTION_LIKE: (
+        "Despite negative delta exposure indicating selling pressure, "
+        "price remains stable. This suggests passive buyers are absorbing "
+        "the sell flow without moving price."
+    ),
+    RegimeLabel.DISTRIBUTION_LIKE: (
+        "Positive delta exposure indicates buying activity, yet price "
+        "is not appreciating. This suggests distribution - selling "
+        "into the bid support."
+    ),
+    RegimeLabel.NEUTRAL: (
+        "No dominant market microstructure pattern detected. "
+        "Metrics are within normal historical ranges."
+    ),
+})
+
+# Behavioral implications per regime
+_REGIME_IMPLICATIONS = MappingProxyType({
+    RegimeLabel.GAMMA_POSITIVE_CONTROL: (
+        "Expect dampened intraday volatility",
+        "Price may pin near high-gamma strikes at expiration",
+        "Mean reversion strategies historically favored",
+    ),
+    RegimeLabel.GAMMA_NEGATIVE_VACUUM: (
+        "Elevated risk of rapid directional moves",
+        "Stop-loss cascades more likely",
+        "Volatility expansion possible",
+    ),
+    RegimeLabel.DARK_DOMINANT_ACCUMULATION: (
+        "Institutional activity likely occurring",
+        "True positioning may not be reflected in lit market",
+        "Watch for eventual reversion to normal venue mix",
+    ),
+    RegimeLabel.ABSORPTION_LIKE: (
+        "Hidden support may be present",
+        "Accumulation phase possible",
+        "Monitor for exhaustion of buyers",
+    ),
+    RegimeLabel.DISTRIBUTION_LIKE: (
+        "Hidden selling pressure present",
+        "Distribution phase possible",
+        "Monitor for exhaustion of sellers",
+    ),
+    RegimeLabel.NEUTRAL: (
+        "No strong directional microstructure bias",
+        "Market operating in typical conditions",
+        "Other factors may dominate price action",
+    ),
+})
+
 
 class ExplanationGenerator:
     """
@@ -32,33 +103,28 @@ class ExplanationGenerator:
         Returns:
             Full human-readable explanation
         """
-        lines = []
-
-        # Header
-        lines.append(f"=== {regime_result.ticker} - {regime_result.trade_date} ===")
-        lines.append("")
-
-        # Unusualness summary
-        lines.append(f"UNUSUALNESS: {unusualness_result.score}/100 ({unusualness_result.level.value})")
-        lines.append(unusualness_result.explanation)
-        lines.append("")
-
-        # Regime summary
-        lines.append(f"REGIME: {regime_result.label.value}")
-        lines.append(f"Confidence: {regime_result.confidence:.0%}")
-        lines.append(regime_result.explanation)
-        lines.append("")
-
-        # Top drivers
-        lines.append("TOP DRIVERS:")
-        for driver in regime_result.top_drivers[:3]:
-            direction = "↑" if driver.direction == "elevated" else "↓"
-            lines.append(
-                f"  {direction} {driver.feature}: {driver.zscore:+.2f}σ "
-                f"({driver.contribution_pct:.0f}% contribution)"
-            )
-
-        return "\n".join(lines)
+        drivers = "".join(
+            f"\n  {_DIRECTION_ARROWS.get(d.direction, '↓')} {d.feature}: {d.zscore:+.2f}σ "
+            f"({d.contribution_pct:.0f}% contribution)"
+            for d in regime_result.top_drivers[:3]
+        )
+
+        return (
+            # Header
+            f"=== {regime_result.ticker} - {regime_result.trade_date} ===\n"
+            "\n"
+            # Unusualness summary
+            f"UNUSUALNESS: {unusualness_result.score}/100 ({unusualness_result.level.value})\n"
+            f"{unusualness_result.explanation}\n"
+            "\n"
+            # Regime summary
+            f"REGIME: {regime_result.label.value}\n"
+            f"Confidence: {regime_result.confidence:.0%}\n"
+            f"{regime_result.explanation}\n"
+            "\n"
+            # Top drivers
+            f"TOP DRIVERS:{drivers}"
+        )
 
     def generate_short_summary(
         self,
@@ -112,71 +178,8 @@ class ExplanationGenerator:
 
     def _get_regime_interpretation(self, label: RegimeLabel) -> str:
         """Get interpretation text for a regime."""
-        interpretations = {
-            RegimeLabel.GAMMA_POSITIVE_CONTROL: (
-                "Dealers are net long gamma from options positioning. "
-                "They profit from mean reversion and will sell rallies / buy dips, "
-                "creating a stabilizing effect on price."
-            ),
-            RegimeLabel.GAMMA_NEGATIVE_VACUUM: (
-                "Dealers are net short gamma from options positioning. "
-                "They must chase price moves (buy highs / sell lows) to hedge, "
-                "which can amplify volatility and cause rapid directional moves."
-            ),
-            RegimeLabel.DARK_DOMINANT_ACCUMULATION: (
-                "Majority of volume is executing through dark pools with elevated "
-                "block activity. This often indicates institutional positioning "
-                "occurring away from lit exchanges."
-            ),
-            RegimeLabel.ABSORPTION_LIKE: (
-                "Despite negative delta exposure indicating selling pressure, "
-                "price remains stable. This suggests passive buyers are absorbing "
-                "the sell flow without moving price."
-            ),
-            RegimeLabel.DISTRIBUTION_LIKE: (
-                "Positive delta exposure indicates buying activity, yet price "
-                "is not appreciating. This suggests distribution - selling "
-                "into the bid support."
-            ),
-            RegimeLabel.NEUTRAL: (
-                "No dominant market microstructure pattern detected. "
-                "Metrics are within normal historical ranges."
-            ),
-        }
-        return interpretations.get(label, "No interpretation available.")
+        return _REGIME_INTERPRETATIONS.get(label, "No interpretation available.")
 
     def _get_regime_implications(self, label: RegimeLabel) -> list[str]:
         """Get behavioral implications for a regime."""
-        implications = {
-            RegimeLabel.GAMMA_POSITIVE_CONTROL: [
-                "Expect dampened intraday volatility",
-                "Price may pin near high-gamma strikes at expiration",
-                "Mean reversion strategies historically favored",
-            ],
-            RegimeLabel.GAMMA_NEGATIVE_VACUUM: [
-                "Elevated risk of rapid directional moves",
-                "Stop-loss cascades more likely",
-                "Volatility expansion possible",
-            ],
-            RegimeLabel.DARK_DOMINANT_ACCUMULATION: [
-                "Institutional activity likely occurring",
-                "True positioning may not be reflected in lit market",
-                "Watch for eventual reversion to normal venue mix",
-            ],
-            RegimeLabel.ABSORPTION_LIKE: [
-                "Hidden support may be present",
-                "Accumulation phase possible",
-                "Monitor for exhaustion of buyers",
-            ],
-            RegimeLabel.DISTRIBUTION_LIKE: [
-                "Hidden selling pressure present",
-                "Distribution phase possible",
-                "Monitor for exhaustion of sellers",
-            ],
-            RegimeLabel.NEUTRAL: [
-                "No strong directional microstructure bias",
-                "Market operating in typical conditions",
-                "Other factors may dominate price action",
-            ],
-        }
-        return implications.get(label, ["No implications available."])
+        return list(_REGIME_IMPLICATIONS.get(label, ("No implications available.",)))
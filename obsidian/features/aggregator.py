@@ -149,6 +149,55 @@ class FeatureAggregator:
             price_metrics=price_metrics,
         )
 
+    def batch_from_raw_data(self, records: list[dict[str, Any]]) -> list[FeatureSet]:
+        """
+        Extract and aggregate features for many tickers at once.
+
+        Same result as from_raw_data() per record, but the dark pool trades
+        of all records are reduced together (see DarkPoolFeatures.extract_many).
+
+        Args:
+            records: One dict of from_raw_data() keyword arguments per ticker
+
+        Returns:
+            One FeatureSet per record, in order
+        """
+        with_trades = [r for r in records if r.get("darkpool_trades") is not None]
+        darkpool_metrics = iter(
+            self.darkpool.extract_many(
+                [r["darkpool_trades"] for r in with_trades],
+                total_volumes=[r.get("total_volume") for r in with_trades],
+                previous_ratios=[r.get("previous_dark_ratio") for r in with_trades],
+            )
+        )
+
+        feature_sets = []
+        for record in records:
+            greek_data = record.get("greek_data")
+            ohlcv = record.get("ohlcv")
+            feature_sets.append(
+                self.aggregate(
+                    ticker=record["ticker"],
+                    trade_date=record["trade_date"],
+                    darkpool_metrics=(
+                        next(darkpool_metrics)
+                        if record.get("darkpool_trades") is not None
+                        else None
+                    ),
+                    greeks_metrics=(
+                        self.greeks.extract(greek_data, record.get("iv_data"))
+                        if greek_data
+                        else None
+                    ),
+                    price_metrics=(
+                        self.price_context.extract(ohlcv, record.get("avg_volume"))
+                        if ohlcv
+                        else None
+                    ),
+                )
+            )
+        return feature_sets
+
     def validate_features(self, features: FeatureSet) -> list[str]:
         """
         Validate feature set for completeness.
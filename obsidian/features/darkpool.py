@@ -11,6 +11,7 @@ import logging
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from obsidian.core.constants import BLOCK_TRADE_MIN_SHARES
@@ -19,7 +20,7 @@ from obsidian.core.constants import BLOCK_TRADE_MIN_SHARES
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DarkPoolMetrics:
     """Container for dark pool metrics."""
 
@@ -108,17 +109,118 @@ class DarkPoolFeatures:
             logger.warning("Missing 'size' column in trades DataFrame")
             return self._empty_metrics()
 
+        # Column arrays, missing values as 0 (as the pandas sums skipped them)
+        sizes = trades_df["size"].to_numpy(dtype=np.float64, na_value=0.0)
+        if "premium" in trades_df.columns:
+            premiums = trades_df["premium"].to_numpy(dtype=np.float64, na_value=0.0)
+        else:
+            premiums = None
+
         # Total dark pool metrics
-        total_dark_volume = int(trades_df["size"].sum())
-        total_notional = float(trades_df.get("premium", pd.Series([0])).sum())
-        trade_count = len(trades_df)
+        total_dark_volume = int(sizes.sum())
+        total_notional = float(premiums.sum()) if premiums is not None else 0.0
+        trade_count = len(sizes)
+
+        # Block trades (large institutional prints); masked sums, no filtered copy
+        is_block = sizes >= self.block_threshold
+        block_count = int(np.count_nonzero(is_block))
+        block_volume = int(np.sum(sizes, where=is_block))
+        block_premium = float(np.sum(premiums, where=is_block)) if premiums is not None else 0.0
+
+        return self._build_metrics(
+            total_dark_volume,
+            total_notional,
+            trade_count,
+            block_count,
+            block_volume,
+            block_premium,
+            total_volume,
+            previous_ratio,
+        )
+
+    def extract_many(
+        self,
+        frames: list[pd.DataFrame],
+        total_volumes: list[int | None] | None = None,
+        previous_ratios: list[float | None] | None = None,
+    ) -> list[DarkPoolMetrics]:
+        """
+        Extract dark pool features for many trade frames at once.
+
+        Same metrics as extract() per frame (premium totals may differ in
+        the last bits, from summation order), but all frames are reduced in
+        one pass over the concatenated columns.
+
+        Args:
+            frames: One trades DataFrame per ticker
+            total_volumes: Total market volume per frame (None entries allowed)
+            previous_ratios: Previous day's dark pool ratio per frame
 
-        # Block trades (large institutional prints)
-        blocks = trades_df[trades_df["size"] >= self.block_threshold]
-        block_count = len(blocks)
-        block_volume = int(blocks["size"].sum()) if not blocks.empty else 0
-        block_premium = float(blocks.get("premium", pd.Series([0])).sum()) if not blocks.empty else 0.0
+        Returns:
+            One DarkPoolMetrics per frame, in order
+        """
+        n = len(frames)
+        total_volumes = total_volumes or [None] * n
+        previous_ratios = previous_ratios or [None] * n
+
+        # Empty frames and frames without sizes keep their single-frame handling
+        results: list[DarkPoolMetrics | None] = [None] * n
+        batched = []
+        for i, df in enumerate(frames):
+            if df.empty or "size" not in df.columns:
+                results[i] = self.extract(df, total_volumes[i], previous_ratios[i])
+            else:
+                batched.append(i)
+
+        if batched:
+            sizes = [frames[i]["size"].to_numpy(dtype=np.float64, na_value=0.0) for i in batched]
+            premiums = [
+                frames[i]["premium"].to_numpy(dtype=np.float64, na_value=0.0)
+                if "premium" in frames[i].columns
+                else np.zeros(len(sz))
+                for i, sz in zip(batched, sizes, strict=True)
+            ]
+            counts = np.array([len(sz) for sz in sizes])
+            group = np.repeat(np.arange(len(batched)), counts)
+            sizes = np.concatenate(sizes)
+            premiums = np.concatenate(premiums)
+            is_block = sizes >= self.block_threshold
+
+            k = len(batched)
+            volume = np.bincount(group, weights=sizes, minlength=k)
+            notional = np.bincount(group, weights=premiums, minlength=k)
+            block_counts = np.bincount(group[is_block], minlength=k)
+            block_volume = np.bincount(group, weights=np.where(is_block, sizes, 0.0), minlength=k)
+            block_premium = np.bincount(
+                group, weights=np.where(is_block, premiums, 0.0), minlength=k
+            )
 
+            for j, i in enumerate(batched):
+                results[i] = self._build_metrics(
+                    int(volume[j]),
+                    float(notional[j]),
+                    int(counts[j]),
+                    int(block_counts[j]),
+                    int(block_volume[j]),
+                    float(block_premium[j]),
+                    total_volumes[i],
+                    previous_ratios[i],
+                )
+
+        return results
+
+    def _build_metrics(
+        self,
+        total_dark_volume: int,
+        total_notional: float,
+        trade_count: int,
+        block_count: int,
+        block_volume: int,
+        block_premium: float,
+        total_volume: int | None,
+        previous_ratio: float | None,
+    ) -> DarkPoolMetrics:
+        """Derive averages, ratio and venue shift from the reduced totals."""
         # Averages
         avg_trade_size = float(total_dark_volume / trade_count) if trade_count > 0 else 0.0
         avg_block_size = float(block_volume / block_count) if block_count > 0 else 0.0
@@ -175,12 +277,19 @@ class DarkPoolFeatures:
         if trades_df.empty or "market_center" not in trades_df.columns:
             return {}
 
-        total_volume = trades_df["size"].sum()
+        sizes = trades_df["size"].to_numpy(dtype=np.float64, na_value=0.0)
+        total_volume = sizes.sum()
         if total_volume == 0:
             return {}
 
-        venue_volume = trades_df.groupby("market_center")["size"].sum()
-        return (venue_volume / total_volume * 100).to_dict()
+        # Sorted venue codes (-1 for a missing venue, left out as groupby did)
+        codes, venues = pd.factorize(trades_df["market_center"], sort=True)
+        has_venue = codes >= 0
+        venue_volume = np.bincount(
+            codes[has_venue], weights=sizes[has_venue], minlength=len(venues)
+        )
+        shares = (venue_volume / total_volume * 100).tolist()
+        return dict(zip(venues.tolist(), shares, strict=True))
 
     def calculate_block_timing(
         self,
@@ -198,20 +307,23 @@ class DarkPoolFeatures:
         if trades_df.empty or "executed_at" not in trades_df.columns:
             return {}
 
-        blocks = trades_df[trades_df["size"] >= self.block_threshold].copy()
-        if blocks.empty:
+        sizes = trades_df["size"].to_numpy(dtype=np.float64, na_value=0.0)
+        is_block = sizes >= self.block_threshold
+        if not is_block.any():
             return {"block_count": 0}
-
         # Parse timestamps
-        blocks["timestamp"] = pd.to_datetime(blocks["executed_at"])
-        blocks["hour"] = blocks["timestamp"].dt.hour
+        hours = pd.to_datetime(trades_df.loc[is_block, "executed_at"]).dt.hour.to_numpy()
 
-        # Distribution by hour
-        hourly_dist = blocks.groupby("hour")["size"].sum()
+        # Distribution by hour (block sizes are positive, so empty hours are 0);
+        # blocks without a timestamp count toward totals but not the distribution
+        timed = ~np.isnan(hours) if hours.dtype.kind == "f" else slice(None)
+        hourly = np.bincount(
+            hours[timed].astype(np.intp), weights=sizes[is_block][timed], minlength=24
+        )
 
         return {
-            "block_count": len(blocks),
-            "total_block_volume": int(blocks["size"].sum()),
-            "hourly_distribution": hourly_dist.to_dict(),
-            "peak_hour": int(hourly_dist.idxmax()) if not hourly_dist.empty else None,
+            "block_count": int(np.count_nonzero(is_block)),
+            "total_block_volume": int(np.sum(sizes, where=is_block)),
+            "hourly_distribution": {h: int(v) for h, v in enumerate(hourly.tolist()) if v},
+            "peak_hour": int(hourly.argmax()) if hourly.any() else None,
         }
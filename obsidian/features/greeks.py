@@ -16,7 +16,7 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class GreeksMetrics:
     """Container for Greek exposure metrics."""
 
@@ -46,6 +46,27 @@ class GreeksMetrics:
         }
 
 
+# IV fields read by GreeksFeatures.extract, in unpacking order; 25-delta
+# put/call IVs and the 30-/7-day IVs each have an alternate field name
+_IV_KEYS = (
+    "iv_atm", "iv_rank",
+    "iv_25d_put", "iv_25d_call", "put_iv_25d", "call_iv_25d",
+    "iv_30d", "iv_1m", "iv_7d", "iv_1w",
+)
+
+
+def _parse_float(value: Any, default: float | None) -> float | None:
+    """Convert a non-numeric API value to float, or return default."""
+    if value is None or isinstance(value, (dict, list)):
+        return default
+    try:
+        if isinstance(value, str):
+            value = value.strip().strip("'\"")
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
 class GreeksFeatures:
     """
     Extract features from Greek exposure data.
@@ -56,29 +77,22 @@ class GreeksFeatures:
 
     def _safe_float(self, value: Any, default: float = 0.0) -> float:
         """Safely convert value to float, handling strings, None, and invalid types."""
-        if value is None:
-            return default
-        if isinstance(value, (dict, list)):
-            return default
-        try:
-            if isinstance(value, str):
-                value = value.strip().strip("'\"")
+        # Fast path: the API usually returns numbers already
+        value_type = type(value)
+        if value_type is float:
+            return value
+        if value_type is int:
             return float(value)
-        except (ValueError, TypeError):
-            return default
+        return _parse_float(value, default)
 
     def _safe_float_optional(self, value: Any) -> float | None:
         """Safely convert to float or return None."""
-        if value is None:
-            return None
-        if isinstance(value, (dict, list)):
-            return None
-        try:
-            if isinstance(value, str):
-                value = value.strip().strip("'\"")
+        value_type = type(value)
+        if value_type is float:
+            return value
+        if value_type is int:
             return float(value)
-        except (ValueError, TypeError):
-            return None
+        return _parse_float(value, None)
 
     def extract(
         self,
@@ -108,10 +122,15 @@ class GreeksFeatures:
         iv_term_slope = None
 
         if iv_data:
-            iv_atm = self._safe_float_optional(iv_data.get("iv_atm"))
-            iv_rank = self._safe_float_optional(iv_data.get("iv_rank"))
-            iv_skew = self._calculate_skew(iv_data)
-            iv_term_slope = self._calculate_term_slope(iv_data)
+            (
+                iv_atm, iv_rank,
+                put_25d, call_25d, put_25d_alt, call_25d_alt,
+                iv_30d, iv_1m, iv_7d, iv_1w,
+            ) = map(iv_data.get, _IV_KEYS)
+            iv_atm = self._safe_float_optional(iv_atm)
+            iv_rank = self._safe_float_optional(iv_rank)
+            iv_skew = self._calculate_skew(put_25d, call_25d, put_25d_alt, call_25d_alt)
+            iv_term_slope = self._calculate_term_slope(iv_30d or iv_1m, iv_7d or iv_1w)
 
         return GreeksMetrics(
             gex=gex,
@@ -124,29 +143,38 @@ class GreeksFeatures:
             iv_term_slope=iv_term_slope,
         )
 
-    def _calculate_skew(self, iv_data: dict[str, Any]) -> float | None:
+    def _calculate_skew(
+        self,
+        put_25d: Any,
+        call_25d: Any,
+        put_25d_alt: Any = None,
+        call_25d_alt: Any = None,
+    ) -> float | None:
         """
         Calculate put-call IV skew.
 
         Skew = 25-delta put IV - 25-delta call IV
         Positive skew = puts more expensive (fear)
+
+        The *_alt values are the same IVs under alternate API field names,
+        used when the primary pair is incomplete.
         """
-        put_iv = self._safe_float_optional(iv_data.get("iv_25d_put"))
-        call_iv = self._safe_float_optional(iv_data.get("iv_25d_call"))
+        put_iv = self._safe_float_optional(put_25d)
+        call_iv = self._safe_float_optional(call_25d)
 
         if put_iv is not None and call_iv is not None:
             return put_iv - call_iv
 
         # Try alternate field names
-        put_iv = self._safe_float_optional(iv_data.get("put_iv_25d"))
-        call_iv = self._safe_float_optional(iv_data.get("call_iv_25d"))
+        put_iv = self._safe_float_optional(put_25d_alt)
+        call_iv = self._safe_float_optional(call_25d_alt)
 
         if put_iv is not None and call_iv is not None:
             return put_iv - call_iv
 
         return None
 
-    def _calculate_term_slope(self, iv_data: dict[str, Any]) -> float | None:
+    def _calculate_term_slope(self, iv_30d: Any, iv_7d: Any) -> float | None:
         """
         Calculate IV term structure slope.
 
@@ -154,8 +182,8 @@ class GreeksFeatures:
         Positive slope = contango (normal)
         Negative slope = backwardation (near-term fear)
         """
-        iv_30d = self._safe_float_optional(iv_data.get("iv_30d") or iv_data.get("iv_1m"))
-        iv_7d = self._safe_float_optional(iv_data.get("iv_7d") or iv_data.get("iv_1w"))
+        iv_30d = self._safe_float_optional(iv_30d)
+        iv_7d = self._safe_float_optional(iv_7d)
 
         if iv_30d is not None and iv_7d is not None:
             return iv_30d - iv_7d
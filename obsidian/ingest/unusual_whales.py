@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from obsidian.core.constants import BLOCK_TRADE_MIN_SHARES
@@ -405,15 +406,16 @@ class UnusualWhalesClient(BaseAPIClient):
                 "avg_block_size": 0.0,
             }
 
-        # Total dark pool metrics
-        total_volume = trades_df["size"].sum()
-        total_notional = trades_df["premium"].sum()
-        trade_count = len(trades_df)
+        # Total dark pool metrics (missing values count as 0)
+        sizes = trades_df["size"].to_numpy(dtype=np.float64, na_value=0.0)
+        total_volume = sizes.sum()
+        total_notional = trades_df["premium"].to_numpy(dtype=np.float64, na_value=0.0).sum()
+        trade_count = len(sizes)
 
-        # Block trades (> 10k shares)
-        blocks = trades_df[trades_df["size"] >= BLOCK_TRADE_MIN_SHARES]
-        block_count = len(blocks)
-        block_volume = blocks["size"].sum() if not blocks.empty else 0
+        # Block trades (> 10k shares); masked sum, no filtered copy
+        is_block = sizes >= BLOCK_TRADE_MIN_SHARES
+        block_count = int(np.count_nonzero(is_block))
+        block_volume = np.sum(sizes, where=is_block)
 
         return {
             "dark_pool_volume": int(total_volume),
@@ -81,6 +81,10 @@ class NormalizationPipeline:
         self.history_dir = history_dir
         self.baseline = baseline
 
+        # Feature -> baseline stats, built once per baseline object
+        self._stats_baseline: TickerBaseline | None = None
+        self._stats_by_feature: dict[str, DistributionStats | None] = {}
+
         # Initialize rolling calculators (used as fallback or in rolling mode)
         self._rolling = MultiFeatureRollingCalculator(
             feature_configs=self.config._config.get("normalization", {}).get("features", {}),
@@ -294,35 +298,41 @@ class NormalizationPipeline:
         """
         Get baseline statistics for a feature.
 
-        Maps feature names to baseline distribution stats.
+        Maps feature names to baseline distribution stats. The mapping is
+        built on first use and rebuilt only if self.baseline is replaced.
         """
-        if self.baseline is None:
+        baseline = self.baseline
+        if baseline is None:
             return None
 
-        # Feature -> Baseline mapping
-        mapping = {
-            # Dark pool features
-            "dark_pool_ratio": self.baseline.dark_pool.dark_share,
-            "dark_pool_volume": self.baseline.dark_pool.dark_volume,
-            "block_trade_count": self.baseline.dark_pool.daily_block_count,
-            "block_trade_size_avg": self.baseline.dark_pool.block_size,
-            "block_premium": self.baseline.dark_pool.block_premium,
-            "venue_shift": self.baseline.dark_pool.venue_shift,
-            # Greek features
-            "gex": self.baseline.greeks.gex,
-            "dex": self.baseline.greeks.dex,
-            "vanna": self.baseline.greeks.vanna,
-            "charm": self.baseline.greeks.charm,
-            "iv_atm": self.baseline.greeks.iv_atm,
-            "iv_skew": self.baseline.greeks.iv_skew,
-            "iv_rank": self.baseline.greeks.iv_rank,
-            # Price efficiency features
-            "daily_range_pct": self.baseline.price_efficiency.daily_range_pct,
-            "price_efficiency": self.baseline.price_efficiency.price_efficiency,
-            "impact_per_vol": self.baseline.price_efficiency.impact_per_volume,
-        }
+        if self._stats_baseline is not baseline:
+            dark_pool = baseline.dark_pool
+            greeks = baseline.greeks
+            price_efficiency = baseline.price_efficiency
+            self._stats_by_feature = {
+                # Dark pool features
+                "dark_pool_ratio": dark_pool.dark_share,
+                "dark_pool_volume": dark_pool.dark_volume,
+                "block_trade_count": dark_pool.daily_block_count,
+                "block_trade_size_avg": dark_pool.block_size,
+                "block_premium": dark_pool.block_premium,
+                "venue_shift": dark_pool.venue_shift,
+                # Greek features
+                "gex": greeks.gex,
+                "dex": greeks.dex,
+                "vanna": greeks.vanna,
+                "charm": greeks.charm,
+                "iv_atm": greeks.iv_atm,
+                "iv_skew": greeks.iv_skew,
+                "iv_rank": greeks.iv_rank,
+                # Price efficiency features
+                "daily_range_pct": price_efficiency.daily_range_pct,
+                "price_efficiency": price_efficiency.price_efficiency,
+                "impact_per_vol": price_efficiency.impact_per_volume,
+            }
+            self._stats_baseline = baseline
 
-        return mapping.get(feature)
+        return self._stats_by_feature.get(feature)
 
     def _normalize_with_baseline(
         self,
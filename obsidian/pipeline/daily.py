@@ -19,7 +19,8 @@ from datetime import date
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from obsidian.core.config import Settings, get_settings
 from obsidian.core.types import FeatureSet, RegimeResult, UnusualnessResult
@@ -48,6 +49,55 @@ except ImportError:
     FeatureHistoryStorage = None
 
 
+# Parquet schema of a saved DailyResult (one row, nested fields as structs).
+# normalized is a map because its keys depend on the available features.
+_DRIVER_FIELDS = [("feature", pa.string()), ("zscore", pa.float64()), ("direction", pa.string())]
+RESULT_ARROW_SCHEMA = pa.schema([
+    ("ticker", pa.string()),
+    ("date", pa.string()),
+    ("regime", pa.struct([
+        ("ticker", pa.string()),
+        ("date", pa.string()),
+        ("regime", pa.string()),
+        ("confidence", pa.float64()),
+        ("explanation", pa.string()),
+        ("top_drivers", pa.list_(pa.struct([
+            *_DRIVER_FIELDS[:2],
+            ("contribution_pct", pa.float64()),
+            _DRIVER_FIELDS[2],
+        ]))),
+    ])),
+    ("unusualness", pa.struct([
+        ("ticker", pa.string()),
+        ("date", pa.string()),
+        ("score", pa.float64()),
+        ("raw_score", pa.float64()),
+        ("level", pa.string()),
+        ("explanation", pa.string()),
+        ("components", pa.list_(pa.struct([
+            ("name", pa.string()),
+            ("weight", pa.float64()),
+            ("zscore", pa.float64()),
+            ("contribution", pa.float64()),
+        ]))),
+        ("top_drivers", pa.list_(pa.struct(_DRIVER_FIELDS))),
+    ])),
+    ("features", pa.struct([
+        ("ticker", pa.string()),
+        ("date", pa.string()),
+        *((name, pa.float64()) for name in ("dark_pool_volume", "dark_pool_ratio")),
+        ("block_trade_count", pa.int64()),
+        *((name, pa.float64()) for name in (
+            "block_trade_size_avg", "gex", "dex", "vanna", "charm", "iv_atm", "iv_rank",
+            "iv_skew", "price_change_pct", "daily_range_pct", "price_efficiency",
+            "impact_per_vol", "venue_shift",
+        )),
+        ("normalized", pa.map_(pa.string(), pa.float64())),
+    ])),
+    ("explanation", pa.string()),
+])
+
+
 @dataclass
 class DailyResult:
     """Result of daily pipeline for a single ticker."""
@@ -437,9 +487,8 @@ class DailyPipeline:
 
         path = output_dir / f"{result.trade_date.isoformat()}.parquet"
 
-        # Convert to DataFrame and save
-        df = pd.DataFrame([result.to_dict()])
-        df.to_parquet(path, index=False)
+        table = pa.Table.from_pylist([result.to_dict()], schema=RESULT_ARROW_SCHEMA)
+        pq.write_table(table, path)
 
         logger.info(f"Saved result to {path}")
         return path
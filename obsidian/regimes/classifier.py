@@ -19,6 +19,7 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 
 from obsidian.core.config import RegimesConfig, load_config
@@ -34,7 +35,7 @@ from obsidian.core.constants import (
     PRICE_STABLE_HIGH,
     PRICE_STABLE_LOW,
 )
-from obsidian.core.types import RegimeLabel, RegimeResult, TopDriver
+from obsidian.core.types import RegimeLabel, RegimeLabelInt, RegimeResult, TopDriver
 
 
 logger = logging.getLogger(__name__)
@@ -45,6 +46,109 @@ logger = logging.getLogger(__name__)
 MINIMUM_REQUIRED_FEATURES = ["gex_zscore", "dex_zscore"]
 
 
+# ========================================
+# Vectorized classification
+# ========================================
+
+# RegimeLabel for each RegimeLabelInt code (REGIME_LABELS[code] is the label)
+REGIME_LABELS: tuple[RegimeLabel, ...] = tuple(code.label for code in RegimeLabelInt)
+
+# Rule conditions as (feature, comparison, threshold); the position is the mask bit
+_CONDITIONS = (
+    ("gex_zscore", np.greater, GEX_EXTREME_POSITIVE),
+    ("dark_pool_ratio_pct", np.less, 60),
+    ("price_efficiency_pct", np.less, PRICE_EFFICIENCY_LOW),
+    ("gex_zscore", np.less, GEX_EXTREME_NEGATIVE),
+    ("impact_per_vol_pct", np.greater, IMPACT_PER_VOL_HIGH),
+    ("dark_pool_ratio_pct", np.greater, DARK_POOL_DOMINANT),
+    ("block_trade_count_zscore", np.greater, BLOCK_ACTIVITY_ELEVATED),
+    ("dex_zscore", np.less, -DEX_ELEVATED),
+    ("price_change_pct", np.greater_equal, PRICE_STABLE_LOW),
+    ("dark_pool_ratio_pct", np.greater, DARK_POOL_ELEVATED),
+    ("dex_zscore", np.greater, DEX_ELEVATED),
+    ("price_change_pct", np.less_equal, PRICE_STABLE_HIGH),
+)
+
+# Values used when a feature column is absent (same defaults as the rule checks)
+_FEATURE_DEFAULTS = {
+    "gex_zscore": 0.0,
+    "dex_zscore": 0.0,
+    "dark_pool_ratio_pct": 0.0,
+    "block_trade_count_zscore": 0.0,
+    "price_change_pct": 0.0,
+    "price_efficiency_pct": 50.0,
+    "impact_per_vol_pct": 50.0,
+}
+
+# Rules in priority order as the set of condition bits that must all hold
+_RULE_MASKS = (
+    (RegimeLabel.GAMMA_POSITIVE_CONTROL, 0b000000000111),
+    (RegimeLabel.GAMMA_NEGATIVE_VACUUM, 0b000000011000),
+    (RegimeLabel.DARK_DOMINANT_ACCUMULATION, 0b000001100000),
+    (RegimeLabel.ABSORPTION_LIKE, 0b001110000000),
+    (RegimeLabel.DISTRIBUTION_LIKE, 0b110000000000),
+)
+
+
+def _build_regime_table() -> np.ndarray:
+    """Resolve every condition bitmask to its label code, first matching rule wins."""
+    table = np.full(
+        1 << len(_CONDITIONS), RegimeLabelInt.NEUTRAL, dtype=np.int8
+    )
+    for mask in range(len(table)):
+        for label, required in _RULE_MASKS:
+            if mask & required == required:
+                table[mask] = label.code
+                break
+    table.flags.writeable = False
+    return table
+
+
+REGIME_TABLE = _build_regime_table()
+
+
+def _feature_column(features: pd.DataFrame, name: str) -> np.ndarray:
+    """Feature column as float64, falling back like the scalar rule checks."""
+    if name not in features and name == "dark_pool_ratio_pct":
+        name = "dark_pool_ratio"
+    if name in features:
+        return features[name].to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.full(len(features), _FEATURE_DEFAULTS.get(name, 0.0))
+
+
+def classify_labels(features: pd.DataFrame) -> np.ndarray:
+    """
+    Classify many observations at once.
+
+    Gives the same label as RegimeClassifier.classify() for each row, without
+    explanations or confidence. Each rule condition sets one bit of a mask,
+    and REGIME_TABLE maps the mask to the first matching regime.
+
+    Args:
+        features: One row per observation, columns as in classify()
+
+    Returns:
+        int8 array of RegimeLabelInt codes; REGIME_LABELS[code] is the RegimeLabel
+    """
+    columns = {name: _feature_column(features, name) for name, _, _ in _CONDITIONS}
+
+    mask = np.zeros(len(features), dtype=np.int16)
+    for bit, (name, compare, threshold) in enumerate(_CONDITIONS):
+        mask |= compare(columns[name], threshold).astype(np.int16) << bit
+
+    codes = REGIME_TABLE[mask]
+
+    # GUARDRAIL: Incomplete data is UNDETERMINED, never a rule match
+    incomplete = np.zeros(len(features), dtype=bool)
+    for name in MINIMUM_REQUIRED_FEATURES:
+        if name in features:
+            incomplete |= np.isnan(columns[name])
+        else:
+            incomplete[:] = True
+    codes[incomplete] = RegimeLabelInt.UNDETERMINED
+    return codes
+
+
 @dataclass
 class RegimeRule:
     """A single rule for regime classification."""
@@ -14,7 +14,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from obsidian.core.constants import SCORE_WEIGHTS
+from obsidian.core.constants import SCORE_FEATURES, SCORE_WEIGHTS, SCORE_WEIGHTS_ARRAY
 from obsidian.core.types import (
     ScoreComponent,
     TopDriver,
@@ -68,6 +68,25 @@ SCORE_COMPONENTS = [
 ]
 
 
+def compute_raw_scores(zscores: np.ndarray) -> np.ndarray:
+    """
+    Raw unusualness scores for many observations at once.
+
+    Args:
+        zscores: Array of shape (n, len(SCORE_FEATURES)), columns in
+            SCORE_FEATURES order; NaN counts as 0 (no deviation)
+
+    Returns:
+        Array of n raw scores, Σ(weight_i * |zscore_i|) per row
+    """
+    zscores = np.asarray(zscores, dtype=np.float64)
+    if zscores.shape[-1] != len(SCORE_FEATURES):
+        raise ValueError(
+            f"Expected {len(SCORE_FEATURES)} z-score columns, got {zscores.shape[-1]}"
+        )
+    return np.nan_to_num(np.abs(zscores)) @ SCORE_WEIGHTS_ARRAY
+
+
 def _percentile_to_zscore(pct: float) -> float:
     """Convert percentile (0-100) to pseudo z-score."""
     # 50th percentile = 0, 2.5th = -2, 97.5th = +2
@@ -0,0 +1,630 @@
+"""
+Tests for the baseline system.
+"""
+
+import json
+import math
+from dataclasses import replace
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from obsidian.baseline import calculator as baseline_calculator
+from obsidian.baseline import types as baseline_types
+from obsidian.baseline.calculator import (
+    BaselineCalculator,
+    _stats_1d,
+    compute_distribution_stats,
+)
+from obsidian.baseline.storage import (
+    BaselineStorage,
+    TickerBaselineTable,
+    format_baseline_report,
+)
+from obsidian.baseline.types import (
+    BaselineUpdatePolicy,
+    DistributionStats,
+    DynamicState,
+    DynamicStateTable,
+)
+from obsidian.core import json_io
+
+
+class TestComputeDistributionStats:
+    """Tests for distribution statistics."""
+
+    @pytest.mark.parametrize("n", [21, 22, 63, 64, 250])
+    def test_matches_numpy_reference(self, n: int):
+        """Partition-based stats should match the numpy reference functions."""
+        rng = np.random.default_rng(n)
+        values = rng.lognormal(mean=10.0, sigma=1.5, size=n)
+
+        stats = compute_distribution_stats(values.tolist())
+
+        assert stats is not None
+        assert stats.n_observations == n
+        assert stats.mean == pytest.approx(np.mean(values))
+        assert stats.std == pytest.approx(np.std(values))
+        assert stats.median == pytest.approx(np.median(values))
+        assert stats.mad == pytest.approx(np.median(np.abs(values - np.median(values))))
+        assert stats.p25 == pytest.approx(np.percentile(values, 25))
+        assert stats.p75 == pytest.approx(np.percentile(values, 75))
+        assert stats.p90 == pytest.approx(np.percentile(values, 90))
+        assert stats.p95 == pytest.approx(np.percentile(values, 95))
+        assert stats.min_val == np.min(values)
+        assert stats.max_val == np.max(values)
+
+    @pytest.mark.parametrize("n", [21, 22, 63])
+    def test_kernel_matches_numpy_path(self, n: int):
+        """The single-pass kernel should agree with the NumPy implementation."""
+        values = np.random.default_rng(n).normal(5.0, 2.0, size=n)
+
+        stats = compute_distribution_stats(values)
+        kernel = _stats_1d(values)
+
+        assert kernel[-1] == n
+        expected = (
+            stats.mean, stats.std, stats.median, stats.mad, stats.p25, stats.p75,
+            stats.p90, stats.p95, stats.min_val, stats.max_val,
+        )
+        assert kernel[:-1] == pytest.approx(expected)
+
+    def test_insufficient_data_returns_none(self):
+        """Fewer than MIN_OBSERVATIONS values should return None."""
+        assert compute_distribution_stats([1.0] * 20) is None
+
+    def test_skips_missing_values(self):
+        """None and NaN values should be ignored."""
+        values = [float(i) for i in range(30)] + [None, np.nan]
+
+        stats = compute_distribution_stats(values)
+
+        assert stats is not None
+        assert stats.n_observations == 30
+        assert stats.median == 14.5
+
+    def test_accepts_float_array_with_nan(self):
+        """A float array with NaN holes should match the equivalent list input."""
+        values = np.arange(30, dtype=np.float64)
+        values[::7] = np.nan
+
+        from_array = compute_distribution_stats(values)
+        from_list = compute_distribution_stats([v for v in values.tolist() if v == v])
+
+        assert from_array == from_list
+
+    def test_outliers_removed_with_mad_rule(self):
+        """Values far from the median in robust-σ units should be dropped."""
+        values = np.r_[np.linspace(9.0, 11.0, 40), 50.0, -30.0]
+
+        stats = compute_distribution_stats(values, remove_outliers=True)
+
+        assert stats.n_observations == 40
+        assert stats.max_val == 11.0
+        assert stats.min_val == 9.0
+
+    def test_outlier_removal_skipped_when_mad_is_zero(self):
+        """A zero MAD gives no usable scale, so nothing is removed."""
+        values = np.r_[np.full(30, 5.0), 100.0]
+
+        stats = compute_distribution_stats(values, remove_outliers=True)
+
+        assert stats.n_observations == 31
+        assert stats.max_val == 100.0
+
+    def test_fast_constructor_matches_init(self):
+        """_unsafe should build an instance equal to the regular constructor."""
+        args = (1.0, 2.0, 1.5, 0.5, 0.2, 2.2, 3.0, 3.5, -1.0, 4.0, 30)
+
+        fast = DistributionStats._unsafe(*args)
+
+        assert fast == DistributionStats(*args)
+        assert hash(fast) == hash(DistributionStats(*args))
+        with pytest.raises(AttributeError):
+            fast.mean = 0.0
+
+    def test_returns_builtin_number_types(self):
+        """Fields should be plain Python numbers so they serialize cleanly."""
+        stats = compute_distribution_stats(np.linspace(0.0, 1.0, 30))
+
+        assert type(stats.mean) is float
+        assert type(stats.p95) is float
+        assert type(stats.n_observations) is int
+
+    def test_does_not_modify_input(self):
+        """Complete inputs are used without copying but must stay untouched."""
+        values = np.random.default_rng(5).normal(size=40)
+        original = values.copy()
+
+        compute_distribution_stats(values, remove_outliers=True)
+
+        np.testing.assert_array_equal(values, original)
+
+    def test_constant_series(self):
+        """Constant values should have zero spread."""
+        stats = compute_distribution_stats([5.0] * 30)
+
+        assert stats is not None
+        assert stats.std == 0.0
+        assert stats.mad == 0.0
+        assert stats.p95 == 5.0
+
+
+@pytest.fixture
+def history_df() -> pd.DataFrame:
+    """Synthetic 63-day feature history."""
+    rng = np.random.default_rng(7)
+    n = 63
+    total_volume = rng.integers(50_000_000, 90_000_000, size=n).astype(float)
+    dark_volume = total_volume * rng.uniform(0.35, 0.55, size=n)
+    low = rng.uniform(470, 475, size=n)
+    high = low + rng.uniform(1, 6, size=n)
+    return pd.DataFrame({
+        "date": pd.bdate_range("2024-01-02", periods=n).date,
+        "dark_pool_volume": dark_volume,
+        "total_volume": total_volume,
+        "dark_pool_ratio": dark_volume / total_volume * 100,
+        "block_trade_count": rng.integers(5, 40, size=n).astype(float),
+        "block_trade_size_avg": rng.uniform(10_000, 50_000, size=n),
+        "block_premium": rng.uniform(1e6, 5e7, size=n),
+        "venue_shift": rng.normal(0, 2, size=n),
+        "gex": rng.normal(1e9, 5e8, size=n),
+        "dex": rng.normal(-2e8, 1e8, size=n),
+        "iv_atm": rng.uniform(12, 25, size=n),
+        "iv_skew": rng.normal(3, 1, size=n),
+        "open_price": low + 1,
+        "high_price": high,
+        "low_price": low,
+        "close_price": rng.uniform(low, high),
+        "volume": total_volume,
+        "daily_range_pct": rng.uniform(0.3, 2.0, size=n),
+        "price_efficiency": rng.uniform(0.5, 3.0, size=n),
+        "impact_per_vol": rng.uniform(0.0, 0.05, size=n),
+    })
+
+
+class TestBaselineCalculator:
+    """Tests for baseline computation."""
+
+    def test_computes_baseline(self, history_df: pd.DataFrame):
+        """Should compute a valid baseline from sufficient history."""
+        baseline = BaselineCalculator().compute_baseline("SPY", history_df)
+
+        assert baseline is not None
+        assert baseline.is_valid()
+        assert baseline.observation_count == 63
+        assert baseline.data_start_date == history_df["date"].min()
+        assert baseline.data_end_date == history_df["date"].max()
+        assert baseline.missing_data_pct == 0.0
+
+    def test_stats_match_per_column_computation(self, history_df: pd.DataFrame):
+        """Batched column stats should equal per-column stats."""
+        baseline = BaselineCalculator().compute_baseline("SPY", history_df)
+
+        expected = compute_distribution_stats(history_df["gex"].tolist())
+        actual = baseline.greeks.gex
+        for name in ("mean", "std", "median", "mad", "p25", "p75", "p90", "p95"):
+            assert getattr(actual, name) == pytest.approx(getattr(expected, name))
+        assert actual.n_observations == expected.n_observations
+
+    def test_missing_optional_columns_use_defaults(self, history_df: pd.DataFrame):
+        """Absent optional metrics should yield None or default stats."""
+        df = history_df.drop(columns=["vanna", "iv_rank", "block_premium"], errors="ignore")
+
+        baseline = BaselineCalculator().compute_baseline("SPY", df)
+
+        assert baseline.greeks.vanna is None
+        assert baseline.greeks.iv_rank is None
+        assert baseline.dark_pool.block_premium.mean == 0
+
+    def test_insufficient_history_returns_none(self, history_df: pd.DataFrame):
+        """Fewer rows than min_observations should return None."""
+        assert BaselineCalculator().compute_baseline("SPY", history_df.head(10)) is None
+
+    def test_missing_data_pct_counts_nan_and_absent_columns(self, history_df: pd.DataFrame):
+        """Absent expected columns count as fully missing alongside NaN cells."""
+        df = history_df.drop(columns=["dex"])
+        df.loc[df.index[:9], "gex"] = np.nan
+
+        baseline = BaselineCalculator().compute_baseline("SPY", df)
+
+        assert baseline.missing_data_pct == pytest.approx((63 + 9) / (6 * 63) * 100)
+
+    def test_dynamic_state_sets_available_fields(self, history_df: pd.DataFrame):
+        """Dynamic state should fill z-scores only for features that are present."""
+        calculator = BaselineCalculator()
+        baseline = calculator.compute_baseline("SPY", history_df)
+        gex_stats = baseline.greeks.gex
+
+        state = calculator.compute_dynamic_state(
+            "SPY",
+            {"gex": gex_stats.mean + gex_stats.std, "dex": -1.0},
+            baseline,
+            baseline.baseline_date,
+        )
+
+        assert state.ticker == "SPY"
+        assert state.rolling_window == calculator.lookback_days
+        assert state.gex_zscore == pytest.approx(1.0)
+        assert state.gex_sign == 1
+        assert state.dex_sign == -1
+        assert state.dark_share_zscore is None
+        assert state.iv_zscore is None
+
+    def test_close_position_skips_zero_range_days(self, history_df: pd.DataFrame):
+        """Days with high == low have no defined close position."""
+        df = history_df.copy()
+        df.loc[df.index[:5], "high_price"] = df.loc[df.index[:5], "low_price"]
+
+        baseline = BaselineCalculator().compute_baseline("SPY", df)
+
+        close_position = baseline.price_efficiency.close_position
+        assert close_position.n_observations == 58
+        assert 0.0 <= close_position.min_val <= close_position.max_val <= 1.0
+
+    def test_dynamic_state_zscores_match_scalar(self, history_df: pd.DataFrame):
+        """Vectorized z-scores should equal DistributionStats.zscore per metric."""
+        calculator = BaselineCalculator()
+        baseline = calculator.compute_baseline("SPY", history_df)
+        features = {
+            "dark_pool_ratio": 48.0,
+            "gex": 2e9,
+            "dex": -1e8,
+            "iv_atm": 15.0,
+            "iv_skew": 4.0,
+            "price_efficiency": 1.2,
+        }
+
+        state = calculator.compute_dynamic_state("SPY", features, baseline, date(2024, 4, 1))
+
+        assert state.dark_share_zscore == pytest.approx(baseline.dark_pool.dark_share.zscore(48.0))
+        assert state.gex_zscore == pytest.approx(baseline.greeks.gex.zscore(2e9))
+        assert state.dex_zscore == pytest.approx(baseline.greeks.dex.zscore(-1e8))
+        assert state.iv_zscore == pytest.approx(baseline.greeks.iv_atm.zscore(15.0))
+        assert state.iv_skew_zscore == pytest.approx(baseline.greeks.iv_skew.zscore(4.0))
+        assert state.price_efficiency_zscore == pytest.approx(
+            baseline.price_efficiency.price_efficiency.zscore(1.2)
+        )
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_batch_matches_single_ticker(
+        self, history_df: pd.DataFrame, max_workers: int, monkeypatch
+    ):
+        """Batch computation should return the same baselines as one-by-one calls."""
+        monkeypatch.setattr(baseline_calculator, "_PARALLEL_BATCH_MIN", 2)
+        calculator = BaselineCalculator()
+        data = {"SPY": history_df, "QQQ": history_df.head(40), "IWM": history_df.head(10)}
+
+        results = calculator.compute_baselines_batch(data, max_workers=max_workers)
+
+        assert list(results) == ["SPY", "QQQ", "IWM"]
+        assert results["SPY"] == calculator.compute_baseline("SPY", history_df)
+        assert results["QQQ"].observation_count == 40
+        assert results["IWM"] is None
+
+
+    def test_small_batch_runs_serially(self, history_df: pd.DataFrame, monkeypatch):
+        """Batches below the parallel threshold should not start a process pool."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(baseline_calculator, "ProcessPoolExecutor", no_pool)
+
+        results = BaselineCalculator().compute_baselines_batch(
+            {"SPY": history_df, "QQQ": history_df.head(40)}
+        )
+
+        assert list(results) == ["SPY", "QQQ"]
+
+
+class TestDistributionStatsArray:
+    """Tests for the structured-array representation."""
+
+    def test_round_trip(self):
+        """to_array/from_array should preserve every field."""
+        stats = compute_distribution_stats(np.arange(40, dtype=np.float64))
+
+        rec = stats.to_array()
+
+        assert rec.dtype == DistributionStats.DTYPE
+        assert rec["n_observations"] == 40
+        assert DistributionStats.from_array(rec) == stats
+
+    def test_stacked_records_are_columnar(self):
+        """Records should stack into a structured array with contiguous fields."""
+        stats = [
+            compute_distribution_stats(np.arange(n, dtype=np.float64)) for n in (30, 50, 70)
+        ]
+
+        table = np.array([s.to_array() for s in stats], dtype=DistributionStats.DTYPE)
+
+        assert table["mean"].tolist() == [s.mean for s in stats]
+        assert DistributionStats.from_array(table[1]) == stats[1]
+
+    def test_batch_methods_match_scalar(self):
+        """zscore_batch/percentile_rank_batch should agree with the scalar methods."""
+        stats = compute_distribution_stats(np.random.default_rng(4).normal(10, 2, 100))
+        constant = compute_distribution_stats(np.full(30, 5.0))
+        values = np.array([-100.0, stats.min_val, 8.0, stats.median, 11.5, stats.max_val, 100.0])
+
+        assert stats.zscore_batch(values).tolist() == pytest.approx(
+            [stats.zscore(v) for v in values]
+        )
+        assert stats.percentile_rank_batch(values).tolist() == pytest.approx(
+            [stats.percentile_rank(v) for v in values]
+        )
+        assert constant.zscore_batch(values).tolist() == [0.0] * len(values)
+
+    def test_batch_methods_keep_float32(self):
+        """float32 input should stay float32 and match the float64 results closely."""
+        stats = compute_distribution_stats(np.random.default_rng(8).normal(10, 2, 100))
+        values = np.random.default_rng(9).normal(10, 4, 20_000)
+        small = values[:50].astype(np.float32)
+
+        for method in (stats.zscore_batch, stats.percentile_rank_batch):
+            for batch in (small, values.astype(np.float32)):
+                result = method(batch)
+                assert result.dtype == np.float32
+                np.testing.assert_allclose(
+                    result, method(batch.astype(np.float64)), rtol=1e-5, atol=1e-4
+                )
+
+    def test_large_batch_percentile_rank(self, monkeypatch):
+        """Large batches (Numba kernel when installed) should match the NumPy path."""
+        stats = compute_distribution_stats(np.random.default_rng(5).normal(10, 2, 100))
+        values = np.random.default_rng(6).normal(10, 4, 20_000)
+        values[::1000] = np.nan
+
+        ranks = stats.percentile_rank_batch(values)
+        monkeypatch.setattr(baseline_types, "NUMBA_AVAILABLE", False)
+
+        np.testing.assert_allclose(ranks, stats.percentile_rank_batch(values))
+
+    def test_derived_values(self):
+        """Cached derived values should be set by both constructors."""
+        fields = (10.0, 2.0, 9.5, 1.0, 8.0, 12.0, 13.0, 14.0, 4.0, 16.0, 50)
+
+        for stats in (DistributionStats(*fields), DistributionStats._unsafe(*fields)):
+            assert stats.iqr == 4.0
+            assert stats.normal_range_low == 7.0
+            assert stats.normal_range_high == 13.0
+            assert stats.zscore(13.0) == 1.5
+            assert stats.percentile_rank(9.5) == pytest.approx(50.0)
+        assert DistributionStats(*fields) == DistributionStats._unsafe(*fields)
+        assert "iqr" not in repr(DistributionStats(*fields))
+
+    def test_slotted_and_frozen(self):
+        """Instances should have no per-instance dict and reject assignment."""
+        stats = compute_distribution_stats(np.arange(40, dtype=np.float64))
+
+        assert not hasattr(stats, "__dict__")
+        with pytest.raises(AttributeError):
+            stats.mean = 1.0
+
+    def test_window_selection_ignores_input_order_and_date_type(
+        self, history_df: pd.DataFrame
+    ):
+        """Shuffled rows with string dates should give the same baseline."""
+        shuffled = history_df.sample(frac=1.0, random_state=3)
+        shuffled["date"] = shuffled["date"].astype(str)
+        original = shuffled.copy()
+        calculator = BaselineCalculator(lookback_days=40)
+
+        baseline = calculator.compute_baseline("SPY", shuffled, as_of_date=date(2024, 3, 15))
+        expected = calculator.compute_baseline(
+            "SPY", history_df, as_of_date=date(2024, 3, 15)
+        )
+
+        assert baseline == expected
+        assert baseline.data_end_date == date(2024, 3, 15)
+        assert baseline.observation_count == 40
+        pd.testing.assert_frame_equal(shuffled, original)
+
+    def test_repeated_inputs_are_memoized(self, history_df: pd.DataFrame):
+        """Identical window contents should reuse the cached components."""
+        calculator = BaselineCalculator()
+
+        first = calculator.compute_baseline("SPY", history_df)
+        second = calculator.compute_baseline("SPY", history_df.copy())
+
+        changed = history_df.copy()
+        changed.loc[changed.index[-1], "gex"] += 1.0
+        third = calculator.compute_baseline("SPY", changed)
+
+        assert second == first
+        assert second.greeks is first.greeks
+        assert third is not first
+        assert third.greeks.gex != first.greeks.gex
+
+    def test_memoized_baseline_is_a_copy(self, history_df: pd.DataFrame):
+        """Mutating a returned baseline should not change later cache hits."""
+        calculator = BaselineCalculator()
+
+        first = calculator.compute_baseline("SPY", history_df)
+        first.ticker = "QQQ"
+        second = calculator.compute_baseline("SPY", history_df)
+        second.missing_data_pct = 50.0
+
+        assert calculator.compute_baseline("SPY", history_df).ticker == "SPY"
+        assert calculator.compute_baseline("SPY", history_df).missing_data_pct != 50.0
+
+    def test_memoization_can_be_disabled(self, history_df: pd.DataFrame):
+        """cache_size=0 should always recompute."""
+        calculator = BaselineCalculator(cache_size=0)
+
+        first = calculator.compute_baseline("SPY", history_df)
+        second = calculator.compute_baseline("SPY", history_df)
+
+        assert second is not first
+        assert second == first
+
+
+class TestBaselineStorage:
+    """Tests for baseline persistence."""
+
+    def test_round_trip(self, history_df: pd.DataFrame, tmp_path):
+        """A saved baseline should load back unchanged."""
+        baseline = BaselineCalculator().compute_baseline("SPY", history_df)
+        storage = BaselineStorage(tmp_path)
+
+        assert storage.save(baseline)
+        loaded = storage.load("spy")
+
+        assert loaded == baseline
+        assert storage.list_tickers() == ["SPY"]
+        assert storage.get_baseline_age("SPY") == (date.today() - baseline.baseline_date).days
+
+    def test_load_without_optional_fields(self, history_df: pd.DataFrame, tmp_path):
+        """Optional component fields absent from an older file should use defaults."""
+        storage = BaselineStorage(tmp_path)
+        storage.save(BaselineCalculator().compute_baseline("SPY", history_df))
+        path = tmp_path / "SPY.json"
+        data = json_io.loads(path.read_bytes())
+        del data["dark_pool"]["dark_volume"]
+        del data["greeks"]["vanna"]
+        path.write_bytes(json_io.dumps(data))
+
+        loaded = storage.load("SPY")
+
+        assert loaded.dark_pool.dark_volume is None
+        assert loaded.greeks.vanna is None
+        assert loaded.greeks.gex.n_observations == len(history_df)
+
+    def test_load_legacy_nan_file(self, history_df: pd.DataFrame, tmp_path):
+        """Files with bare NaN tokens from the stdlib writer should still load."""
+        storage = BaselineStorage(tmp_path)
+        storage.save(BaselineCalculator().compute_baseline("SPY", history_df))
+        path = tmp_path / "SPY.json"
+        data = json_io.loads(path.read_bytes())
+        data["greeks"]["gex"]["p95"] = math.nan
+        path.write_text(json.dumps(data, indent=2))
+
+        loaded = storage.load("SPY")
+
+        assert loaded is not None
+        assert math.isnan(loaded.greeks.gex.p95)
+        assert json_io.loads(json_io.dumps({"x": math.nan})) == {"x": None}
+
+    def test_baseline_age_without_header_date(self, history_df: pd.DataFrame, tmp_path):
+        """Age should still be read when baseline_date is not near the start."""
+        storage = BaselineStorage(tmp_path)
+        storage.save(BaselineCalculator().compute_baseline("SPY", history_df))
+        path = tmp_path / "SPY.json"
+        data = json_io.loads(path.read_bytes())
+        data["baseline_date"] = data.pop("baseline_date")  # move to the end
+        path.write_bytes(json_io.dumps(data))
+        baseline_date = storage.load("SPY").baseline_date
+
+        assert path.read_bytes().index(b'"baseline_date"') > 256
+        assert storage.get_baseline_age("SPY") == (date.today() - baseline_date).days
+
+    def test_baseline_age_of_truncated_file(self, history_df: pd.DataFrame, tmp_path):
+        """A truncated file should report no age, like load() reports no baseline."""
+        storage = BaselineStorage(tmp_path)
+        storage.save(BaselineCalculator().compute_baseline("SPY", history_df))
+        path = tmp_path / "SPY.json"
+        path.write_bytes(path.read_bytes()[:400])
+
+        assert storage.load("SPY") is None
+        assert storage.get_baseline_age("SPY") is None
+
+    def test_format_report(self, history_df: pd.DataFrame):
+        """The report should include optional IV sections only when present."""
+        baseline = BaselineCalculator().compute_baseline("SPY", history_df)
+        no_iv = replace(baseline, greeks=replace(baseline.greeks, iv_atm=None, iv_skew=None))
+
+        report = format_baseline_report(baseline)
+        lines = report.splitlines()
+
+        assert lines[1] == "BASELINE PROFILE: SPY"
+        assert lines[0] == lines[-1] == "=" * 60
+        assert "ATM Implied Volatility:" in report
+        assert "ATM Implied Volatility:" not in format_baseline_report(no_iv)
+        assert "IV Skew:" not in format_baseline_report(no_iv)
+
+    def test_arrow_table_round_trip(self, history_df: pd.DataFrame, tmp_path):
+        """Baselines should survive a Feather round trip through the Arrow table."""
+        spy = BaselineCalculator().compute_baseline("SPY", history_df)
+        qqq = replace(
+            BaselineCalculator().compute_baseline("QQQ", history_df.iloc[5:]),
+            greeks=replace(spy.greeks, iv_atm=None),
+        )
+        path = tmp_path / "baselines.feather"
+
+        TickerBaselineTable.from_baselines([spy, qqq]).write_feather(path)
+        table = TickerBaselineTable.read_feather(path)
+
+        assert table.tickers == ["SPY", "QQQ"]
+        assert "qqq" in table and "IWM" not in table
+        assert table.get("spy") == spy
+        assert table.get("QQQ") == qqq
+        assert table.get("IWM") is None
+        assert table.to_baselines() == [spy, qqq]
+        assert table.table.schema.field("greeks").type.field("policy").type == "uint8"
+
+    def test_arrow_table_mixed_case_ticker(self, history_df: pd.DataFrame):
+        """Lookups should be case-insensitive whatever case the ticker was stored in."""
+        baseline = BaselineCalculator().compute_baseline("Spy", history_df)
+
+        table = TickerBaselineTable.from_baselines([baseline])
+
+        assert table.tickers == ["Spy"]
+        assert "SPY" in table and "spy" in table
+        assert table.get("SPY") == baseline
+
+    def test_missing_baseline(self, tmp_path):
+        """Loading an unknown ticker should return None."""
+        storage = BaselineStorage(tmp_path)
+
+        assert storage.load("QQQ") is None
+        assert storage.get_baseline_age("QQQ") is None
+        assert not storage.exists("QQQ")
+
+
+class TestDynamicStateTable:
+    """Tests for the columnar DynamicState store."""
+
+    def test_round_trip(self):
+        """Records should survive from_records/to_records (at float32 precision)."""
+        states = [
+            DynamicState("SPY", date(2024, 1, 2), 63, gex_zscore=1.5, gex_sign=1),
+            DynamicState("QQQ", date(2024, 1, 2), 21, dex_zscore=-0.25, dex_sign=-1),
+        ]
+
+        table = DynamicStateTable.from_records(states)
+
+        assert len(table) == 2
+        assert table.columns["gex_zscore"].dtype == np.float32
+        assert table.columns["gex_sign"].dtype == np.int8
+        assert np.isnan(table.columns["gex_zscore"][1])
+        assert table.to_records() == states
+
+    def test_rejects_mixed_dates(self):
+        """A table holds a single trade date."""
+        states = [
+            DynamicState("SPY", date(2024, 1, 2), 63),
+            DynamicState("SPY", date(2024, 1, 3), 63),
+        ]
+        with pytest.raises(ValueError):
+            DynamicStateTable.from_records(states)
+
+    def test_states_are_slotted(self):
+        """DynamicState rows should not carry a per-instance dict."""
+        state = DynamicState("SPY", date(2024, 1, 2), 63)
+
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.unknown_field = 1.0
+
+
+class TestBaselineUpdatePolicy:
+    """Tests for compact policy codes."""
+
+    def test_codes_round_trip(self):
+        """Each policy should map to a fixed small code and back."""
+        assert BaselineUpdatePolicy.LOCKED.to_code() == 0
+        assert BaselineUpdatePolicy.DYNAMIC.to_code() == 1
+        for policy in BaselineUpdatePolicy:
+            assert BaselineUpdatePolicy.from_code(policy.to_code()) is policy
@@ -0,0 +1,133 @@
+"""
+Tests for configuration loading.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from obsidian.core import config as config_module
+from obsidian.core.config import (
+    RegimesConfig,
+    Settings,
+    SourcesConfig,
+    _load_yaml,
+    load_config,
+)
+from obsidian.core.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def sources_yaml(tmp_path: Path) -> Path:
+    """Minimal sources.yaml."""
+    path = tmp_path / "sources.yaml"
+    path.write_text("default_tickers:\n  - SPY\n  - QQQ\n")
+    return path
+
+
+class TestLoadYaml:
+    """Tests for the cached YAML loader."""
+
+    def test_parses_file(self, sources_yaml: Path):
+        """Config classes should read values from the parsed file."""
+        assert SourcesConfig(sources_yaml).default_tickers == ["SPY", "QQQ"]
+
+    def test_reuses_parse_until_file_changes(self, sources_yaml: Path):
+        """An unchanged file should not be re-parsed; an edited one should."""
+        first = _load_yaml(sources_yaml)
+        assert _load_yaml(sources_yaml) is first
+
+        sources_yaml.write_text("default_tickers:\n  - IWM\n")
+        os.utime(sources_yaml, ns=(0, 10**9))
+
+        assert _load_yaml(sources_yaml) == {"default_tickers": ["IWM"]}
+
+    def test_missing_file(self, tmp_path: Path):
+        """A missing config file should raise ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            RegimesConfig(tmp_path / "regimes.yaml")
+
+
+class TestSettings:
+    """Tests for application settings."""
+
+    def test_paths_absolute_and_derived(self, tmp_path: Path, monkeypatch):
+        """Relative dirs become absolute; derived dirs hang off data_dir."""
+        monkeypatch.chdir(tmp_path)
+        settings = Settings("uw", "poly", "fmp", data_dir="store", config_dir="config")
+
+        assert settings.data_dir == tmp_path / "store"
+        assert settings.config_dir == tmp_path / "config"
+        assert settings.raw_data_dir == tmp_path / "store" / "raw"
+        assert settings.processed_data_dir == tmp_path / "store" / "processed"
+        assert settings.baselines_dir == tmp_path / "store" / "baselines"
+
+    def test_from_env_prefers_environment_over_env_file(self, tmp_path: Path, monkeypatch):
+        """Environment variables win; the .env file fills the gaps."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("POLYGON_API_KEY=from-file\nFMP_API_KEY=from-file\nLOG_LEVEL=debug\n")
+        monkeypatch.setenv("UNUSUAL_WHALES_API_KEY", "from-env")
+        monkeypatch.setenv("FMP_API_KEY", "from-env")
+        monkeypatch.delenv("POLYGON_API_KEY", raising=False)
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+
+        settings = Settings.from_env(env_file)
+
+        assert settings.polygon_api_key == "from-file"
+        assert settings.fmp_api_key == "from-env"
+        assert settings.log_level == "DEBUG"
+
+    def test_from_env_missing_key(self, tmp_path: Path, monkeypatch):
+        """A missing API key should raise ConfigurationError naming it."""
+        monkeypatch.delenv("POLYGON_API_KEY", raising=False)
+
+        with pytest.raises(ConfigurationError, match="POLYGON_API_KEY"):
+            Settings.from_env(tmp_path / ".env")
+
+
+class TestRegimesConfig:
+    """Tests for regime configuration lookups."""
+
+    def test_lookups(self, tmp_path: Path):
+        """Known names resolve; unknown names raise ConfigurationError."""
+        path = tmp_path / "regimes.yaml"
+        path.write_text(
+            "thresholds:\n  gex_extreme_positive: 1.5\n"
+            "regimes:\n  neutral:\n    priority: 99\n"
+            "required_features:\n  - gex_zscore\n"
+        )
+        config = RegimesConfig(path)
+
+        assert config.get_threshold("gex_extreme_positive") == 1.5
+        assert config.get_regime("neutral") == {"priority": 99}
+        assert config.required_features == ("gex_zscore",)
+        with pytest.raises(ConfigurationError):
+            config.get_threshold("missing")
+        with pytest.raises(ConfigurationError):
+            config.get_regime("missing")
+
+
+class TestLoadConfig:
+    """Tests for the cached load_config."""
+
+    def test_reuses_config_until_file_changes(self, tmp_path: Path, monkeypatch):
+        """Repeat calls share one object; editing the file reloads it."""
+        (tmp_path / "sources.yaml").write_text("default_tickers:\n  - SPY\n")
+        settings = Settings("uw", "poly", "fmp", config_dir=tmp_path)
+        monkeypatch.setattr(config_module, "get_settings", lambda: settings)
+
+        first = load_config("sources")
+        assert load_config("sources") is first
+
+        (tmp_path / "sources.yaml").write_text("default_tickers:\n  - IWM\n")
+        os.utime(tmp_path / "sources.yaml", ns=(0, 10**9))
+
+        reloaded = load_config("sources")
+        assert reloaded is not first
+        assert reloaded.default_tickers == ["IWM"]
+
+    def test_unknown_type(self):
+        """Unknown config types should raise ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            load_config("nonexistent")
@@ -0,0 +1,44 @@
+"""
+Tests for custom exceptions.
+"""
+
+import pickle
+
+from obsidian.core.exceptions import (
+    DataFetchError,
+    InsufficientDataError,
+    RateLimitError,
+    ValidationError,
+)
+
+
+class TestExceptionFormatting:
+    """Tests for exception messages."""
+
+    def test_context_appended_when_present(self):
+        """Only the context that is set should appear in the message."""
+        assert str(DataFetchError("failed")) == "failed"
+        assert (
+            str(DataFetchError("failed", source="polygon", ticker="SPY", status_code=500))
+            == "failed | source=polygon | ticker=SPY | status=500"
+        )
+        assert str(ValidationError("bad", field="gex", value=1.5)) == "bad | field=gex | value=1.5"
+        assert (
+            str(InsufficientDataError("short", required=21, available=5, feature="gex"))
+            == "short | required=21, available=5, feature=gex"
+        )
+
+
+class TestExceptionPickling:
+    """Tests for passing exceptions between processes."""
+
+    def test_round_trip_keeps_context(self):
+        """Slotted context and constructor-specific args should survive pickling."""
+        error = pickle.loads(pickle.dumps(RateLimitError("polygon", retry_after=30)))
+
+        assert isinstance(error, RateLimitError)
+        assert error.retry_after == 30
+        assert str(error) == "Rate limit exceeded for polygon | source=polygon | status=429"
+
+        error = pickle.loads(pickle.dumps(InsufficientDataError("short", 21, 5)))
+        assert (error.required, error.available, error.feature) == (21, 5, None)
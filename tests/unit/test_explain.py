@@ -0,0 +1,92 @@
+"""
+Tests for explanation generation.
+"""
+
+from datetime import date
+
+import pytest
+
+from obsidian.core.types import (
+    RegimeLabel,
+    RegimeResult,
+    TopDriver,
+    UnusualnessLevel,
+    UnusualnessResult,
+)
+from obsidian.explain.generator import ExplanationGenerator
+
+
+@pytest.fixture
+def drivers() -> tuple[TopDriver, ...]:
+    """One elevated and one depressed driver."""
+    return (
+        TopDriver("gex", 1.234, 50.4, "elevated"),
+        TopDriver("dex", -0.5, 30.0, "depressed"),
+    )
+
+
+@pytest.fixture
+def regime_result(drivers: tuple[TopDriver, ...]) -> RegimeResult:
+    """Neutral regime result."""
+    return RegimeResult(
+        "SPY", date(2024, 1, 2), RegimeLabel.NEUTRAL, 0.513, "Regime text.", drivers
+    )
+
+
+@pytest.fixture
+def unusualness_result(drivers: tuple[TopDriver, ...]) -> UnusualnessResult:
+    """Slightly unusual score result."""
+    return UnusualnessResult(
+        "SPY", date(2024, 1, 2), 55.5, 1.2, UnusualnessLevel.SLIGHTLY_UNUSUAL,
+        "Score text.", (), drivers,
+    )
+
+
+class TestExplanationGenerator:
+    """Tests for ExplanationGenerator."""
+
+    def test_full_explanation(
+        self,
+        regime_result: RegimeResult,
+        unusualness_result: UnusualnessResult,
+    ):
+        """The full explanation should list summary sections and drivers."""
+        text = ExplanationGenerator().generate_full_explanation(regime_result, unusualness_result)
+
+        assert text == (
+            "=== SPY - 2024-01-02 ===\n"
+            "\n"
+            "UNUSUALNESS: 55.5/100 (Slightly Unusual)\n"
+            "Score text.\n"
+            "\n"
+            "REGIME: Neutral / Mixed\n"
+            "Confidence: 51%\n"
+            "Regime text.\n"
+            "\n"
+            "TOP DRIVERS:\n"
+            "  ↑ gex: +1.23σ (50% contribution)\n"
+            "  ↓ dex: -0.50σ (30% contribution)"
+        )
+
+    def test_short_summary(
+        self,
+        regime_result: RegimeResult,
+        unusualness_result: UnusualnessResult,
+    ):
+        """The short summary should name the top driver."""
+        text = ExplanationGenerator().generate_short_summary(regime_result, unusualness_result)
+
+        assert text == "SPY: Neutral / Mixed (score=55.5, top: gex +1.2σ)"
+
+    def test_regime_detail(self, regime_result: RegimeResult):
+        """Regime detail should format values and include the regime tables."""
+        detail = ExplanationGenerator().generate_regime_detail(regime_result)
+
+        assert detail["confidence"] == "51%"
+        assert detail["drivers"][0] == {
+            "feature": "gex",
+            "zscore": "+1.23σ",
+            "direction": "elevated",
+            "contribution": "50%",
+        }
+        assert len(detail["implications"]) == 3
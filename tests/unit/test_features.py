@@ -65,6 +65,72 @@ class TestDarkPoolFeatures:
 
         assert metrics.venue_shift == 5.0  # 45.0 - 40.0
 
+    def test_extract_many_matches_extract(
+        self,
+        extractor: DarkPoolFeatures,
+        sample_darkpool_df: pd.DataFrame,
+    ):
+        """Batched extraction should match per-frame extraction."""
+        frames = [
+            sample_darkpool_df,
+            pd.DataFrame(),
+            sample_darkpool_df.drop(columns="premium").iloc[:2],
+        ]
+
+        batched = extractor.extract_many(
+            frames, total_volumes=[100000, None, 50000], previous_ratios=[40.0, None, None]
+        )
+
+        assert batched == [
+            extractor.extract(frames[0], total_volume=100000, previous_ratio=40.0),
+            extractor.extract(frames[1]),
+            extractor.extract(frames[2], total_volume=50000),
+        ]
+
+    def test_venue_concentration(
+        self,
+        extractor: DarkPoolFeatures,
+        sample_darkpool_df: pd.DataFrame,
+    ):
+        """Venue shares should be percentages of total dark pool volume."""
+        shares = extractor.calculate_venue_concentration(sample_darkpool_df)
+
+        assert list(shares) == ["FADF", "XADF"]
+        assert shares["XADF"] == pytest.approx(20000 / 45000 * 100)
+        assert shares["FADF"] == pytest.approx(25000 / 45000 * 100)
+
+    def test_block_timing(
+        self,
+        extractor: DarkPoolFeatures,
+        sample_darkpool_df: pd.DataFrame,
+    ):
+        """Block volume should be bucketed by execution hour."""
+        timing = extractor.calculate_block_timing(sample_darkpool_df)
+
+        assert timing == {
+            "block_count": 2,
+            "total_block_volume": 40000,
+            "hourly_distribution": {11: 15000, 12: 25000},
+            "peak_hour": 12,
+        }
+
+
+    def test_block_timing_missing_timestamp(self, extractor: DarkPoolFeatures):
+        """Blocks without an execution time should be left out of the distribution."""
+        trades = pd.DataFrame({
+            "size": [15000, 20000, 12000],
+            "executed_at": ["2024-01-02T10:15:00", None, "2024-01-02T11:30:00"],
+        })
+
+        timing = extractor.calculate_block_timing(trades)
+
+        assert timing == {
+            "block_count": 3,
+            "total_block_volume": 47000,
+            "hourly_distribution": {10: 15000, 11: 12000},
+            "peak_hour": 10,
+        }
+
 
 class TestGreeksFeatures:
     """Tests for Greek exposure feature extraction."""
@@ -115,6 +181,35 @@ class TestGreeksFeatures:
 
         assert metrics.iv_skew == pytest.approx(0.05)  # 0.25 - 0.20
 
+    def test_alternate_iv_field_names(self, extractor: GreeksFeatures):
+        """Skew and term slope should fall back to alternate field names."""
+        iv_data = {"put_iv_25d": 0.30, "call_iv_25d": 0.25, "iv_1m": 0.30, "iv_7d": 0.20}
+
+        metrics = extractor.extract({"gex": 0, "dex": 0}, iv_data)
+
+        assert metrics.iv_skew == pytest.approx(0.05)
+        assert metrics.iv_term_slope == pytest.approx(0.10)
+
+    def test_empty_iv_field_falls_back(self, extractor: GreeksFeatures):
+        """An empty primary IV field should fall back to the alternate name."""
+        iv_data = {"iv_30d": "", "iv_1m": 0.30, "iv_7d": 0, "iv_1w": 0.20}
+
+        metrics = extractor.extract({"gex": 0, "dex": 0}, iv_data)
+
+        assert metrics.iv_term_slope == pytest.approx(0.10)
+
+    def test_parses_api_values(self, extractor: GreeksFeatures):
+        """Numeric strings should parse; invalid values fall back."""
+        greek_data = {"gex": "'1500.5'", "dex": 200, "vanna": {"bad": 1}, "charm": "n/a"}
+
+        metrics = extractor.extract(greek_data)
+
+        assert metrics.gex == 1500.5
+        assert metrics.dex == 200.0
+        assert isinstance(metrics.dex, float)
+        assert metrics.vanna is None
+        assert metrics.charm is None
+
 
 class TestPriceContextFeatures:
     """Tests for price context feature extraction."""
@@ -0,0 +1,334 @@
+"""
+Tests for feature history storage.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from obsidian.baseline.history import FeatureHistoryStorage, ParquetFeatureHistoryStorage
+
+
+@pytest.fixture(params=[FeatureHistoryStorage, ParquetFeatureHistoryStorage])
+def storage(request, tmp_path) -> FeatureHistoryStorage:
+    """Empty history storage for each backend."""
+    return request.param(tmp_path / "feature_history")
+
+
+def _features(i: int) -> dict:
+    return {"gex": 1e9 + i, "dark_pool_ratio": 40.0 + i, "vanna": None}
+
+
+class TestFeatureHistoryStorage:
+    """Tests shared by all feature history backends."""
+
+    def test_save_and_load(self, storage: FeatureHistoryStorage):
+        """Saved features should load back for the same date."""
+        assert storage.save("spy", date(2024, 1, 2), _features(0))
+
+        loaded = storage.load("SPY", date(2024, 1, 2))
+
+        assert loaded["gex"] == 1e9
+        assert loaded["dark_pool_ratio"] == 40.0
+        assert loaded["vanna"] is None
+        assert storage.load("SPY", date(2024, 1, 3)) is None
+
+    def test_list_dates_sorted(self, storage: FeatureHistoryStorage):
+        """Dates should be returned in ascending order regardless of save order."""
+        for d in (date(2024, 1, 4), date(2024, 1, 2), date(2024, 1, 3)):
+            storage.save("SPY", d, _features(d.day))
+
+        assert storage.list_dates("SPY") == [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+        assert storage.count_observations("SPY") == 3
+        assert storage.exists("SPY", date(2024, 1, 3))
+        assert not storage.exists("SPY", date(2024, 1, 5))
+        assert storage.list_dates("QQQ") == []
+
+    def test_save_overwrites_same_date(self, storage: FeatureHistoryStorage):
+        """Saving twice for one date should keep only the latest values."""
+        storage.save("SPY", date(2024, 1, 2), _features(0))
+        storage.save("SPY", date(2024, 1, 2), _features(5))
+
+        assert storage.count_observations("SPY") == 1
+        assert storage.load("SPY", date(2024, 1, 2))["gex"] == 1e9 + 5
+
+    def test_save_many(self, storage: FeatureHistoryStorage):
+        """A batch save should store every record, grouped across tickers."""
+        storage.save("SPY", date(2024, 1, 2), _features(0))
+        records = [
+            ("SPY", date(2024, 1, 3), _features(1)),
+            ("qqq", date(2024, 1, 2), _features(2)),
+            ("SPY", date(2024, 1, 2), _features(3)),
+            ("SPY", date(2024, 1, 2), _features(4)),
+        ]
+
+        assert storage.save_many(records) == 3
+
+        assert storage.list_dates("SPY") == [date(2024, 1, 2), date(2024, 1, 3)]
+        assert storage.load("SPY", date(2024, 1, 2))["gex"] == 1e9 + 4
+        assert storage.load("QQQ", date(2024, 1, 2))["gex"] == 1e9 + 2
+        assert storage.save_many([]) == 0
+
+    def test_load_dataframe_filters_range(self, storage: FeatureHistoryStorage):
+        """load_dataframe should return sorted rows within the date range."""
+        days = pd.bdate_range("2024-01-02", periods=10).date
+        for i, d in enumerate(days):
+            storage.save("SPY", d, _features(i))
+
+        df = storage.load_dataframe("SPY", start_date=days[2], end_date=days[6])
+
+        assert df["date"].tolist() == list(days[2:7])
+        assert df["gex"].tolist() == [1e9 + i for i in range(2, 7)]
+        assert (df["ticker"] == "SPY").all()
+        assert isinstance(df["ticker"].dtype, pd.CategoricalDtype)
+
+    def test_load_dataframe_min_days(self, storage: FeatureHistoryStorage):
+        """Too few stored days should raise when min_days is set."""
+        with pytest.raises(ValueError):
+            storage.load_dataframe("SPY", min_days=1)
+        assert storage.load_dataframe("SPY").empty
+
+        storage.save("SPY", date(2024, 1, 2), _features(0))
+        with pytest.raises(ValueError):
+            storage.load_dataframe("SPY", min_days=2)
+
+    def test_missing_dates_skip_weekends(self, storage: FeatureHistoryStorage):
+        """Missing dates should include only weekdays without data."""
+        storage.save("SPY", date(2024, 1, 3), _features(0))
+
+        missing = storage.get_missing_dates("SPY", date(2024, 1, 1), date(2024, 1, 8))
+
+        assert missing == [
+            date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 4),
+            date(2024, 1, 5), date(2024, 1, 8),
+        ]
+
+    def test_cleanup_old(self, storage: FeatureHistoryStorage):
+        """Entries older than keep_days should be removed."""
+        today = date.today()
+        storage.save("SPY", today - timedelta(days=400), _features(0))
+        storage.save("SPY", today - timedelta(days=10), _features(1))
+
+        assert storage.cleanup_old("SPY", keep_days=365) == 1
+        assert storage.list_dates("SPY") == [today - timedelta(days=10)]
+
+    def test_summary(self, storage: FeatureHistoryStorage):
+        """Summary should reflect stored range and feature availability."""
+        storage.save("SPY", date(2024, 1, 2), _features(0))
+        storage.save("SPY", date(2024, 1, 3), {**_features(1), "vanna": 5.0})
+
+        summary = storage.get_summary("SPY")
+
+        assert summary["observation_count"] == 2
+        assert summary["earliest_date"] == "2024-01-02"
+        assert summary["latest_date"] == "2024-01-03"
+        assert summary["has_vanna"] is True
+        assert summary["has_charm"] is False
+
+    def test_failed_save_keeps_previous_data(self, storage: FeatureHistoryStorage, monkeypatch):
+        """A write that fails before the rename should leave stored data intact."""
+        storage.save("SPY", date(2024, 1, 2), _features(0))
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail)
+        storage.save("SPY", date(2024, 1, 2), _features(5))
+        monkeypatch.undo()
+
+        assert storage.load("SPY", date(2024, 1, 2))["gex"] == 1e9
+        assert not list(storage.base_dir.rglob("*.tmp"))
+
+    def test_list_dates_cached_until_storage_changes(
+        self, storage: FeatureHistoryStorage, monkeypatch
+    ):
+        """Unchanged storage should be listed from cache; saves invalidate it."""
+        storage.save("SPY", date(2024, 1, 2), _features(0))
+        # Age the modification times past the settle window so they are cacheable
+        for path in storage.base_dir.rglob("*"):
+            os.utime(path, ns=(time.time_ns() - 10**10, time.time_ns() - 10**10))
+
+        scans = []
+        original = storage._scan_dates
+        monkeypatch.setattr(storage, "_scan_dates", lambda t: scans.append(t) or original(t))
+
+        assert storage.list_dates("SPY") == [date(2024, 1, 2)]
+        assert storage.list_dates("SPY") == [date(2024, 1, 2)]
+        assert storage.exists("SPY", date(2024, 1, 2))
+        assert not storage.exists("SPY", date(2024, 1, 3))
+        assert len(scans) == 1
+
+        storage.save("SPY", date(2024, 1, 3), _features(1))
+
+        assert storage.list_dates("SPY") == [date(2024, 1, 2), date(2024, 1, 3)]
+        assert len(scans) == 2
+
+    def test_list_dates_sees_other_writers(self, storage: FeatureHistoryStorage):
+        """Dates saved through another instance should be visible."""
+        other = type(storage)(storage.base_dir)
+        storage.save("SPY", date(2024, 1, 2), _features(0))
+        assert storage.list_dates("SPY") == [date(2024, 1, 2)]
+
+        other.save("SPY", date(2024, 1, 3), _features(1))
+
+        assert storage.list_dates("SPY") == [date(2024, 1, 2), date(2024, 1, 3)]
+
+
+class TestJsonFeatureHistory:
+    """Tests specific to the per-day JSON backend."""
+
+    def test_list_dates_ignores_unrelated_files(self, tmp_path):
+        """Only YYYY-MM-DD.json files should be treated as history entries."""
+        storage = FeatureHistoryStorage(tmp_path)
+        storage.save("SPY", date(2024, 1, 2), _features(0))
+        ticker_dir = tmp_path / "SPY"
+        for name in ("notes.json", "2024-13-01.json", "2024_01_03.json", "2024-01-04.txt"):
+            (ticker_dir / name).write_text("{}")
+
+        assert storage.list_dates("SPY") == [date(2024, 1, 2)]
+
+    def test_load_dataframe_long_range_in_order(self, tmp_path):
+        """Ranges loaded on the thread pool should keep date order."""
+        storage = FeatureHistoryStorage(tmp_path)
+        days = pd.bdate_range("2024-01-02", periods=60).date
+        storage.save_many([("SPY", d, _features(i)) for i, d in enumerate(days)])
+
+        df = storage.load_dataframe("SPY")
+
+        assert df["date"].tolist() == list(days)
+        assert df["gex"].tolist() == [1e9 + i for i in range(60)]
+
+    def test_files_sharded_by_year(self, tmp_path):
+        """Snapshots should be stored in one directory per year."""
+        storage = FeatureHistoryStorage(tmp_path)
+        storage.save("SPY", date(2023, 12, 29), _features(0))
+        storage.save("SPY", date(2024, 1, 2), _features(1))
+
+        assert (tmp_path / "SPY" / "2023" / "2023-12-29.json").exists()
+        assert (tmp_path / "SPY" / "2024" / "2024-01-02.json").exists()
+        assert storage.list_dates("SPY") == [date(2023, 12, 29), date(2024, 1, 2)]
+
+    def test_flat_layout_migrated(self, tmp_path):
+        """Files in the old flat layout should be readable and moved on first write."""
+        FeatureHistoryStorage(tmp_path).save("SPY", date(2024, 1, 2), _features(0))
+        ticker_dir = tmp_path / "SPY"
+        (ticker_dir / "2024" / "2024-01-02.json").rename(ticker_dir / "2024-01-02.json")
+
+        storage = FeatureHistoryStorage(tmp_path)
+        assert storage.list_dates("SPY") == [date(2024, 1, 2)]
+        assert storage.load("SPY", date(2024, 1, 2))["gex"] == 1e9
+
+        storage.save("SPY", date(2024, 1, 3), _features(1))
+
+        assert not (ticker_dir / "2024-01-02.json").exists()
+        assert (ticker_dir / "2024" / "2024-01-02.json").exists()
+        assert storage.list_dates("SPY") == [date(2024, 1, 2), date(2024, 1, 3)]
+
+    def test_cleanup_removes_old_year_dirs(self, tmp_path):
+        """Years entirely before the cutoff should be removed as directories."""
+        storage = FeatureHistoryStorage(tmp_path)
+        recent = date.today() - timedelta(days=10)
+        storage.save_many([
+            ("SPY", date(2020, 3, 2), _features(0)),
+            ("SPY", date(2020, 3, 3), _features(1)),
+            ("SPY", recent, _features(2)),
+        ])
+
+        assert storage.cleanup_old("SPY", keep_days=365) == 2
+        assert not (tmp_path / "SPY" / "2020").exists()
+        assert storage.list_dates("SPY") == [recent]
+
+    def test_reads_do_not_create_ticker_dirs(self, tmp_path):
+        """Looking up an unknown ticker should leave the filesystem untouched."""
+        storage = FeatureHistoryStorage(tmp_path)
+
+        assert storage.list_dates("QQQ") == []
+        assert storage.load("QQQ", date(2024, 1, 2)) is None
+        assert not storage.exists("QQQ", date(2024, 1, 2))
+        assert not (tmp_path / "QQQ").exists()
+
+    def test_summary_uses_manifest(self, tmp_path, monkeypatch):
+        """A current manifest should answer get_summary without reading snapshots."""
+        storage = FeatureHistoryStorage(tmp_path)
+        storage.save("SPY", date(2024, 1, 3), {**_features(1), "vanna": 5.0})
+        storage.save("SPY", date(2024, 1, 2), _features(0))  # backfill keeps 01-03
+        monkeypatch.setattr(storage, "load", lambda *a: pytest.fail("snapshot read"))
+
+        summary = storage.get_summary("SPY")
+
+        assert summary["latest_date"] == "2024-01-03"
+        assert summary["available_features"] == ["gex", "dark_pool_ratio", "vanna"]
+        assert summary["has_vanna"] is True
+        assert summary["has_charm"] is False
+
+    def test_summary_ignores_stale_manifest(self, tmp_path):
+        """If the manifest's date is not the latest stored, read the snapshot."""
+        storage = FeatureHistoryStorage(tmp_path)
+        storage.save("SPY", date(2024, 1, 2), {**_features(0), "vanna": 5.0})
+        (tmp_path / "SPY" / "2024" / "2024-01-03.json").write_bytes(
+            (tmp_path / "SPY" / "2024" / "2024-01-02.json").read_bytes().replace(b"5.0", b"null")
+        )
+
+        summary = storage.get_summary("SPY")
+
+        assert summary["latest_date"] == "2024-01-03"
+        assert summary["has_vanna"] is False
+
+    def test_load_dataframe_columns(self, tmp_path):
+        """Features missing on some days should become NaN float columns."""
+        storage = FeatureHistoryStorage(tmp_path)
+        storage.save("SPY", date(2024, 1, 3), {"gex": 2.0, "block_trade_count": 7})
+        storage.save("SPY", date(2024, 1, 2), {"gex": 1.0, "vanna": None})
+
+        df = storage.load_dataframe("SPY")
+
+        assert df["date"].tolist() == [date(2024, 1, 2), date(2024, 1, 3)]
+        assert df["gex"].dtype == "float64"
+        assert df["gex"].tolist() == [1.0, 2.0]
+        assert df["vanna"].isna().all()
+        assert df["block_trade_count"].isna().tolist() == [True, False]
+        assert df["ticker"].tolist() == ["SPY", "SPY"]
+
+
+def test_parquet_history_is_zstd_compressed(tmp_path):
+    """Parquet history files should be written with zstd compression."""
+    import pyarrow.parquet as pq
+
+    storage = ParquetFeatureHistoryStorage(tmp_path)
+    storage.save("SPY", date(2024, 1, 2), _features(0))
+
+    metadata = pq.ParquetFile(tmp_path / "SPY.parquet").metadata
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_parquet_history_logs_non_numeric_values(tmp_path, caplog):
+    """Non-numeric features should be stored as missing and logged, not dropped silently."""
+    storage = ParquetFeatureHistoryStorage(tmp_path)
+
+    assert storage.save("SPY", date(2024, 1, 2), {"gex": 1.0, "regime": "neutral"})
+
+    assert storage.load("SPY", date(2024, 1, 2)) == {"gex": 1.0, "regime": None}
+    assert "regime" in caplog.text
+
+
+def test_import_does_not_load_pandas():
+    """Storage-only tools should not pay for importing pandas."""
+    code = (
+        "import sys; import obsidian.baseline.history; "
+        "assert 'pandas' not in sys.modules, 'pandas imported'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env=os.environ)
+
+
+def test_import_does_not_load_pyarrow():
+    """Importing the baseline package should not import pyarrow."""
+    code = (
+        "import sys; import obsidian.baseline; "
+        "assert 'pyarrow' not in sys.modules, 'pyarrow imported'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env=os.environ)
@@ -2,11 +2,12 @@
 Tests for regime classification.
 """
 
+import numpy as np
 import pytest
 import pandas as pd
 
-from obsidian.core.types import RegimeLabel
-from obsidian.regimes.classifier import RegimeClassifier
+from obsidian.core.types import RegimeLabel, RegimeLabelInt
+from obsidian.regimes.classifier import REGIME_LABELS, RegimeClassifier, classify_labels
 
 
 @pytest.fixture
@@ -168,3 +169,44 @@ class TestTopDrivers:
         # First driver should have highest magnitude
         magnitudes = [abs(d.zscore) for d in result.top_drivers]
         assert magnitudes == sorted(magnitudes, reverse=True)
+
+
+class TestClassifyLabels:
+    """Tests for vectorized classification."""
+
+    def test_matches_scalar_classifier(self, classifier: RegimeClassifier):
+        """Every row should get the label classify() gives it."""
+        rng = np.random.default_rng(7)
+        n = 500
+        frame = pd.DataFrame({
+            "gex_zscore": rng.choice([-2.0, -1.5, 0.0, 1.5, 2.0], n),
+            "dex_zscore": rng.choice([-1.5, -1.0, 0.0, 1.0, 1.5, np.nan], n),
+            "dark_pool_ratio_pct": rng.choice([40.0, 50.0, 55.0, 60.0, 70.0, 80.0], n),
+            "block_trade_count_zscore": rng.choice([0.0, 1.0, 1.5], n),
+            "price_change_pct": rng.choice([-1.0, -0.5, 0.0, 0.5, 1.0], n),
+            "price_efficiency_pct": rng.choice([30.0, 50.0, 70.0], n),
+            "impact_per_vol_pct": rng.choice([30.0, 50.0, 70.0], n),
+        })
+
+        codes = classify_labels(frame)
+
+        expected = [classifier.classify(row).label for _, row in frame.iterrows()]
+        assert [REGIME_LABELS[c] for c in codes] == expected
+
+    def test_codes_map_one_to_one(self):
+        """RegimeLabelInt codes should round-trip with RegimeLabel."""
+        assert [c.name for c in RegimeLabelInt] == [label.name for label in RegimeLabel]
+        for label in RegimeLabel:
+            assert label.code.label is label
+            assert REGIME_LABELS[label.code] is label
+
+    def test_missing_columns_use_defaults(self):
+        """Absent optional columns fall back; absent required ones are UNDETERMINED."""
+        frame = pd.DataFrame({"gex_zscore": [2.0], "dex_zscore": [0.0], "dark_pool_ratio": [40.0]})
+        assert REGIME_LABELS[classify_labels(frame)[0]] == RegimeLabel.NEUTRAL
+
+        frame["price_efficiency_pct"] = 30.0
+        assert REGIME_LABELS[classify_labels(frame)[0]] == RegimeLabel.GAMMA_POSITIVE_CONTROL
+
+        frame = frame.drop(columns="dex_zscore")
+        assert REGIME_LABELS[classify_labels(frame)[0]] == RegimeLabel.UNDETERMINED
@@ -2,11 +2,13 @@
 Tests for unusualness scoring.
 """
 
+import numpy as np
 import pytest
 import pandas as pd
 
+from obsidian.core.constants import SCORE_FEATURES, SCORE_WEIGHTS
 from obsidian.core.types import UnusualnessLevel
-from obsidian.scoring.unusualness import UnusualnessEngine
+from obsidian.scoring.unusualness import UnusualnessEngine, compute_raw_scores
 
 
 @pytest.fixture
@@ -106,6 +108,18 @@ class TestScoreLevels:
         """Very high scores should be 'Highly Unusual'."""
         assert UnusualnessLevel.from_score(90) == UnusualnessLevel.HIGHLY_UNUSUAL
 
+    def test_bounds_belong_to_higher_level(self):
+        """A score on a level boundary should map to the level above it."""
+        assert UnusualnessLevel.from_score(20) == UnusualnessLevel.NORMAL
+        assert UnusualnessLevel.from_score(19.9) == UnusualnessLevel.VERY_NORMAL
+        assert UnusualnessLevel.from_score(80) == UnusualnessLevel.HIGHLY_UNUSUAL
+
+    def test_from_scores_matches_from_score(self):
+        """The vectorized conversion should agree with the scalar one."""
+        scores = np.array([0.0, 19.9, 20.0, 39.9, 40.0, 60.0, 79.9, 80.0, 100.0, np.nan])
+        levels = UnusualnessLevel.from_scores(scores)
+        assert list(levels) == [UnusualnessLevel.from_score(s) for s in scores]
+
 
 class TestPercentileRanking:
     """Tests for percentile-based scoring with history."""
@@ -193,3 +207,29 @@ class TestExplanation:
         assert result.explanation
         assert "score" in result.explanation.lower()
         assert "driver" in result.explanation.lower()
+
+
+class TestBatchRawScores:
+    """Tests for vectorized raw scores."""
+
+    def test_matches_engine(self, engine: UnusualnessEngine, sample_features: pd.Series):
+        """Row scores should equal the engine's raw score for the same z-scores."""
+        row = sample_features[SCORE_FEATURES].to_numpy(dtype=float)
+        matrix = np.vstack([row, -row, np.full(len(SCORE_FEATURES), np.nan)])
+
+        scores = compute_raw_scores(matrix)
+
+        expected = engine.calculate(sample_features).raw_score
+        assert scores[0] == pytest.approx(expected, abs=1e-4)
+        assert scores[1] == pytest.approx(expected, abs=1e-4)
+        assert scores[2] == 0.0
+
+    def test_rejects_wrong_width(self):
+        """A matrix without one column per score feature should be rejected."""
+        with pytest.raises(ValueError):
+            compute_raw_scores(np.zeros((2, 3)))
+
+    def test_weights_are_read_only(self):
+        """The shared weight table should reject modification."""
+        with pytest.raises(TypeError):
+            SCORE_WEIGHTS["gamma_exposure"] = 1.0
@@ -0,0 +1,194 @@
+"""
+Tests for core result types.
+"""
+
+import math
+from datetime import date
+
+import numpy as np
+import pytest
+
+from obsidian.core.types import (
+    FeatureSet,
+    FeatureSetBatch,
+    RegimeLabel,
+    RegimeResult,
+    ScoreComponent,
+    TopDriver,
+    UnusualnessLevel,
+    UnusualnessResult,
+)
+
+
+class TestToDict:
+    """Tests for result serialization."""
+
+    def test_regime_result(self):
+        """Values should be formatted and rounded per field."""
+        driver = TopDriver("gex", 1.23456, 40.04, "elevated")
+        result = RegimeResult(
+            "SPY", date(2024, 1, 2), RegimeLabel.NEUTRAL, 0.51234, "text", (driver,)
+        )
+
+        assert result.to_dict() == {
+            "ticker": "SPY",
+            "date": "2024-01-02",
+            "regime": "Neutral / Mixed",
+            "confidence": 0.512,
+            "explanation": "text",
+            "top_drivers": [
+                {"feature": "gex", "zscore": 1.23, "contribution_pct": 40.0, "direction": "elevated"}
+            ],
+        }
+
+    def test_unusualness_result(self):
+        """Components and drivers should be serialized in order."""
+        result = UnusualnessResult(
+            "SPY", date(2024, 1, 2), 55.55, 1.23456, UnusualnessLevel.SLIGHTLY_UNUSUAL, "text",
+            (ScoreComponent("gamma_exposure", 0.25, 1.2345, 0.30863),),
+            (TopDriver("gamma_exposure", 1.2345, 100.0, "above"),),
+        )
+
+        data = result.to_dict()
+
+        assert list(data) == [
+            "ticker", "date", "score", "raw_score", "level", "explanation",
+            "components", "top_drivers",
+        ]
+        assert data["raw_score"] == 1.2346
+        assert data["level"] == "Slightly Unusual"
+        assert data["components"] == [
+            {"name": "gamma_exposure", "weight": 0.25, "zscore": 1.23, "contribution": 0.3086}
+        ]
+        assert data["top_drivers"] == [
+            {"feature": "gamma_exposure", "zscore": 1.23, "direction": "above"}
+        ]
+
+    def test_feature_set(self):
+        """Unset features should serialize as None."""
+        data = FeatureSet("SPY", date(2024, 1, 2), gex=1.5, normalized={"gex_zscore": 0.2}).to_dict()
+
+        assert data["date"] == "2024-01-02"
+        assert data["gex"] == 1.5
+        assert data["dex"] is None
+        assert data["normalized"] == {"gex_zscore": 0.2}
+
+
+class TestResultEquality:
+    """Tests for result value equality."""
+
+    def test_results_with_equal_drivers_compare_equal(self):
+        """Results built from separate but equal drivers and components should be equal."""
+        def build() -> UnusualnessResult:
+            return UnusualnessResult(
+                "SPY", date(2024, 1, 2), 55.5, 1.2, UnusualnessLevel.SLIGHTLY_UNUSUAL, "text",
+                (ScoreComponent("gamma_exposure", 0.25, 1.2, 0.3),),
+                (TopDriver("gamma_exposure", 1.2, 100.0, "above"),),
+            )
+
+        assert build() == build()
+        assert hash(TopDriver("gex", 1.0, 50.0, "elevated")) == hash(
+            TopDriver("gex", 1.0, 50.0, "elevated")
+        )
+
+
+class TestBatchToRecords:
+    """Tests for columnar UnusualnessResult export."""
+
+    def test_columns(self):
+        """Scalars and component values should land in aligned columns."""
+        results = [
+            UnusualnessResult(
+                ticker, date(2024, 1, 2), score, 1.0, UnusualnessLevel.from_score(score), "",
+                (ScoreComponent("gamma_exposure", 0.25, z, 0.25 * abs(z)),), (),
+            )
+            for ticker, score, z in (("SPY", 10.0, 0.5), ("QQQ", 90.0, -2.0))
+        ]
+
+        records = UnusualnessResult.batch_to_records(results)
+
+        assert list(records["ticker"]) == ["SPY", "QQQ"]
+        assert records["date"].dtype == np.dtype("datetime64[D]")
+        assert list(records["score"]) == [10.0, 90.0]
+        assert list(records["level"]) == ["Very Normal", "Highly Unusual"]
+        assert list(records["gamma_exposure_zscore"]) == [0.5, -2.0]
+        assert list(records["gamma_exposure_contribution"]) == [0.125, 0.5]
+
+class TestToSeries:
+    """Tests for FeatureSet.to_series."""
+
+    def test_raw_and_normalized_values(self):
+        """Raw context features come first; missing values become NaN."""
+        series = FeatureSet(
+            "SPY", date(2024, 1, 2), price_change_pct=0.5, normalized={"gex_zscore": 1.2}
+        ).to_series()
+
+        assert list(series.index) == ["dark_pool_ratio_pct", "price_change_pct", "gex_zscore"]
+        assert series.dtype == "float64"
+        assert math.isnan(series["dark_pool_ratio_pct"])
+        assert series["gex_zscore"] == 1.2
+
+    def test_normalized_overrides_raw(self):
+        """A normalized value should replace the raw one of the same name."""
+        series = FeatureSet(
+            "SPY", date(2024, 1, 2), dark_pool_ratio=45.0,
+            normalized={"dark_pool_ratio_pct": 80.0, "gex_zscore": 1.2},
+        ).to_series()
+
+        assert list(series.index) == ["dark_pool_ratio_pct", "price_change_pct", "gex_zscore"]
+        assert series["dark_pool_ratio_pct"] == 80.0
+
+    def test_slotted(self):
+        """FeatureSet should reject attributes that are not declared fields."""
+        features = FeatureSet("SPY", date(2024, 1, 2))
+
+        assert not hasattr(features, "__dict__")
+        with pytest.raises(AttributeError):
+            features.unknown_feature = 1.0
+
+
+class TestFeatureSetBatch:
+    """Tests for the columnar FeatureSet batch."""
+
+    def test_columns_and_row_round_trip(self):
+        """Rows should rebuild the original FeatureSets."""
+        feature_sets = [
+            FeatureSet("SPY", date(2024, 1, 2), gex=1.5, block_trade_count=12,
+                       normalized={"gex_zscore": 0.2}),
+            FeatureSet("QQQ", date(2024, 1, 2), dex=-2.0,
+                       normalized={"dex_zscore": -1.1}),
+        ]
+
+        batch = FeatureSetBatch.from_list(feature_sets)
+
+        assert len(batch) == 2
+        assert batch.columns["gex"].flags.c_contiguous
+        assert batch.columns["gex"][0] == 1.5
+        assert math.isnan(batch.columns["gex"][1])
+        assert math.isnan(batch.normalized["gex_zscore"][1])
+        assert batch.normalized["gex_zscore"].dtype == np.float32
+        rows = [batch.row(i) for i in range(2)]
+        for row, original in zip(rows, feature_sets, strict=True):
+            assert row.normalized == pytest.approx(original.normalized, rel=1e-6)
+            row.normalized = original.normalized
+        assert rows == feature_sets
+        assert isinstance(rows[0].block_trade_count, int)
+
+    def test_empty(self):
+        """An empty list should give an empty batch."""
+        batch = FeatureSetBatch.from_list([])
+
+        assert len(batch) == 0
+        assert len(batch.columns["gex"]) == 0
+
+
+class TestRegimeLabel:
+    """Tests for regime label metadata."""
+
+    def test_priority_order(self):
+        """Rule regimes come first, in definition order; fallbacks last."""
+        priorities = [label.priority for label in RegimeLabel]
+
+        assert priorities == sorted(priorities)
+        assert RegimeLabel.GAMMA_POSITIVE_CONTROL.priority == 1
+        assert RegimeLabel.UNDETERMINED.priority == 100